@@ -0,0 +1,86 @@
+"""Benchmark: Async-Transport QUEUE gegen RING_BUFFER bei 1, 8 und 32 Threads
+
+Jeder Thread loggt seinen Anteil der Einträge; gemessen werden die Zeit
+der Producer (bis alle Threads fertig sind) und die Gesamtzeit inklusive
+flush(). Queue und Ring-Buffer sind so groß, dass nichts verworfen wird;
+Caller-Info ist aus, damit nur der Transport zählt.
+
+    python benchmarks/bench_async_transport.py [einträge]   # Standard: 200.000
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from logger.logger import (  # noqa: E402
+    EnhancedLogger, AsyncTransport, Category, LogLevel, OverflowPolicy,
+)
+
+
+class CountingHandler:
+    def __init__(self):
+        self.count = 0
+    
+    def handle(self, entry):
+        self.count += 1
+    
+    def handle_batch(self, entries):
+        self.count += len(entries)
+
+
+def run(transport: AsyncTransport, threads: int, total: int):
+    EnhancedLogger.initialize(
+        console=False,
+        async_mode=True,
+        async_transport=transport,
+        async_queue_size=total,
+        async_overflow=OverflowPolicy.DROP_NEWEST,
+        collect_metrics=False,
+    )
+    EnhancedLogger.configure_caller_info(enabled=False)
+    handler = CountingHandler()
+    EnhancedLogger.add_handler(handler)
+    
+    per_thread = total // threads
+    barrier = threading.Barrier(threads + 1)
+    
+    def produce():
+        info = EnhancedLogger.info
+        system = Category.SYSTEM
+        barrier.wait()
+        for i in range(per_thread):
+            info(system, "tick")
+    
+    workers = [threading.Thread(target=produce) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    produced = time.perf_counter() - start
+    EnhancedLogger.flush()
+    elapsed = time.perf_counter() - start
+    
+    delivered = handler.count
+    EnhancedLogger.configure_caller_info(enabled=True)
+    EnhancedLogger.shutdown()
+    assert delivered == per_thread * threads, f"{delivered} von {per_thread * threads} zugestellt"
+    return produced, elapsed
+
+
+def main(total: int = 200_000):
+    print(f"{total:,} Einträge, Zeiten in s (Producer / gesamt)")
+    print(f"{'Threads':>7}  {'QUEUE':>15}  {'RING_BUFFER':>15}  Producer-Speedup")
+    for threads in (1, 8, 32):
+        queue_p, queue_t = run(AsyncTransport.QUEUE, threads, total)
+        ring_p, ring_t = run(AsyncTransport.RING_BUFFER, threads, total)
+        print(f"{threads:>7}  {queue_p:6.2f} / {queue_t:6.2f}  {ring_p:6.2f} / {ring_t:6.2f}"
+              f"  {queue_p / ring_p:5.2f}x")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
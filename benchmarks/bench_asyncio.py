@@ -0,0 +1,73 @@
+"""Benchmark: asyncio-Modus gegen den früheren run_in_executor-Pfad
+
+10.000 gleichzeitige Tasks loggen je einen Eintrag in einen FileHandler.
+Der frühere Pfad schickte jeden Aufruf per run_in_executor in den
+Default-Threadpool; der asyncio-Modus (enable_asyncio) legt Einträge in
+einen loop-gebundenen Puffer, den eine Drain-Task gebündelt schreibt.
+Gemessen wird bis einschließlich flush; beide Dateien müssen alle
+Einträge enthalten.
+
+    python benchmarks/bench_asyncio.py [tasks]
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from logger.logger import EnhancedLogger, Category, FileHandler, LogLevel  # noqa: E402
+
+
+async def legacy_async_info(category, message: str):
+    """async_info() vor der Überarbeitung: ein Executor-Job pro Aufruf"""
+    await asyncio.get_event_loop().run_in_executor(
+        None, EnhancedLogger._log, LogLevel.INFO, category, message
+    )
+
+
+async def worker(log, i: int):
+    await log(Category.SYSTEM, f"task {i} done")
+
+
+async def run(tasks: int, path: Path, native: bool) -> float:
+    EnhancedLogger.initialize(console=False)
+    EnhancedLogger.configure_caller_info(enabled=False)
+    EnhancedLogger.add_handler(FileHandler(path, max_size=1 << 40, flush_lines=1000))
+    if native:
+        EnhancedLogger.enable_asyncio(queue_size=tasks)
+        log = EnhancedLogger.async_info
+    else:
+        log = legacy_async_info
+    
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(log, i) for i in range(tasks)))
+    await EnhancedLogger.async_flush()
+    elapsed = time.perf_counter() - start
+    
+    EnhancedLogger.disable_asyncio()
+    EnhancedLogger.configure_caller_info(enabled=True)
+    EnhancedLogger.shutdown()
+    return elapsed
+
+
+def main(tasks: int = 10_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {}
+        for name, native in (("run_in_executor", False), ("asyncio-Modus", True)):
+            path = Path(tmp) / f'{name}.log'
+            results[name] = asyncio.run(run(tasks, path, native))
+            lines = path.read_text(encoding='utf-8').count('\n')
+            assert lines == tasks, f"{name}: {lines} von {tasks} Einträgen geschrieben"
+    
+    legacy = results["run_in_executor"]
+    print(f"{tasks:,} gleichzeitige Tasks")
+    for name, elapsed in results.items():
+        print(f"{name:16s} {elapsed * 1000:8.1f} ms  {elapsed / tasks * 1e6:6.1f} µs/Eintrag  "
+              f"({legacy / elapsed:.1f}x)")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
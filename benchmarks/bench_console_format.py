@@ -0,0 +1,84 @@
+"""Benchmark: ConsoleHandler-Formatierung gegen die frühere f-String-Version
+
+Die frühere Version baute pro Eintrag alle Farb-Präfixe neu, löste die
+Kategorie-Farbe über Category(category) auf und rief strftime() auf.
+Verglichen wird die reine Formatierung (ohne Ausgabe) mit und ohne
+Farben, für eine Standard- und eine eigene Kategorie; die Ausgaben
+müssen identisch sein.
+
+    python benchmarks/bench_console_format.py
+"""
+
+import sys
+import time
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from logger.logger import (  # noqa: E402
+    COLORAMA_AVAILABLE, CategoryColors, ConsoleHandler, LevelColors, LogEntry, LogLevel,
+)
+
+if COLORAMA_AVAILABLE:
+    from colorama import Fore, Style
+else:
+    sys.exit("colorama wird für den Vergleich der farbigen Ausgabe benötigt")
+
+
+def legacy_format(entry: LogEntry) -> str:
+    """ConsoleHandler._format_entry() vor der Überarbeitung"""
+    level_color = LevelColors.get_color(entry.level)
+    category_color = CategoryColors.get_color(entry.category)
+    msg_color = Fore.RED if entry.level >= LogLevel.ERROR else Fore.WHITE
+    
+    timestamp = f"{Style.DIM}[{entry.timestamp.strftime('%Y-%m-%d %H:%M:%S')}]{Style.RESET_ALL}"
+    level = f"{level_color}{Style.BRIGHT}[{entry.level.name:<10}]{Style.RESET_ALL}"
+    category = f"{category_color}[{entry.category}]{Style.RESET_ALL}"
+    message = f"{msg_color}{entry.message}{Style.RESET_ALL}"
+    
+    parts = [timestamp, level, category]
+    if entry.context:
+        parts.append(f"{Style.DIM}({' > '.join(entry.context)}){Style.RESET_ALL}")
+    if entry.trace_id:
+        parts.append(f"{Style.DIM}[trace:{entry.trace_id[:8]}]{Style.RESET_ALL}")
+    parts.append(message)
+    return " ".join(parts)
+
+
+def legacy_format_plain(entry: LogEntry) -> str:
+    """ConsoleHandler._format_plain() vor der Überarbeitung"""
+    timestamp = entry.timestamp.strftime('%Y-%m-%d %H:%M:%S')
+    parts = [f"[{timestamp}]", f"[{entry.level.name}]", f"[{entry.category}]"]
+    if entry.context:
+        parts.append(f"({' > '.join(entry.context)})")
+    parts.append(entry.message)
+    return " ".join(parts)
+
+
+def best_of(func, number: int, repeat: int = 7) -> float:
+    """Bester Durchlauf in µs pro Aufruf"""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+
+def main(number: int = 100_000):
+    colored = ConsoleHandler(colorize=True)
+    plain = ConsoleHandler(colorize=False)
+    
+    print(f"{'':26s} {'legacy':>8s} {'aktuell':>8s}  µs/Zeile")
+    for category in ('API', 'PAYMENTS_EU'):
+        entry = LogEntry(time.time(), LogLevel.INFO, category, 'Request processed successfully')
+        entry.timestamp  # datetime-Erzeugung teilen sich beide Varianten
+        
+        for name, legacy, current in (
+            ("farbig", legacy_format, colored._format_entry),
+            ("ohne Farben", legacy_format_plain, plain._format_entry),
+        ):
+            assert legacy(entry) == current(entry), f"Ausgaben unterscheiden sich ({name})"
+            old = best_of(lambda: legacy(entry), number)
+            new = best_of(lambda: current(entry), number)
+            print(f"{name + ' / ' + category:26s} {old:8.2f} {new:8.2f}  ({old / new:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""Benchmark: FileHandler-Durchsatz gegen die frühere open-pro-Zeile-Version
+
+Die frühere Version prüfte pro Eintrag exists()/stat() und öffnete die
+Datei neu. Verglichen wird mit dem persistenten, gepufferten Stream bei
+verschiedenen Flush-Policies; alle Varianten müssen byte-identische
+Dateien erzeugen.
+
+    python benchmarks/bench_file_handler.py [zeilen]   # Standard: 1.000.000
+"""
+
+import hashlib
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from logger.logger import FileHandler, LogEntry, LogLevel  # noqa: E402
+
+
+class LegacyFileHandler:
+    """FileHandler.handle() vor der Überarbeitung (ohne Rotation)"""
+    
+    def __init__(self, filepath: Path, max_size: int = 10 * 1024 * 1024 * 1024):
+        self.filepath = Path(filepath)
+        self.max_size = max_size
+        self._lock = threading.Lock()
+    
+    def handle(self, entry: LogEntry) -> None:
+        with self._lock:
+            if self.filepath.exists() and self.filepath.stat().st_size > self.max_size:
+                raise RuntimeError("Rotation nicht Teil des Benchmarks")
+            line = self._format_entry(entry) + "\n"
+            self.filepath.open('a', encoding='utf-8').write(line)
+    
+    def _format_entry(self, entry: LogEntry) -> str:
+        timestamp = entry.timestamp.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
+        return f"[{timestamp}] [{entry.level.name}] [{entry.category}] {entry.message}"
+
+
+def make_entries(count: int = 1000):
+    base = time.time()
+    entries = [
+        LogEntry(base + i * 0.001, LogLevel.INFO, 'API', f'Request {i} processed in {i % 97} ms')
+        for i in range(count)
+    ]
+    for entry in entries:
+        entry.timestamp  # datetime-Erzeugung ist nicht Teil der Messung
+    return entries
+
+
+def run(handler, entries, lines: int, batch: int = 0) -> float:
+    pool = len(entries)
+    start = time.perf_counter()
+    if batch:
+        for offset in range(0, lines, batch):
+            chunk = [entries[(offset + i) % pool] for i in range(min(batch, lines - offset))]
+            handler.handle_batch(chunk)
+    else:
+        handle = handler.handle
+        for i in range(lines):
+            handle(entries[i % pool])
+    close = getattr(handler, 'close', None)
+    if close is not None:
+        close()
+    return time.perf_counter() - start
+
+
+def digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def main(lines: int = 1_000_000):
+    entries = make_entries()
+    variants = [
+        ("legacy (open pro Zeile)", lambda p: LegacyFileHandler(p), 0),
+        ("flush_lines=1", lambda p: FileHandler(p, max_size=1 << 40, flush_lines=1), 0),
+        ("flush_lines=1000", lambda p: FileHandler(p, max_size=1 << 40, flush_lines=1000), 0),
+        ("flush_interval_ms=100", lambda p: FileHandler(
+            p, max_size=1 << 40, flush_lines=1 << 30, flush_interval_ms=100), 0),
+        ("handle_batch(256)", lambda p: FileHandler(p, max_size=1 << 40), 256),
+    ]
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        results = []
+        for index, (name, factory, batch) in enumerate(variants):
+            path = Path(tmp) / f'bench{index}.log'
+            elapsed = run(factory(path), entries, lines, batch)
+            results.append((name, elapsed, digest(path)))
+        
+        assert len({d for _, _, d in results}) == 1, "Dateiinhalte unterscheiden sich"
+        
+        legacy = results[0][1]
+        print(f"{lines:,} Zeilen")
+        for name, elapsed, _ in results:
+            print(f"{name:24s} {elapsed:7.2f} s  {lines / elapsed:12,.0f} Zeilen/s  "
+                  f"({legacy / elapsed:5.1f}x)")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,58 @@
+"""Benchmark: Kosten eines abgeschalteten Log-Aufrufs (Level-Gate)
+
+Mit min_level=INFO werden DEBUG/TRACE vor jeder Allokation verworfen.
+Gemessen wird der abgeschaltete Aufruf gegen is_enabled_for() und einen
+aktiven Aufruf mit einem Handler, der nichts tut. Zielwert für den
+abgeschalteten Aufruf: unter ~200 ns.
+
+    python benchmarks/bench_level_gate.py
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from logger.logger import EnhancedLogger, Category, LogLevel  # noqa: E402
+
+TARGET_NS = 200
+
+
+class NullHandler:
+    def handle(self, entry):
+        pass
+
+
+def best_of(func, number: int, repeat: int = 7) -> float:
+    """Bester Durchlauf in ns pro Aufruf"""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e9
+
+
+def main(number: int = 200_000):
+    EnhancedLogger.initialize(min_level=LogLevel.INFO, console=False)
+    EnhancedLogger.add_handler(NullHandler())
+    
+    debug = EnhancedLogger.debug
+    trace = EnhancedLogger.trace
+    info = EnhancedLogger.info
+    is_enabled_for = EnhancedLogger.is_enabled_for
+    system = Category.SYSTEM
+    
+    disabled_debug = best_of(lambda: debug(system, "cache miss"), number)
+    disabled_args = best_of(lambda: trace(system, "user {} item {}", 42, "abc"), number)
+    guard = best_of(lambda: is_enabled_for(LogLevel.DEBUG), number)
+    enabled = best_of(lambda: info(system, "request done"), number // 10)
+    
+    print(f"debug (aus)          {disabled_debug:7.0f} ns/call")
+    print(f"trace + args (aus)   {disabled_args:7.0f} ns/call")
+    print(f"is_enabled_for       {guard:7.0f} ns/call")
+    print(f"info (aktiv, Null)   {enabled:7.0f} ns/call")
+    verdict = "ok" if disabled_debug < TARGET_NS else "über Ziel"
+    print(f"Ziel < {TARGET_NS} ns für abgeschaltete Aufrufe: {verdict}")
+    
+    EnhancedLogger.shutdown()
+
+
+if __name__ == '__main__':
+    main()
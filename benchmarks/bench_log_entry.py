@@ -0,0 +1,89 @@
+"""Benchmark: Speicherbedarf einer vollen Async-Queue (LogEntry)
+
+Vergleicht die frühere Dataclass (datetime-Zeitstempel, je ein neues
+dict/list für metadata/extra/context, `__dict__` pro Instanz) mit der
+kompakten `__slots__`-Klasse. Beide Varianten erhalten wie im Logger
+je Eintrag ein eigenes Caller-Info-Dict (bzw. keines, wenn Caller-Info
+abgeschaltet ist); gemessen wird per tracemalloc der Speicher für
+`async_queue_size` Einträge (Standard: 10.000) sowie die Erzeugungszeit.
+
+    python benchmarks/bench_log_entry.py [einträge]
+"""
+
+import sys
+import time
+import timeit
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from logger.logger import LogEntry, LogLevel  # noqa: E402
+
+
+@dataclass
+class LegacyLogEntry:
+    """LogEntry vor der Überarbeitung"""
+    timestamp: datetime
+    level: LogLevel
+    category: str
+    message: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    extra: Dict[str, Any] = field(default_factory=dict)
+    context: List[str] = field(default_factory=list)
+    trace_id: Optional[str] = None
+    span_id: Optional[str] = None
+    correlation_id: Optional[str] = None
+
+
+def caller_info(i: int) -> Dict[str, Any]:
+    return {'file': 'app.py', 'line': i, 'function': 'handle', 'thread': 'MainThread'}
+
+
+def make_legacy(i: int, with_caller: bool = True):
+    if with_caller:
+        return LegacyLogEntry(datetime.now(), LogLevel.INFO, 'API', 'Request processed',
+                              metadata=caller_info(i))
+    return LegacyLogEntry(datetime.now(), LogLevel.INFO, 'API', 'Request processed')
+
+
+def make_current(i: int, with_caller: bool = True):
+    if with_caller:
+        return LogEntry(time.time(), LogLevel.INFO, 'API', 'Request processed',
+                        metadata=caller_info(i))
+    return LogEntry(time.time(), LogLevel.INFO, 'API', 'Request processed')
+
+
+def measure(factory, count: int, with_caller: bool) -> int:
+    """Belegte Bytes für count Einträge"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entries = [factory(i, with_caller) for i in range(count)]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del entries
+    return used
+
+
+def main(count: int = 10_000):
+    print(f"{count:,} Einträge in der Queue")
+    for with_caller, label in ((True, "mit Caller-Info"), (False, "ohne Caller-Info")):
+        legacy_bytes = measure(make_legacy, count, with_caller)
+        current_bytes = measure(make_current, count, with_caller)
+        legacy_time = min(timeit.repeat(
+            lambda: make_legacy(1, with_caller), number=100_000, repeat=5)) * 10
+        current_time = min(timeit.repeat(
+            lambda: make_current(1, with_caller), number=100_000, repeat=5)) * 10
+        
+        print(f"{label}:")
+        print(f"  legacy   {legacy_bytes / 1024:8.0f} KiB  {legacy_bytes / count:5.0f} B/Eintrag  "
+              f"{legacy_time:5.2f} µs/Erzeugung")
+        print(f"  aktuell  {current_bytes / 1024:8.0f} KiB  {current_bytes / count:5.0f} B/Eintrag  "
+              f"{current_time:5.2f} µs/Erzeugung")
+        print(f"  Ersparnis {1 - current_bytes / legacy_bytes:.0%}")
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,69 @@
+"""Benchmark: LogEntry.to_logfmt() gegen die frühere Implementierung
+
+Die frühere Version quotete nicht und ließ extra/context aus; verglichen
+wird daher mit einem Eintrag, für den beide identische Ausgaben liefern
+(Nachricht mit Leerzeichen, flache Metadaten, trace_id).
+
+Erwartung: etwa gleichauf (Verhältnis ~1.0x, je nach Maschine ±10%).
+Die Überarbeitung bringt korrektes Quoting/Escaping und flachgeklopfte
+`extra`-Felder ohne Mehrkosten, aber keinen messbaren Geschwindigkeits-
+gewinn; beide Varianten werden von `datetime.isoformat()` dominiert.
+
+    python benchmarks/bench_logfmt.py
+"""
+
+import sys
+import time
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from logger.logger import LogEntry, LogLevel  # noqa: E402
+
+
+def legacy_to_logfmt(entry: LogEntry) -> str:
+    """to_logfmt() vor der Überarbeitung (ohne Escaping)"""
+    parts = [
+        f'ts={entry.timestamp.isoformat()}',
+        f'level={entry.level.name}',
+        f'category={entry.category}',
+        f'msg="{entry.message}"'
+    ]
+    for k, v in entry.metadata.items():
+        parts.append(f'{k}={v}')
+    if entry.trace_id:
+        parts.append(f'trace_id={entry.trace_id}')
+    return ' '.join(parts)
+
+
+def best_of(func, number: int, repeat: int = 7) -> float:
+    """Bester Durchlauf in µs pro Aufruf"""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+
+def main(number: int = 100_000):
+    entry = LogEntry(
+        time.time(), LogLevel.INFO, 'API', 'Request processed successfully',
+        metadata={'file': 'app.py', 'line': 42, 'function': 'handle', 'thread': 'MainThread'},
+        trace_id='4bf92f3577b34da6',
+    )
+    entry.timestamp  # datetime-Erzeugung teilen sich alle Formatter
+    assert entry.to_logfmt() == legacy_to_logfmt(entry), "Ausgaben unterscheiden sich"
+    
+    legacy = best_of(lambda: legacy_to_logfmt(entry), number)
+    current = best_of(entry.to_logfmt, number)
+    print(f"legacy   {legacy:6.2f} µs/call")
+    print(f"current  {current:6.2f} µs/call  ({legacy / current:.2f}x)")
+    
+    nested = LogEntry(
+        time.time(), LogLevel.INFO, 'API', 'Request',
+        metadata={'file': 'app.py', 'line': 42, 'function': 'handle', 'thread': 'MainThread'},
+        extra={'user': 'alice', 'status': 201, 'http': {'method': 'POST', 'path': '/api/users'}},
+        context=['OrderProcessing'],
+    )
+    print(f"extra    {best_of(nested.to_logfmt, number):6.2f} µs/call  (nested extra + context)")
+
+
+if __name__ == '__main__':
+    main()
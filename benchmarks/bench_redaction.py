@@ -0,0 +1,64 @@
+"""Benchmark: Ein-Pass-Redaction gegen sieben einzelne re.sub-Durchläufe
+
+Die frühere Version wandte jedes Default-Pattern einzeln auf die ganze
+Nachricht an. Verglichen werden Nachrichten verschiedener Länge ohne und
+mit sensiblen Daten; der Cache für wiederholte Nachrichten ist für die
+Messung abgeschaltet und wird separat ausgewiesen. Beide Varianten
+müssen identische Ergebnisse liefern.
+
+    python benchmarks/bench_redaction.py
+"""
+
+import re
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from logger.logger import _Redactor  # noqa: E402
+
+LEGACY_PATTERNS = [re.compile(p, re.IGNORECASE) for p in _Redactor.DEFAULT_PATTERNS]
+
+
+def legacy_redact(message: str) -> str:
+    """_redact_message() vor der Überarbeitung"""
+    for pattern in LEGACY_PATTERNS:
+        message = pattern.sub('[REDACTED]', message)
+    return message
+
+
+def make_message(size: int, secret: bool) -> str:
+    words = "user logged in from the web client and opened the dashboard view "
+    text = (words * (size // len(words) + 1))[:size]
+    if secret:
+        middle = len(text) // 2
+        text = text[:middle] + " password=hunter2 Bearer abc.def " + text[middle:]
+    return text
+
+
+def best_of(func, number: int, repeat: int = 7) -> float:
+    """Bester Durchlauf in µs pro Aufruf"""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+
+def main():
+    uncached = _Redactor(cache_size=0)
+    cached = _Redactor()
+    
+    print(f"{'Größe':>7s} {'Inhalt':8s} {'legacy':>8s} {'1-Pass':>8s} {'Cache':>8s}  µs/Nachricht")
+    for size in (64, 512, 4096, 32768):
+        number = max(200, 200_000 // size)
+        for secret in (False, True):
+            text = make_message(size, secret)
+            assert uncached.redact(text) == legacy_redact(text), "Ergebnisse unterscheiden sich"
+            old = best_of(lambda: legacy_redact(text), number)
+            new = best_of(lambda: uncached.redact(text), number)
+            hit = best_of(lambda: cached.redact(text), number)
+            label = "geheim" if secret else "sauber"
+            cache_col = f"{hit:8.2f}" if len(text) <= cached.cache_max_length else f"{'-':>8s}"
+            print(f"{size:7d} {label:8s} {old:8.2f} {new:8.2f} {cache_col}  ({old / new:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -5,6 +5,8 @@ from .logger import (
     logger, 
     LogLevel, 
     LogFormat,
+    OverflowPolicy,
+    AsyncTransport,
     Category,
     C # NEU: Die hierarchische Kategorie-Zugriffsklasse
 )
@@ -14,6 +16,8 @@ __all__ = [
     "logger", 
     "LogLevel", 
     "LogFormat",
+    "OverflowPolicy",
+    "AsyncTransport",
     "Category",
     "C"
 ]
\ No newline at end of file
@@ -13,7 +13,6 @@ Umfassend überarbeiteter Logger mit:
 
 import sys
 import threading
-import inspect
 import traceback
 import json
 import os
@@ -23,17 +22,27 @@ import re
 import socket
 import gzip
 import random
+import math
 import asyncio
+import contextvars
 from datetime import datetime, timedelta
-from typing import Optional, Callable, Dict, Any, List, Union, ClassVar, TypeVar, Protocol
+from typing import Optional, Callable, Dict, Any, List, Union, ClassVar, TypeVar, Protocol, Set
 from pathlib import Path
-from collections import defaultdict, deque
+from collections import defaultdict, deque, OrderedDict
+from collections.abc import Mapping
 from enum import IntEnum, Enum
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, asdict, is_dataclass
 from contextlib import contextmanager
-from functools import wraps
+from functools import wraps, partial
+from types import MappingProxyType
 import queue
 import hashlib
+import heapq
+import multiprocessing
+import pickle
+import struct
+import string
+import zlib
 
 try:
     from colorama import Fore, Style, Back, init
@@ -45,6 +54,14 @@ except ImportError:
     Fore = Style = Back = MockColor()
     COLORAMA_AVAILABLE = False
 
+# Optionales schnelles JSON-Backend
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 
 # ==========================================
 # LOG LEVELS & TYPES
@@ -70,6 +87,26 @@ class LogLevel(IntEnum):
     METRIC = 14     # Performance Metriken
 
 
+# Vorab gebundene Level-Konstanten für den Hot Path
+# (Attributzugriffe auf Enum-Klassen sind vergleichsweise teuer)
+_LVL_TRACE = LogLevel.TRACE
+_LVL_DEBUG = LogLevel.DEBUG
+_LVL_INFO = LogLevel.INFO
+_LVL_SUCCESS = LogLevel.SUCCESS
+_LVL_LOADING = LogLevel.LOADING
+_LVL_PROCESSING = LogLevel.PROCESSING
+_LVL_PROGRESS = LogLevel.PROGRESS
+_LVL_WAITING = LogLevel.WAITING
+_LVL_NOTICE = LogLevel.NOTICE
+_LVL_WARN = LogLevel.WARN
+_LVL_ERROR = LogLevel.ERROR
+_LVL_CRITICAL = LogLevel.CRITICAL
+_LVL_FATAL = LogLevel.FATAL
+_LVL_SECURITY = LogLevel.SECURITY
+_LVL_AUDIT = LogLevel.AUDIT
+_LVL_METRIC = LogLevel.METRIC
+
+
 class LogFormat(IntEnum):
     """Output-Format Optionen"""
     SIMPLE = 0      
@@ -90,53 +127,725 @@ class OutputDestination(Enum):
     CUSTOM = "custom"
 
 
+class OverflowPolicy(Enum):
+    """Verhalten bei voller Async-Queue"""
+    BLOCK = "block"              # Blockieren (mit Timeout), danach verwerfen
+    DROP_NEWEST = "drop_newest"  # Neuen Eintrag verwerfen
+    DROP_OLDEST = "drop_oldest"  # Ältesten Eintrag verdrängen
+    PRIORITY = "priority"        # Niedrigstes Level zuerst verdrängen
+
+
+class AsyncTransport(Enum):
+    """Transport zwischen loggenden Threads und dem Async-Worker"""
+    QUEUE = "queue"              # Gemeinsame queue.Queue (alle Policies)
+    RING_BUFFER = "ring_buffer"  # Ein lock-freier Ring-Buffer pro Thread
+
+
 # ==========================================
 # DATA STRUCTURES
 # ==========================================
 
-@dataclass
+def _json_default(obj: Any) -> Any:
+    """Fallback für Werte, die JSON nicht direkt kennt (wirft nie)"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset, tuple, deque)):
+        return list(obj)
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if isinstance(obj, (bytes, bytearray)):
+        return bytes(obj).decode('utf-8', 'replace')
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    return repr(obj)
+
+
+def _safe_json_value(value: Any) -> Any:
+    """Letzter Ausweg bei z.B. zirkulären Strukturen
+    
+    Mappings (auch die geteilten MappingProxy-Platzhalter) bleiben Objekte,
+    nur ihre Werte werden zu Strings.
+    """
+    if isinstance(value, Mapping):
+        return {str(k): repr(v) for k, v in value.items()}
+    return repr(value)
+
+
+def _finite_json_value(value: Any, depth: int = 0) -> Any:
+    """Ersetzt NaN/Infinity durch None (wie orjson), rekursiv in Containern
+    
+    Zirkuläre Strukturen werden ab einer festen Tiefe unverändert gelassen
+    und landen dann beim Encoder im letzten Ausweg.
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if depth >= 64:
+        return value
+    if isinstance(value, Mapping):
+        return {k: _finite_json_value(v, depth + 1) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite_json_value(v, depth + 1) for v in value]
+    return value
+
+
+# Kompakte Trennzeichen und kein NaN, damit die Ausgabe Byte für Byte der
+# von orjson entspricht (der Stdlib-Pfad ist auch der Fallback für orjson)
+_json_encode = json.JSONEncoder(
+    ensure_ascii=False, allow_nan=False, separators=(',', ':'), default=_json_default
+).encode
+# Listen in Logfmt-Werten behalten das bisherige Layout
+_logfmt_json_encode = json.JSONEncoder(ensure_ascii=False, default=_json_default).encode
+
+# Gecachte Level-Namen bzw. deren JSON-Kodierung
+_LEVEL_NAMES: Dict[LogLevel, str] = {level: level.name for level in LogLevel}
+_JSON_LEVEL_NAMES: Dict[LogLevel, str] = {level: json.dumps(level.name) for level in LogLevel}
+_JSON_CATEGORY_CACHE: Dict[str, str] = {}
+
+
+def _json_category(category: str) -> str:
+    """JSON-kodierte Kategorie (gecached, begrenzt)"""
+    encoded = _JSON_CATEGORY_CACHE.get(category)
+    if encoded is None:
+        if len(_JSON_CATEGORY_CACHE) >= 1024:
+            _JSON_CATEGORY_CACHE.clear()
+        encoded = _JSON_CATEGORY_CACHE[category] = _json_encode(category)
+    return encoded
+
+
+# Logfmt: Werte mit Leerzeichen, '=', Anführungszeichen, Backslash oder
+# nicht druckbaren Zeichen müssen gequotet werden; Schlüssel dürfen nichts
+# davon enthalten
+_LOGFMT_INVALID_KEY = re.compile(r'[\s="\\\x00-\x1f\x7f]+')
+_LOGFMT_MAX_DEPTH = 8
+_LOGFMT_CACHED_VALUE_LEN = 64
+_LOGFMT_KEY_CACHE: Dict[str, str] = {}
+_LOGFMT_VALUE_CACHE: Dict[str, str] = {}
+_LOGFMT_CATEGORY_CACHE: Dict[str, str] = {}
+_LOGFMT_METADATA_CACHE: Dict[tuple, str] = {}
+# Liste statt Dict: Index über int spart den Python-Level-Hash von Enum
+_LOGFMT_LEVELS: List[str] = [''] * (max(LogLevel) + 1)
+for _level in LogLevel:
+    _LOGFMT_LEVELS[_level] = f'level={_level.name}'
+del _level
+
+
+def _logfmt_key(key: Any) -> str:
+    """Kodiert einen Schlüssel inkl. '=' (gecached, begrenzt)"""
+    encoded = _LOGFMT_KEY_CACHE.get(key)
+    if encoded is None:
+        text = _LOGFMT_INVALID_KEY.sub('_', str(key)) or '_'
+        if len(_LOGFMT_KEY_CACHE) >= 1024:
+            _LOGFMT_KEY_CACHE.clear()
+        encoded = _LOGFMT_KEY_CACHE[key] = text + '='
+    return encoded
+
+
+# JSON-String-Escaping entspricht dem logfmt-Quoting (\", \\, \n, \uXXXX);
+# encode_basestring ist die C-Variante ohne Encoder-Overhead
+_logfmt_quote = json.encoder.encode_basestring
+
+
+def _logfmt_string(text: str) -> str:
+    """Kodiert einen String; gequotet wird nur, wenn es nötig ist"""
+    if (' ' in text or '=' in text or '"' in text or '\\' in text
+            or not text.isprintable() or not text):
+        return _logfmt_quote(text)
+    return text
+
+
+def _logfmt_value(value: Any) -> str:
+    """Kodiert einen Wert; kurze Strings (Dateien, Threads, IDs) werden gecached"""
+    if type(value) is str:
+        encoded = _LOGFMT_VALUE_CACHE.get(value)
+        if encoded is None:
+            encoded = _logfmt_string(value)
+            if len(value) <= _LOGFMT_CACHED_VALUE_LEN:
+                if len(_LOGFMT_VALUE_CACHE) >= 4096:
+                    _LOGFMT_VALUE_CACHE.clear()
+                _LOGFMT_VALUE_CACHE[value] = encoded
+        return encoded
+    if value is None:
+        return ''
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    if isinstance(value, int):
+        return str(int(value))
+    if isinstance(value, float):
+        return repr(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (list, tuple, set, frozenset, deque)):
+        try:
+            return _logfmt_string(_logfmt_json_encode(value))
+        except (TypeError, ValueError):
+            return _logfmt_string(repr(value))
+    return _logfmt_string(str(value))
+
+
+def _logfmt_category(category: str) -> str:
+    """Kodiertes `category=...` Paar (gecached, begrenzt)"""
+    encoded = _LOGFMT_CATEGORY_CACHE.get(category)
+    if encoded is None:
+        if len(_LOGFMT_CATEGORY_CACHE) >= 1024:
+            _LOGFMT_CATEGORY_CACHE.clear()
+        encoded = _LOGFMT_CATEGORY_CACHE[category] = 'category=' + _logfmt_value(category)
+    return encoded
+
+
+def _logfmt_metadata(metadata: Any) -> str:
+    """Kodierte Aufrufer-Metadaten, gecached pro Wertekombination
+    
+    Pro Aufrufstelle und Thread sind Datei, Zeile, Funktion und Thread
+    identisch; statt vier Felder einzeln zu kodieren, genügt ein Lookup.
+    """
+    try:
+        key = tuple(metadata.items())
+        encoded = _LOGFMT_METADATA_CACHE.get(key)
+    except TypeError:
+        key = encoded = None  # nicht hashbare Werte
+    if encoded is None:
+        parts: List[str] = []
+        _logfmt_fields(parts, metadata)
+        encoded = ' '.join(parts)
+        if key is not None:
+            if len(_LOGFMT_METADATA_CACHE) >= 4096:
+                _LOGFMT_METADATA_CACHE.clear()
+            _LOGFMT_METADATA_CACHE[key] = encoded
+    return encoded
+
+
+def _logfmt_fields(parts: List[str], fields: Any, prefix: str = '', depth: int = 0) -> None:
+    """Hängt `key=value` Paare an; verschachtelte Dicts werden zu `a.b=...`"""
+    append = parts.append
+    key_cache = _LOGFMT_KEY_CACHE
+    value_cache = _LOGFMT_VALUE_CACHE
+    for key, value in fields.items():
+        if prefix:
+            key = f'{prefix}.{key}'
+        value_type = type(value)
+        if value_type is str:
+            encoded = value_cache.get(value)
+            if encoded is None:
+                encoded = _logfmt_value(value)
+        elif value_type is int:
+            encoded = str(value)
+        elif isinstance(value, (dict, MappingProxyType)) and value and depth < _LOGFMT_MAX_DEPTH:
+            _logfmt_fields(parts, value, str(key), depth + 1)
+            continue
+        else:
+            encoded = _logfmt_value(value)
+        encoded_key = key_cache.get(key)
+        if encoded_key is None:
+            encoded_key = _logfmt_key(key)
+        append(encoded_key + encoded)
+
+
+class _ExceptionFormatter:
+    """Formatiert Exceptions erst bei Bedarf, mit Dedup-Cache
+    
+    Schlüssel ist Typ, Text und die Code-Stellen des Tracebacks (inkl.
+    verketteter Ursachen). Eine Exception, die in einer heißen Schleife
+    tausendfach an derselben Stelle auftritt, wird so nur einmal formatiert.
+    """
+    
+    MAX_CHAIN = 8
+    
+    def __init__(self, cache_size: int = 256):
+        self.cache_size = cache_size
+        self.redact: Optional[Callable[[str], str]] = None
+        self.hits = 0
+        self.misses = 0
+        self._cache: Dict[tuple, str] = {}
+    
+    def format(self, exception: BaseException) -> str:
+        """Formatierter Traceback (ggf. geschwärzt), gecached pro Stelle"""
+        try:
+            key = self._key(exception, 0)
+            text = self._cache.get(key)
+        except Exception:
+            key = text = None  # z.B. __str__ wirft oder nicht hashbare Teile
+        
+        if text is not None:
+            self.hits += 1
+            return text
+        
+        self.misses += 1
+        text = ''.join(traceback.format_exception(
+            type(exception), exception, exception.__traceback__
+        )).rstrip('\n')
+        redact = self.redact
+        if redact is not None:
+            text = redact(text)
+        
+        if key is not None:
+            if len(self._cache) >= self.cache_size:
+                self._cache.clear()
+            self._cache[key] = text
+        return text
+    
+    def clear(self):
+        """Leert den Cache (z.B. wenn sich die Redaction ändert)"""
+        self._cache.clear()
+    
+    def _key(self, exception: BaseException, depth: int) -> tuple:
+        locations = []
+        tb = exception.__traceback__
+        while tb is not None:
+            locations.append((tb.tb_frame.f_code, tb.tb_lineno))
+            tb = tb.tb_next
+        
+        cause = exception.__cause__
+        if cause is None and not exception.__suppress_context__:
+            cause = exception.__context__
+        return (
+            type(exception),
+            str(exception),
+            tuple(locations),
+            self._key(cause, depth + 1) if cause is not None and depth < self.MAX_CHAIN else None,
+        )
+
+
+_EXCEPTIONS = _ExceptionFormatter()
+
+
+# ==========================================
+# LAZY MESSAGE FORMATTING
+# ==========================================
+
+_TEMPLATE_PLAIN = 0
+_TEMPLATE_PRINTF = 1
+_TEMPLATE_BRACE = 2
+
+# `%%` wird mitgematcht, damit `%%s` nicht als Feld erkannt wird
+_PRINTF_FIELD = re.compile(
+    r'%(?:%|(?:\([^)]*\))?[#0 +-]*(?:\*|\d+)?(?:\.(?:\*|\d+))?[hlL]?[diouxXeEfFgGcrsa])'
+)
+_TEMPLATE_FORMATTER = string.Formatter()
+_TEMPLATE_STYLES: Dict[str, int] = {}
+_TEMPLATE_CACHE_SIZE = 1024
+
+
+def _template_style(template: str) -> int:
+    """Erkennt den Platzhalter-Stil eines Templates (gecached, begrenzt)
+    
+    `{}`-Felder haben Vorrang; `%s`-Felder nur, wenn keine Brace-Felder
+    vorkommen. Templates ohne Felder gelten als Klartext.
+    """
+    style = _TEMPLATE_STYLES.get(template)
+    if style is not None:
+        return style
+    
+    style = _TEMPLATE_PLAIN
+    if '{' in template:
+        try:
+            if any(field is not None for _, field, _, _ in _TEMPLATE_FORMATTER.parse(template)):
+                style = _TEMPLATE_BRACE
+        except ValueError:
+            pass  # z.B. einzelnes `{` in einem Klartext
+    if style == _TEMPLATE_PLAIN and '%' in template:
+        if any(match.group() != '%%' for match in _PRINTF_FIELD.finditer(template)):
+            style = _TEMPLATE_PRINTF
+    
+    if len(_TEMPLATE_STYLES) >= _TEMPLATE_CACHE_SIZE:
+        _TEMPLATE_STYLES.clear()
+    _TEMPLATE_STYLES[template] = style
+    return style
+
+
+def _interpolate(template: Any, args: tuple) -> str:
+    """Setzt Argumente in ein Template ein (wirft nie)
+    
+    - Callable: `template(*args)`
+    - `{}`-Template: `str.format`, `%`-Template: `%`-Operator (ein einzelnes
+      Dict-Argument füllt `%(name)s`-Felder)
+    - Klartext: Argumente werden mit Leerzeichen angehängt
+    """
+    try:
+        if callable(template):
+            return str(template(*args))
+        style = _template_style(template)
+        if style == _TEMPLATE_BRACE:
+            return template.format(*args)
+        if style == _TEMPLATE_PRINTF:
+            if len(args) == 1 and isinstance(args[0], dict):
+                return template % args[0]
+            return template % args
+        if args:
+            return ' '.join((template, *map(str, args)))
+        return template
+    except Exception as e:
+        return f"{template} {args!r} <format error: {type(e).__name__}: {e}>"
+
+
+def _render(template: Any, args: tuple) -> str:
+    """Einziger Einsetz-Pfad für Lazy-Nachrichten: einsetzen, dann schwärzen
+    
+    Egal ob Logger, Filter oder Handler zuerst `entry.message` liest, der
+    ungeschwärzte Text wird nie sichtbar.
+    """
+    text = _interpolate(template, args)
+    if EnhancedLogger._redact_enabled:
+        text = EnhancedLogger._redactor.redact(text)
+    return text
+
+
+# Geteilte, unveränderliche Platzhalter für leere Container
+_EMPTY_MAPPING: Dict[str, Any] = MappingProxyType({})  # type: ignore[assignment]
+_EMPTY_CONTEXT: tuple = ()
+
+
 class LogEntry:
-    """Strukturierte Log-Eintrag Datenklasse"""
-    timestamp: datetime
-    level: LogLevel
-    category: str
-    message: str
-    metadata: Dict[str, Any] = field(default_factory=dict)
-    extra: Dict[str, Any] = field(default_factory=dict)
-    context: List[str] = field(default_factory=list)
-    trace_id: Optional[str] = None
-    span_id: Optional[str] = None
-    correlation_id: Optional[str] = None
+    """Strukturierter Log-Eintrag
+    
+    Kompakte `__slots__`-Klasse statt Dataclass: kein `__dict__` pro Eintrag,
+    leere `metadata`/`extra`/`context` teilen sich einen unveränderlichen
+    Platzhalter, und der Zeitstempel wird als Epoch-Float (`created`)
+    gespeichert und erst beim Formatieren in ein `datetime` umgewandelt.
+    """
+    
+    __slots__ = (
+        'created', 'level', 'category', '_message', 'metadata', 'extra',
+        'context', 'trace_id', 'span_id', 'correlation_id', 'exception',
+        'args', '_timestamp', '_full_message', '_queued_at', '_rendered',
+    )
+    
+    def __init__(self,
+                 timestamp: Union[datetime, float],
+                 level: LogLevel,
+                 category: str,
+                 message: str,
+                 metadata: Optional[Dict[str, Any]] = None,
+                 extra: Optional[Dict[str, Any]] = None,
+                 context: Optional[List[str]] = None,
+                 trace_id: Optional[str] = None,
+                 span_id: Optional[str] = None,
+                 correlation_id: Optional[str] = None,
+                 exception: Optional[BaseException] = None,
+                 args: Optional[tuple] = None):
+        if isinstance(timestamp, datetime):
+            self.created = timestamp.timestamp()
+            self._timestamp = timestamp
+        else:
+            self.created = timestamp
+            self._timestamp = None
+        self.level = level
+        self.category = category
+        self._message = message
+        self._full_message = None
+        self.exception = exception
+        self.args = args
+        self.metadata = metadata or _EMPTY_MAPPING
+        self.extra = extra or _EMPTY_MAPPING
+        self.context = context or _EMPTY_CONTEXT
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.correlation_id = correlation_id
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Zeitstempel als `datetime` (wird beim ersten Zugriff erzeugt)"""
+        ts = self._timestamp
+        if ts is None:
+            ts = self._timestamp = datetime.fromtimestamp(self.created)
+        return ts
+    
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        self.created = value.timestamp()
+        self._timestamp = value
+    
+    @property
+    def message(self) -> str:
+        """Nachricht inkl. Traceback (wird erst beim ersten Zugriff formatiert)
+        
+        Bei Lazy-Aufrufen (`args` gesetzt) enthält `_message` bis dahin das
+        Template; die Argumente werden genau einmal eingesetzt.
+        """
+        if self.args is not None:
+            self._message = _render(self._message, self.args)
+            self.args = None
+        if self.exception is None:
+            return self._message
+        text = self._full_message
+        if text is None:
+            text = self._full_message = f"{self._message}\n{_EXCEPTIONS.format(self.exception)}"
+        return text
+    
+    @message.setter
+    def message(self, value: str) -> None:
+        self._message = value
+        self.args = None
+        self._full_message = None
+    
+    def __reduce__(self):
+        # Nur die Felder übertragen (kein Render-Cache, keine Platzhalter);
+        # Tracebacks sind nicht picklebar und werden vorher formatiert
+        return (LogEntry, (
+            self.created, self.level, self.category, self.message,
+            dict(self.metadata) or None, dict(self.extra) or None,
+            list(self.context) or None, self.trace_id, self.span_id,
+            self.correlation_id,
+        ))
+    
+    def __repr__(self) -> str:
+        return (
+            f"LogEntry(timestamp={self.timestamp!r}, level={self.level!r}, "
+            f"category={self.category!r}, message={self.message!r})"
+        )
     
     def to_dict(self) -> Dict[str, Any]:
-        """Konvertiert zu Dictionary"""
-        data = asdict(self)
-        data['timestamp'] = self.timestamp.isoformat()
-        data['level'] = self.level.name
-        return data
+        """Konvertiert zu Dictionary (flache Kopien statt asdict-Deep-Copy)"""
+        return {
+            'timestamp': self.timestamp.isoformat(),
+            'level': _LEVEL_NAMES[self.level],
+            'category': self.category,
+            'message': self.message,
+            'metadata': dict(self.metadata),
+            'extra': dict(self.extra),
+            'context': list(self.context),
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'correlation_id': self.correlation_id,
+        }
     
     def to_json(self) -> str:
-        """Konvertiert zu JSON"""
-        return json.dumps(self.to_dict(), ensure_ascii=False)
+        """Konvertiert zu JSON
+        
+        Nutzt orjson falls installiert, sonst den Stdlib-Encoder mit
+        gecachten Level-/Kategorie-Kodierungen. Beide liefern dieselben Bytes
+        (kompakt, gleiche Schlüsselreihenfolge, NaN/Infinity als null); nur
+        Floats in Exponentialschreibweise können je nach orjson-Version
+        abweichen (`1e-07` statt `1e-7`, `1e+16` statt `1e16`). Was orjson
+        nicht kodieren kann (z.B. Ganzzahlen über 64 Bit), übernimmt der
+        Stdlib-Encoder. Nicht serialisierbare Werte in `extra` werden als
+        String ausgegeben statt eine Exception zu werfen.
+        """
+        try:
+            return self._encode_json(self.metadata, self.extra)
+        except (TypeError, ValueError, OverflowError):
+            pass
+        try:
+            return self._encode_stdlib_json(
+                _finite_json_value(self.metadata), _finite_json_value(self.extra)
+            )
+        except (TypeError, ValueError, OverflowError):
+            return self._encode_stdlib_json(
+                _safe_json_value(self.metadata), _safe_json_value(self.extra)
+            )
+    
+    def _encode_json(self, metadata: Any, extra: Any) -> str:
+        """Serialisiert ohne Zwischenkopien"""
+        if orjson is not None:
+            return orjson.dumps({
+                'timestamp': self.timestamp.isoformat(),
+                'level': _LEVEL_NAMES[self.level],
+                'category': self.category,
+                'message': self.message,
+                'metadata': metadata,
+                'extra': extra,
+                'context': self.context,
+                'trace_id': self.trace_id,
+                'span_id': self.span_id,
+                'correlation_id': self.correlation_id,
+            }, default=_json_default, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        return self._encode_stdlib_json(metadata, extra)
+    
+    def _encode_stdlib_json(self, metadata: Any, extra: Any) -> str:
+        """Stdlib-Variante im selben Layout wie orjson"""
+        trace_id, span_id, correlation_id = self.trace_id, self.span_id, self.correlation_id
+        return ''.join((
+            '{"timestamp":"', self.timestamp.isoformat(),
+            '","level":', _JSON_LEVEL_NAMES[self.level],
+            ',"category":', _json_category(self.category),
+            ',"message":', _json_encode(self.message),
+            ',"metadata":', _json_encode(metadata),
+            ',"extra":', _json_encode(extra),
+            ',"context":', _json_encode(self.context),
+            ',"trace_id":', 'null' if trace_id is None else _json_encode(trace_id),
+            ',"span_id":', 'null' if span_id is None else _json_encode(span_id),
+            ',"correlation_id":', 'null' if correlation_id is None else _json_encode(correlation_id),
+            '}'
+        ))
     
     def to_logfmt(self) -> str:
-        """Konvertiert zu Logfmt-Format"""
+        """Konvertiert zu Logfmt-Format
+        
+        Werte werden nur bei Bedarf gequotet und escaped (Anführungszeichen,
+        Backslashes, Zeilenumbrüche), verschachtelte `extra`-Dicts werden zu
+        `a.b=...` Schlüsseln flachgeklopft.
+        """
+        # Fertige Nachricht ohne Traceback direkt lesen (spart die Property)
+        if self.args is None and self.exception is None:
+            message = self._message
+        else:
+            message = self.message
+        # Quoting-Fast-Path inline: Nachrichten enthalten fast immer Leerzeichen
+        if (' ' in message or '=' in message or '"' in message or '\\' in message
+                or not message.isprintable() or not message):
+            message = _logfmt_quote(message)
+        category = _LOGFMT_CATEGORY_CACHE.get(self.category) or _logfmt_category(self.category)
         parts = [
-            f'ts={self.timestamp.isoformat()}',
-            f'level={self.level.name}',
-            f'category={self.category}',
-            f'msg="{self.message}"'
+            'ts=' + (self._timestamp or self.timestamp).isoformat(),
+            _LOGFMT_LEVELS[self.level],
+            category,
+            'msg=' + message,
         ]
         
-        for k, v in self.metadata.items():
-            parts.append(f'{k}={v}')
-            
+        if self.metadata:
+            parts.append(_logfmt_metadata(self.metadata))
+        if self.extra:
+            _logfmt_fields(parts, self.extra)
+        if self.context:
+            parts.append('context=' + _logfmt_value(' > '.join(self.context)))
         if self.trace_id:
-            parts.append(f'trace_id={self.trace_id}')
-            
+            parts.append('trace_id=' + _logfmt_value(self.trace_id))
+        if self.span_id:
+            parts.append('span_id=' + _logfmt_value(self.span_id))
+        if self.correlation_id:
+            parts.append('correlation_id=' + _logfmt_value(self.correlation_id))
+        
         return ' '.join(parts)
 
 
+class LatencyHistogram:
+    """Log-lineares Latenz-Histogramm (HDR-Style) mit fester Größe
+    
+    Werte werden in Nanosekunden auf Buckets abgebildet, deren Breite mit
+    der Größenordnung wächst (16 Sub-Buckets pro Zweierpotenz, d.h. max.
+    ~6% relativer Fehler). Speicherbedarf ist unabhängig von der Anzahl
+    der Messungen.
+    """
+    
+    SUB_BUCKET_BITS: ClassVar[int] = 5
+    _SUB_COUNT: ClassVar[int] = 1 << SUB_BUCKET_BITS      # 32 exakte Buckets
+    _SUB_HALF: ClassVar[int] = 1 << (SUB_BUCKET_BITS - 1)  # 16 pro Zweierpotenz
+    _BUCKETS: ClassVar[int] = _SUB_COUNT + (64 - SUB_BUCKET_BITS) * _SUB_HALF
+    
+    def __init__(self):
+        self.counts: List[int] = [0] * self._BUCKETS
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self._lock = threading.Lock()
+    
+    def record(self, seconds: float, count: int = 1) -> None:
+        """Erfasst eine Dauer (optional mehrfach, z.B. pro Batch-Eintrag)"""
+        ns = int(seconds * 1e9)
+        if ns < 0:
+            ns = 0
+        index = self._index(ns)
+        with self._lock:
+            self.counts[index] += count
+            self.count += count
+            self.total_ns += ns * count
+            if ns > self.max_ns:
+                self.max_ns = ns
+    
+    @classmethod
+    def _index(cls, ns: int) -> int:
+        """Bucket-Index für einen Wert in Nanosekunden"""
+        if ns < cls._SUB_COUNT:
+            return ns
+        exponent = ns.bit_length() - cls.SUB_BUCKET_BITS
+        mantissa = ns >> exponent
+        index = cls._SUB_COUNT + (exponent - 1) * cls._SUB_HALF + (mantissa - cls._SUB_HALF)
+        return min(index, cls._BUCKETS - 1)
+    
+    @classmethod
+    def _value(cls, index: int) -> int:
+        """Repräsentativer Wert (Bucket-Mitte) eines Index in Nanosekunden"""
+        if index < cls._SUB_COUNT:
+            return index
+        offset = index - cls._SUB_COUNT
+        exponent = offset // cls._SUB_HALF + 1
+        mantissa = offset % cls._SUB_HALF + cls._SUB_HALF
+        return (mantissa << exponent) + (1 << (exponent - 1))
+    
+    def percentile(self, percent: float) -> float:
+        """Wert am gegebenen Perzentil in Sekunden"""
+        with self._lock:
+            counts = list(self.counts)
+            total = self.count
+            max_ns = self.max_ns
+        
+        if not total:
+            return 0.0
+        
+        target = max(1, int(round(total * percent / 100.0)))
+        seen = 0
+        for index, bucket in enumerate(counts):
+            if bucket:
+                seen += bucket
+                if seen >= target:
+                    return min(self._value(index), max_ns) / 1e9
+        return max_ns / 1e9
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Zusammenfassung in Millisekunden"""
+        def ms(seconds: float) -> float:
+            return round(seconds * 1000, 3)
+        
+        return {
+            'count': self.count,
+            'avg_ms': ms(self.total_ns / self.count / 1e9) if self.count else 0.0,
+            'p50_ms': ms(self.percentile(50)),
+            'p90_ms': ms(self.percentile(90)),
+            'p99_ms': ms(self.percentile(99)),
+            'p999_ms': ms(self.percentile(99.9)),
+            'max_ms': ms(self.max_ns / 1e9),
+        }
+
+
+def _handler_labels(handlers) -> Dict[int, str]:
+    """Lesbare, eindeutige Namen für Handler (Klasse bzw. `name`-Attribut)
+    
+    Schlüssel ist `id(handler)`: Handler müssen nicht hashbar sein.
+    """
+    labels: Dict[int, str] = {}
+    seen: Dict[str, int] = defaultdict(int)
+    for handler in handlers:
+        name = getattr(handler, 'name', None) or type(handler).__name__
+        seen[name] += 1
+        labels[id(handler)] = name if seen[name] == 1 else f"{name}#{seen[name]}"
+    return labels
+
+
+@dataclass
+class HandlerStats:
+    """Laufzeit- und Fehlerstatistik eines einzelnen Handlers"""
+    calls: int = 0
+    entries: int = 0
+    errors: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    last_error: Optional[str] = None
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    # Zeitpunkt der letzten Langsam-Meldung (monotonic)
+    slow_reported_at: float = 0.0
+    # Referenz hält den Handler fest, solange die Statistik existiert (id bleibt eindeutig)
+    handler: Any = field(default=None, repr=False, compare=False)
+    
+    def to_dict(self, handler=None) -> Dict[str, Any]:
+        """Konvertiert zu Dictionary (inkl. bytes_written/get_stats() des Handlers)"""
+        if handler is None:
+            handler = self.handler
+        return {
+            'calls': self.calls,
+            'entries': self.entries,
+            'errors': self.errors,
+            'bytes_written': getattr(handler, 'bytes_written', None),
+            'total_time_ms': round(self.total_time * 1000, 3),
+            'max_time_ms': round(self.max_time * 1000, 3),
+            'last_error': self.last_error,
+            'latency': self.latency.to_dict(),
+            'delivery': handler.get_stats() if hasattr(handler, 'get_stats') else None,
+        }
+
+
 @dataclass
 class LogMetrics:
     """Metriken für Log-Performance"""
@@ -146,11 +855,33 @@ class LogMetrics:
     error_count: int = 0
     warning_count: int = 0
     dropped_logs: int = 0
+    dropped_by_policy: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    dropped_by_level: Dict[LogLevel, int] = field(default_factory=lambda: defaultdict(int))
     average_process_time: float = 0.0
+    current_logs_per_second: float = 0.0
     peak_logs_per_second: float = 0.0
+    end_to_end_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    queue_wait_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    # id(handler) -> Statistik; Handler müssen nicht hashbar sein
+    handler_stats: Dict[int, HandlerStats] = field(default_factory=dict)
+    
+    def stats_for(self, handler) -> HandlerStats:
+        """Statistik für einen Handler (wird bei Bedarf angelegt)"""
+        stats = self.handler_stats.get(id(handler))
+        if stats is None or stats.handler is not handler:
+            stats = self.handler_stats.setdefault(id(handler), HandlerStats(handler=handler))
+        return stats
+    
+    def drop_stats(self, handler) -> None:
+        """Entfernt die Statistik eines Handlers"""
+        stats = self.handler_stats.get(id(handler))
+        if stats is not None and stats.handler is handler:
+            del self.handler_stats[id(handler)]
     
     def to_dict(self) -> Dict[str, Any]:
         """Konvertiert zu Dictionary"""
+        handler_stats = list(self.handler_stats.values())
+        labels = _handler_labels([stats.handler for stats in handler_stats])
         return {
             'total_logs': self.total_logs,
             'logs_by_level': {k.name: v for k, v in self.logs_by_level.items()},
@@ -158,8 +889,19 @@ class LogMetrics:
             'error_count': self.error_count,
             'warning_count': self.warning_count,
             'dropped_logs': self.dropped_logs,
+            'dropped_by_policy': dict(self.dropped_by_policy),
+            'dropped_by_level': {k.name: v for k, v in self.dropped_by_level.items()},
             'avg_process_time_ms': round(self.average_process_time * 1000, 2),
-            'peak_logs_per_second': round(self.peak_logs_per_second, 2)
+            'current_logs_per_second': round(self.current_logs_per_second, 2),
+            'peak_logs_per_second': round(self.peak_logs_per_second, 2),
+            'latency': {
+                'end_to_end': self.end_to_end_latency.to_dict(),
+                'queue_wait': self.queue_wait_latency.to_dict(),
+            },
+            'handlers': {
+                labels[id(stats.handler)]: stats.to_dict()
+                for stats in handler_stats
+            }
         }
 
 
@@ -369,12 +1111,179 @@ class LevelColors:
         return cls.COLORS.get(level, Fore.WHITE)
 
 
+# ==========================================
+# FORMATTERS
+# ==========================================
+
+class _TimestampCache:
+    """Cached strftime-Ergebnis; formatiert nur neu, wenn sich die Sekunde ändert"""
+    
+    __slots__ = ('fmt', 'template', '_cached')
+    
+    def __init__(self, fmt: str = '%Y-%m-%d %H:%M:%S', template: str = '{}'):
+        self.fmt = fmt
+        self.template = template
+        self._cached: tuple = (None, '')
+    
+    def format(self, ts: datetime) -> str:
+        key = (ts.second, ts.minute, ts.hour, ts.day, ts.month, ts.year)
+        cached = self._cached
+        if cached[0] == key:
+            return cached[1]
+        text = self.template.format(ts.strftime(self.fmt))
+        self._cached = (key, text)  # Tupel-Zuweisung ist atomar
+        return text
+
+
+class LogFormatter:
+    """Basisklasse für Formatter
+    
+    Subklassen implementieren `format(entry)`. Handler rufen `render(entry)`
+    auf: das Ergebnis wird pro Eintrag und Formatter-Instanz gecached, sodass
+    mehrere Handler mit demselben Formatter nur einmal serialisieren.
+    """
+    
+    def format(self, entry: LogEntry) -> str:
+        raise NotImplementedError
+    
+    def render(self, entry: LogEntry) -> str:
+        """Formatiert einen Eintrag (einmal pro Eintrag und Formatter)"""
+        try:
+            cache = entry._rendered
+        except AttributeError:
+            cache = entry._rendered = {}
+        text = cache.get(self)
+        if text is None:
+            text = cache[self] = self.format(entry)
+        return text
+
+
+class SimpleFormatter(LogFormatter):
+    """LogFormat.SIMPLE: `[LEVEL] [Kategorie] Nachricht`"""
+    
+    def format(self, entry: LogEntry) -> str:
+        return f"[{entry.level.name}] [{entry.category}] {entry.message}"
+
+
+class StandardFormatter(LogFormatter):
+    """LogFormat.STANDARD: `[Zeit.ms] [LEVEL] [Kategorie] (Kontext) Nachricht`"""
+    
+    def __init__(self):
+        self._timestamps = _TimestampCache()
+    
+    def format(self, entry: LogEntry) -> str:
+        ts = entry.timestamp
+        head = (
+            f"[{self._timestamps.format(ts)}.{ts.microsecond // 1000:03d}] "
+            f"[{entry.level.name}] [{entry.category}]"
+        )
+        if entry.context:
+            return f"{head} ({' > '.join(entry.context)}) {entry.message}"
+        return f"{head} {entry.message}"
+
+
+class DetailedFormatter(LogFormatter):
+    """LogFormat.DETAILED: Standard plus Aufrufer, Thread, Tracing und Extras"""
+    
+    def __init__(self):
+        self._timestamps = _TimestampCache()
+    
+    def format(self, entry: LogEntry) -> str:
+        ts = entry.timestamp
+        meta = entry.metadata
+        parts = [
+            f"[{self._timestamps.format(ts)}.{ts.microsecond // 1000:03d}]",
+            f"[{entry.level.name}]",
+            f"[{entry.category}]",
+            f"[{meta.get('file', '')}:{meta.get('line', 0)} {meta.get('function', '')}]",
+            f"[{meta.get('thread', '')}]",
+        ]
+        if entry.context:
+            parts.append(f"({' > '.join(entry.context)})")
+        if entry.trace_id:
+            parts.append(f"[trace:{entry.trace_id}]")
+        if entry.correlation_id:
+            parts.append(f"[corr:{entry.correlation_id}]")
+        parts.append(entry.message)
+        if entry.extra:
+            parts.append(' '.join(f"{k}={v}" for k, v in entry.extra.items()))
+        return ' '.join(parts)
+
+
+class JsonFormatter(LogFormatter):
+    """LogFormat.JSON: ein JSON-Objekt pro Zeile"""
+    
+    def format(self, entry: LogEntry) -> str:
+        return entry.to_json()
+
+
+class StructuredFormatter(LogFormatter):
+    """LogFormat.STRUCTURED: lesbare Spalten plus `key=value` Felder"""
+    
+    def __init__(self):
+        self._timestamps = _TimestampCache()
+    
+    def format(self, entry: LogEntry) -> str:
+        ts = entry.timestamp
+        fields = dict(entry.extra)
+        if entry.context:
+            fields['context'] = ' > '.join(entry.context)
+        if entry.trace_id:
+            fields['trace_id'] = entry.trace_id
+        if entry.correlation_id:
+            fields['correlation_id'] = entry.correlation_id
+        
+        line = (
+            f"{self._timestamps.format(ts)}.{ts.microsecond // 1000:03d} "
+            f"{entry.level.name:<10} {entry.category:<14} {entry.message}"
+        )
+        if fields:
+            line += " | " + ' '.join(f"{k}={v}" for k, v in fields.items())
+        return line
+
+
+class LogfmtFormatter(LogFormatter):
+    """LogFormat.LOGFMT: `key=value` Paare"""
+    
+    def format(self, entry: LogEntry) -> str:
+        return entry.to_logfmt()
+
+
+_FORMATTER_CLASSES: Dict[LogFormat, type] = {
+    LogFormat.SIMPLE: SimpleFormatter,
+    LogFormat.STANDARD: StandardFormatter,
+    LogFormat.DETAILED: DetailedFormatter,
+    LogFormat.JSON: JsonFormatter,
+    LogFormat.STRUCTURED: StructuredFormatter,
+    LogFormat.LOGFMT: LogfmtFormatter,
+}
+_FORMATTERS: Dict[LogFormat, LogFormatter] = {}
+
+
+def get_formatter(format_type: Union[LogFormat, LogFormatter]) -> LogFormatter:
+    """Gibt den (geteilten) Formatter für ein LogFormat zurück
+    
+    Pro LogFormat existiert genau eine Instanz, damit Handler mit gleichem
+    Format das Render-Ergebnis eines Eintrags teilen.
+    """
+    if isinstance(format_type, LogFormatter):
+        return format_type
+    formatter = _FORMATTERS.get(format_type)
+    if formatter is None:
+        formatter = _FORMATTERS.setdefault(format_type, _FORMATTER_CLASSES[format_type]())
+    return formatter
+
+
 # ==========================================
 # PLUGINS & HANDLERS
 # ==========================================
 
 class LogHandler(Protocol):
-    """Protocol für Log-Handler"""
+    """Protocol für Log-Handler
+    
+    Handler können optional `handle_batch(entries)` implementieren; im
+    Async-Modus erhalten sie dann ganze Batches statt einzelner Einträge.
+    """
     def handle(self, entry: LogEntry) -> None: ...
 
 
@@ -383,12 +1292,38 @@ class LogFilter(Protocol):
     def filter(self, entry: LogEntry) -> bool: ...
 
 
+def _encoded_len(text: str, stream) -> int:
+    """Länge von text in Bytes, kodiert wie der Ziel-Stream (ASCII ohne Kopie)"""
+    if text.isascii():
+        return len(text)
+    encoding = getattr(stream, 'encoding', None) or 'utf-8'
+    return len(text.encode(encoding, 'replace'))
+
+
 class ConsoleHandler:
-    """Handler für Konsolen-Ausgabe"""
+    """Handler für Konsolen-Ausgabe
+    
+    Die Präfixe je (Level, Kategorie) werden einmalig aufgebaut und in einem
+    begrenzten Dict gecached; der Zeitstempel wird nur einmal pro Sekunde
+    formatiert.
+    """
     
-    def __init__(self, colorize: bool = True, stream=None):
+    PREFIX_CACHE_SIZE: ClassVar[int] = 1024
+    
+    def __init__(self,
+                 colorize: bool = True,
+                 stream=None,
+                 formatter: Optional[Union[LogFormat, LogFormatter]] = None):
         self.colorize = colorize and COLORAMA_AVAILABLE
         self.stream = stream or sys.stdout
+        self.formatter = get_formatter(formatter) if formatter is not None else None
+        self.default_formatter: Optional[LogFormatter] = None
+        self.bytes_written = 0
+        self._prefixes: Dict[tuple, tuple] = {}
+        if self.colorize:
+            self._timestamps = _TimestampCache(template=f"{Style.DIM}[{{}}]{Style.RESET_ALL}")
+        else:
+            self._timestamps = _TimestampCache(template="[{}]")
         
     def handle(self, entry: LogEntry) -> None:
         """Gibt Log-Eintrag auf der Konsole aus"""
@@ -397,22 +1332,40 @@ class ConsoleHandler:
         # Fehler/Warnungen auf stderr
         stream = sys.stderr if entry.level >= LogLevel.WARN else self.stream
         print(formatted, file=stream)
+        self.bytes_written += _encoded_len(formatted, stream) + 1
+    
+    def handle_batch(self, entries: List[LogEntry]) -> None:
+        """Gibt mehrere Einträge mit einem write() pro Stream aus"""
+        out: List[str] = []
+        err: List[str] = []
+        for entry in entries:
+            (err if entry.level >= LogLevel.WARN else out).append(self._format_entry(entry))
+        
+        if out:
+            text = "\n".join(out) + "\n"
+            self.stream.write(text)
+            self.bytes_written += _encoded_len(text, self.stream)
+        if err:
+            text = "\n".join(err) + "\n"
+            sys.stderr.write(text)
+            self.bytes_written += _encoded_len(text, sys.stderr)
     
     def _format_entry(self, entry: LogEntry) -> str:
         """Formatiert Log-Eintrag für die Konsole"""
+        formatter = self.formatter or self.default_formatter
+        if formatter is not None:
+            return formatter.render(entry)
+        
         if not self.colorize:
             return self._format_plain(entry)
         
-        level_color = LevelColors.get_color(entry.level)
-        category_color = CategoryColors.get_color(entry.category)
-        msg_color = Fore.RED if entry.level >= LogLevel.ERROR else Fore.WHITE
+        prefix, msg_color = self._prefix(entry.level, entry.category)
+        timestamp = self._timestamps.format(entry.timestamp)
         
-        timestamp = f"{Style.DIM}[{entry.timestamp.strftime('%Y-%m-%d %H:%M:%S')}]{Style.RESET_ALL}"
-        level = f"{level_color}{Style.BRIGHT}[{entry.level.name:<10}]{Style.RESET_ALL}"
-        category = f"{category_color}[{entry.category}]{Style.RESET_ALL}"
-        message = f"{msg_color}{entry.message}{Style.RESET_ALL}"
+        if not entry.context and not entry.trace_id:
+            return f"{timestamp} {prefix} {msg_color}{entry.message}{Style.RESET_ALL}"
         
-        parts = [timestamp, level, category]
+        parts = [timestamp, prefix]
         
         # Context
         if entry.context:
@@ -423,118 +1376,947 @@ class ConsoleHandler:
         if entry.trace_id:
             parts.append(f"{Style.DIM}[trace:{entry.trace_id[:8]}]{Style.RESET_ALL}")
         
-        parts.append(message)
+        parts.append(f"{msg_color}{entry.message}{Style.RESET_ALL}")
         
         return " ".join(parts)
     
     def _format_plain(self, entry: LogEntry) -> str:
         """Formatiert ohne Farben"""
-        timestamp = entry.timestamp.strftime('%Y-%m-%d %H:%M:%S')
-        parts = [f"[{timestamp}]", f"[{entry.level.name}]", f"[{entry.category}]"]
+        prefix, _ = self._prefix(entry.level, entry.category)
+        timestamp = self._timestamps.format(entry.timestamp)
         
         if entry.context:
-            parts.append(f"({' > '.join(entry.context)})")
+            return f"{timestamp} {prefix} ({' > '.join(entry.context)}) {entry.message}"
+        return f"{timestamp} {prefix} {entry.message}"
+    
+    def _prefix(self, level: LogLevel, category: str) -> tuple:
+        """Gecachtes (Level/Kategorie-Präfix, Message-Farbe) Paar"""
+        key = (level, category)
+        cached = self._prefixes.get(key)
+        if cached is not None:
+            return cached
         
-        parts.append(entry.message)
-        return " ".join(parts)
+        if self.colorize:
+            level_color = LevelColors.get_color(level)
+            category_color = CategoryColors.get_color(category)
+            cached = (
+                f"{level_color}{Style.BRIGHT}[{level.name:<10}]{Style.RESET_ALL} "
+                f"{category_color}[{category}]{Style.RESET_ALL}",
+                Fore.RED if level >= LogLevel.ERROR else Fore.WHITE
+            )
+        else:
+            cached = (f"[{level.name}] [{category}]", "")
+        
+        if len(self._prefixes) >= self.PREFIX_CACHE_SIZE:
+            self._prefixes.clear()
+        self._prefixes[key] = cached
+        return cached
 
 
 class FileHandler:
-    """Handler für Datei-Ausgabe mit Rotation"""
+    """Handler für Datei-Ausgabe mit Rotation
+    
+    Hält einen gepufferten Stream offen und führt die geschriebenen Bytes
+    im Speicher mit, statt pro Zeile zu öffnen und zu stat-en.
+    
+    Flush-Policies (kombinierbar, es genügt eine erfüllte Bedingung):
+        flush_lines: Flush nach N gepufferten Zeilen (1 = jede Zeile)
+        flush_interval_ms: Flush, wenn seit dem letzten Flush N ms vergangen
+            sind; ein Timer-Thread flushed auch ohne weitere Schreibzugriffe,
+            gepufferte Zeilen liegen also nie länger als N ms im Speicher
+        flush_level: Sofortiger Flush ab diesem Level (None = deaktiviert)
+    
+    Rotation:
+        Rotiert wird nach Größe (max_size) und optional nach Zeit
+        (rotate_when='hourly'/'daily'). Auf dem Logging-Thread wird die
+        aktive Datei nur in `<name>.<YYYYmmdd-HHMMSS>` umbenannt; Kompression
+        (compress_level) und das Löschen alter Backups (backup_count) erledigt
+        ein Hintergrund-Thread mit begrenztem Rückstau (compress_backlog).
+        Ist der Rückstau voll, bleibt das Segment unkomprimiert liegen.
+    """
+    
+    ROTATE_INTERVALS: ClassVar[Dict[str, int]] = {
+        'hourly': 3600,
+        'daily': 86400,
+    }
+    
+    _SEGMENT_SUFFIX = re.compile(r'^(\d{8}-\d{6})(?:-(\d+))?(\.gz)?$')
+    # Backups des früheren Schemas (<datei>.1 ... <datei>.N, .1 = neuestes)
+    _LEGACY_SUFFIX = re.compile(r'^(\d+)(\.gz)?$')
     
     def __init__(self, 
                  filepath: Path,
                  max_size: int = 10 * 1024 * 1024,
                  backup_count: int = 5,
-                 compress: bool = True):
+                 compress: bool = True,
+                 flush_lines: int = 1,
+                 flush_interval_ms: Optional[float] = None,
+                 flush_level: Optional[LogLevel] = LogLevel.ERROR,
+                 buffer_size: int = 64 * 1024,
+                 compress_level: int = 6,
+                 compress_backlog: int = 4,
+                 rotate_when: Optional[str] = None,
+                 formatter: Optional[Union[LogFormat, LogFormatter]] = None):
         self.filepath = Path(filepath)
+        self.formatter = get_formatter(formatter) if formatter is not None else None
+        self.default_formatter: Optional[LogFormatter] = None
         self.max_size = max_size
         self.backup_count = backup_count
         self.compress = compress
+        self.compress_level = max(1, min(9, compress_level))
+        self.flush_lines = max(1, flush_lines)
+        self.flush_interval = flush_interval_ms / 1000 if flush_interval_ms else None
+        self.flush_level = flush_level
+        self.buffer_size = buffer_size
         self._lock = threading.Lock()
+        self._flush_due = threading.Condition(self._lock)
+        self._flusher: Optional[threading.Thread] = None
+        self._flusher_stop = False
+        
+        if rotate_when is not None and rotate_when.lower() not in self.ROTATE_INTERVALS:
+            raise ValueError(
+                f"rotate_when muss einer von {sorted(self.ROTATE_INTERVALS)} sein"
+            )
+        self.rotate_when = rotate_when.lower() if rotate_when else None
+        
+        self._stream = None
+        self._size = 0
+        self.bytes_written = 0
+        self._pending_lines = 0
+        self._last_flush = time.monotonic()
+        self._rollover_at: Optional[float] = None
+        self._timestamps = _TimestampCache()
+        
+        # Hintergrund-Wartung (Kompression & Aufräumen)
+        self._jobs: queue.Queue = queue.Queue(maxsize=max(1, compress_backlog))
+        self._worker: Optional[threading.Thread] = None
+        self.skipped_compressions = 0
         
         # Erstelle Verzeichnis
         self.filepath.parent.mkdir(parents=True, exist_ok=True)
     
     def handle(self, entry: LogEntry) -> None:
         """Schreibt Log-Eintrag in Datei"""
+        data = (self._format_entry(entry) + "\n").encode('utf-8')
+        self._write(data, 1, entry.level)
+    
+    def handle_batch(self, entries: List[LogEntry]) -> None:
+        """Schreibt mehrere Einträge mit einem einzigen write()"""
+        if not entries:
+            return
+        text = "\n".join([self._format_entry(entry) for entry in entries]) + "\n"
+        self._write(text.encode('utf-8'), len(entries), max(entry.level for entry in entries))
+    
+    async def async_handle_batch(self, entries: List[LogEntry]) -> None:
+        """asyncio-Modus: formatiert auf dem Loop, schreibt im Executor (Datei-I/O blockiert)"""
+        if not entries:
+            return
+        text = "\n".join([self._format_entry(entry) for entry in entries]) + "\n"
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._write, text.encode('utf-8'), len(entries),
+            max(entry.level for entry in entries)
+        )
+    
+    def _write(self, data: bytes, lines: int, level: LogLevel):
+        """Schreibt fertige Bytes inkl. Rotations- und Flush-Prüfung"""
         with self._lock:
+            if self._stream is None:
+                self._open()
+            
             # Rotation prüfen
-            if self.filepath.exists() and self.filepath.stat().st_size > self.max_size:
+            if self._size > self.max_size or (
+                self._rollover_at is not None and time.time() >= self._rollover_at
+            ):
                 self._rotate()
             
             # Schreiben
-            line = self._format_entry(entry) + "\n"
-            self.filepath.open('a', encoding='utf-8').write(line)
+            self._stream.write(data)
+            self._size += len(data)
+            self.bytes_written += len(data)
+            self._pending_lines += lines
+            
+            if self._should_flush(level):
+                self._flush_stream()
+            elif self.flush_interval is not None:
+                self._ensure_flusher()
+                if self._pending_lines == lines:
+                    # Erste ungeflushte Zeilen seit dem letzten Flush
+                    self._flush_due.notify()
     
-    def _format_entry(self, entry: LogEntry) -> str:
-        """Formatiert Log-Eintrag für Datei (ohne Farben)"""
-        timestamp = entry.timestamp.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
-        return f"[{timestamp}] [{entry.level.name}] [{entry.category}] {entry.message}"
+    def _ensure_flusher(self):
+        """Startet den Timer-Thread für flush_interval_ms (Lock wird gehalten)"""
+        if self._flusher is not None and self._flusher.is_alive():
+            return
+        self._flusher_stop = False
+        self._flusher = threading.Thread(
+            target=self._flusher_loop,
+            name=f"FileHandler-flush-{self.filepath.name}",
+            daemon=True
+        )
+        self._flusher.start()
     
-    def _rotate(self):
-        """Rotiert Log-Dateien"""
-        # Älteste löschen
-        oldest = self.filepath.with_suffix(f"{self.filepath.suffix}.{self.backup_count}")
-        if oldest.exists():
-            oldest.unlink()
-        
-        # Verschieben
-        for i in range(self.backup_count - 1, 0, -1):
-            src = self.filepath.with_suffix(f"{self.filepath.suffix}.{i}")
-            dst = self.filepath.with_suffix(f"{self.filepath.suffix}.{i + 1}")
-            if src.exists():
-                if self.compress and i == self.backup_count - 1:
-                    self._compress_file(src, dst.with_suffix('.gz'))
-                    src.unlink()
-                else:
-                    src.rename(dst)
-        
-        # Aktuelle Datei
-        if self.filepath.exists():
-            self.filepath.rename(self.filepath.with_suffix(f"{self.filepath.suffix}.1"))
+    def _flusher_loop(self):
+        """Flushed gepufferte Zeilen spätestens flush_interval nach dem letzten Flush"""
+        with self._flush_due:
+            while not self._flusher_stop:
+                if self._stream is None or not self._pending_lines:
+                    self._flush_due.wait()
+                    continue
+                remaining = self._last_flush + self.flush_interval - time.monotonic()
+                if remaining > 0:
+                    self._flush_due.wait(remaining)
+                    continue
+                try:
+                    self._flush_stream()
+                except Exception as e:
+                    self._pending_lines = 0
+                    print(f"FileHandler flush error: {e}", file=sys.stderr)
     
-    def _compress_file(self, src: Path, dst: Path):
-        """Komprimiert eine Datei"""
-        with open(src, 'rb') as f_in:
-            with gzip.open(dst, 'wb') as f_out:
-                f_out.writelines(f_in)
-
-
-class NetworkHandler:
-    """Handler für Remote-Logging (Syslog-Style)"""
+    def flush(self) -> None:
+        """Schreibt gepufferte Zeilen auf die Platte"""
+        with self._lock:
+            if self._stream is not None:
+                self._flush_stream()
     
-    def __init__(self, host: str, port: int = 514, protocol: str = 'udp'):
-        self.host = host
-        self.port = port
+    def close(self) -> None:
+        """Flushed und schließt den Datei-Stream, wartet auf offene Kompression"""
+        with self._lock:
+            self._close_stream()
+            worker = self._worker
+            self._worker = None
+            flusher = self._flusher
+            self._flusher = None
+            self._flusher_stop = True
+            self._flush_due.notify()
+        
+        if flusher is not None and flusher is not threading.current_thread():
+            flusher.join(timeout=5)
+        if worker is not None and worker.is_alive():
+            self._jobs.put(None)
+            worker.join(timeout=30)
+    
+    def _after_fork(self):
+        """Setzt Lock, Stream und Worker im Kind-Prozess zurück
+        
+        Der geerbte Stream gehört dem Parent (dessen Puffer wurde vor dem
+        fork geflusht); das Kind öffnet die Datei bei Bedarf neu.
+        """
+        self._lock = threading.Lock()
+        self._flush_due = threading.Condition(self._lock)
+        self._flusher = None
+        self._flusher_stop = False
+        self._stream = None
+        self._worker = None
+        self._jobs = queue.Queue(maxsize=self._jobs.maxsize)
+    
+    def _open(self):
+        """Öffnet den Datei-Stream im Append-Modus"""
+        self._stream = open(self.filepath, 'ab', buffering=self.buffer_size)
+        self._size = self._stream.tell()
+        self._pending_lines = 0
+        self._last_flush = time.monotonic()
+        
+        if self.rotate_when:
+            interval = self.ROTATE_INTERVALS[self.rotate_when]
+            now = time.time()
+            # Auf volle Stunde / lokale Mitternacht ausrichten
+            offset = -time.localtime(now).tm_gmtoff
+            self._rollover_at = now - ((now - offset) % interval) + interval
+    
+    def _close_stream(self):
+        """Schließt den Stream (falls offen)"""
+        if self._stream is not None:
+            try:
+                self._stream.close()
+            finally:
+                self._stream = None
+                self._pending_lines = 0
+    
+    def _should_flush(self, level: LogLevel) -> bool:
+        """Prüft die konfigurierten Flush-Policies"""
+        if self._pending_lines >= self.flush_lines:
+            return True
+        if self.flush_level is not None and level >= self.flush_level:
+            return True
+        if self.flush_interval is not None:
+            return time.monotonic() - self._last_flush >= self.flush_interval
+        return False
+    
+    def _flush_stream(self):
+        """Flushed den Stream und setzt die Zähler zurück"""
+        self._stream.flush()
+        self._pending_lines = 0
+        self._last_flush = time.monotonic()
+    
+    def _format_entry(self, entry: LogEntry) -> str:
+        """Formatiert Log-Eintrag für Datei (ohne Farben)"""
+        formatter = self.formatter or self.default_formatter
+        if formatter is not None:
+            return formatter.render(entry)
+        
+        ts = entry.timestamp
+        seconds = self._timestamps.format(ts)
+        return f"[{seconds}.{ts.microsecond // 1000:03d}] [{entry.level.name}] [{entry.category}] {entry.message}"
+    
+    def _rotate(self):
+        """Rotiert die aktive Datei (nur Umbenennen, Rest im Hintergrund)"""
+        self._close_stream()
+        
+        if self.filepath.exists() and self.filepath.stat().st_size > 0:
+            segment = self._segment_path()
+            self.filepath.rename(segment)
+            self._submit_maintenance(segment)
+        
+        self._open()
+    
+    def _segment_path(self) -> Path:
+        """Eindeutiger Name für ein rotiertes Segment"""
+        stamp = time.strftime('%Y%m%d-%H%M%S')
+        base = f"{self.filepath.name}.{stamp}"
+        candidate = self.filepath.with_name(base)
+        counter = 0
+        while candidate.exists() or candidate.with_name(candidate.name + '.gz').exists():
+            counter += 1
+            candidate = self.filepath.with_name(f"{base}-{counter}")
+        return candidate
+    
+    def _submit_maintenance(self, segment: Path):
+        """Übergibt ein rotiertes Segment an den Hintergrund-Thread"""
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(
+                target=self._maintenance_worker,
+                name=f"FileHandler-{self.filepath.name}",
+                daemon=True
+            )
+            self._worker.start()
+        
+        try:
+            self._jobs.put_nowait(segment)
+        except queue.Full:
+            self.skipped_compressions += 1
+    
+    def _maintenance_worker(self):
+        """Komprimiert rotierte Segmente und löscht alte Backups"""
+        while True:
+            segment = self._jobs.get()
+            if segment is None:
+                return
+            try:
+                if self.compress and segment.exists():
+                    self._compress_file(segment, segment.with_name(segment.name + '.gz'))
+                    segment.unlink()
+                self._prune_backups()
+            except Exception as e:
+                print(f"FileHandler maintenance error: {e}", file=sys.stderr)
+    
+    def _prune_backups(self):
+        """Löscht alle Segmente über backup_count hinaus (älteste zuerst)
+        
+        Nummerierte Backups aus dem alten Schema (.1 ... .N) zählen mit und
+        gelten als älter als jedes Segment mit Zeitstempel.
+        """
+        prefix = self.filepath.name + '.'
+        segments = []
+        for path in self.filepath.parent.iterdir():
+            if not path.name.startswith(prefix):
+                continue
+            suffix = path.name[len(prefix):]
+            match = self._SEGMENT_SUFFIX.match(suffix)
+            if match:
+                segments.append(((1, match.group(1), int(match.group(2) or 0)), path))
+                continue
+            match = self._LEGACY_SUFFIX.match(suffix)
+            if match:
+                segments.append(((0, '', -int(match.group(1))), path))
+        
+        segments.sort()
+        for _, path in segments[:max(0, len(segments) - self.backup_count)]:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+    
+    def _compress_file(self, src: Path, dst: Path):
+        """Komprimiert eine Datei (über temporäre Datei, dann atomar umbenannt)"""
+        tmp = dst.with_name(dst.name + '.tmp')
+        with open(src, 'rb') as f_in:
+            with gzip.open(tmp, 'wb', compresslevel=self.compress_level) as f_out:
+                while True:
+                    chunk = f_in.read(1024 * 1024)
+                    if not chunk:
+                        break
+                    f_out.write(chunk)
+        tmp.rename(dst)
+
+
+class NetworkHandler:
+    """Handler für Remote-Logging (Syslog-Style)
+    
+    Der Logging-Thread legt Einträge nur in einen begrenzten Puffer; ein
+    Hintergrund-Thread serialisiert sie, bündelt sie zu Frames und sendet.
+    
+    Frames:
+        Einträge werden gesammelt, bis `frame_size` Bytes erreicht sind oder
+        `frame_interval_ms` seit dem ersten Eintrag des Frames vergangen
+        sind. TCP: ein sendall() pro Frame (newline-getrennt). UDP: ein
+        Datagramm pro Eintrag, wie es JSON-/GELF-Collector erwarten; mit
+        `pack_datagrams=True` stattdessen newline-getrennt ein Datagramm pro
+        Frame (Standard 1400 Bytes, passt in eine MTU).
+    
+    Verbindungsfehler:
+        Ein fehlerhafter Socket wird verworfen und mit exponentiellem Backoff
+        (reconnect_min_ms bis reconnect_max_ms) neu aufgebaut. Ist
+        `spool_path` gesetzt, landen Frames solange in einer lokalen Datei
+        (max. `spool_max_size` Bytes) und werden nach dem Reconnect in
+        Reihenfolge erneut gesendet; ohne Spool zählen sie als fehlgeschlagen.
+    
+    Zähler (siehe `get_stats()`): sent, failed, spooled, replayed und
+    dropped (Puffer voll).
+    """
+    
+    DEFAULT_FRAME_SIZES: ClassVar[Dict[str, int]] = {
+        'tcp': 64 * 1024,
+        'udp': 1400,
+    }
+    
+    _SPOOL_HEADER = struct.Struct('>II')  # Frame-Länge, Anzahl Einträge
+    _STOP = object()
+    
+    def __init__(self,
+                 host: str,
+                 port: int = 514,
+                 protocol: str = 'udp',
+                 formatter: Optional[Union[LogFormat, LogFormatter]] = None,
+                 frame_size: Optional[int] = None,
+                 frame_interval_ms: float = 200,
+                 queue_size: int = 10000,
+                 connect_timeout: float = 1.0,
+                 reconnect_min_ms: float = 100,
+                 reconnect_max_ms: float = 30000,
+                 spool_path: Optional[Union[str, Path]] = None,
+                 spool_max_size: int = 10 * 1024 * 1024,
+                 pack_datagrams: bool = False):
+        self.formatter = get_formatter(formatter) if formatter is not None else None
+        self.default_formatter: Optional[LogFormatter] = None
+        self.host = host
+        self.port = port
         self.protocol = protocol.lower()
+        if self.protocol not in self.DEFAULT_FRAME_SIZES:
+            raise ValueError(
+                f"protocol muss einer von {sorted(self.DEFAULT_FRAME_SIZES)} sein"
+            )
+        self.frame_size = frame_size or self.DEFAULT_FRAME_SIZES[self.protocol]
+        self.frame_interval = max(0.0, frame_interval_ms / 1000)
+        self.pack_datagrams = pack_datagrams
+        self.connect_timeout = connect_timeout
+        self.reconnect_min = reconnect_min_ms / 1000
+        self.reconnect_max = max(self.reconnect_min, reconnect_max_ms / 1000)
+        self.spool_path = Path(spool_path) if spool_path else None
+        self.spool_max_size = spool_max_size
+        
+        self.bytes_written = 0
+        self.sent_entries = 0
+        self.failed_entries = 0
+        self.spooled_entries = 0
+        self.replayed_entries = 0
+        self.dropped_entries = 0
+        self.connections = 0
+        self.last_error: Optional[str] = None
+        
         self._socket = None
+        self._backoff = self.reconnect_min
+        self._next_connect = 0.0
+        # Ungesendete Bytes im Spool; `_spool_skip` = bereits gesendeter Anfang
+        # der Datei, falls sie nach dem Abspielen nicht gekürzt werden konnte
+        self._spool_size = 0
+        self._spool_skip = 0
+        if self.spool_path is not None:
+            self.spool_path.parent.mkdir(parents=True, exist_ok=True)
+            if self.spool_path.exists():
+                # Reste eines früheren Laufs werden beim ersten Senden abgespielt
+                self._spool_size = self.spool_path.stat().st_size
+        
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+        self._worker: Optional[threading.Thread] = None
         self._lock = threading.Lock()
     
     def handle(self, entry: LogEntry) -> None:
-        """Sendet Log-Eintrag an Remote-Server"""
+        """Übergibt den Eintrag an den Sende-Thread (blockiert nie)"""
+        self._ensure_worker()
         try:
-            message = entry.to_json().encode('utf-8')
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self.dropped_entries += 1
+    
+    def handle_batch(self, entries: List[LogEntry]) -> None:
+        """Übergibt mehrere Einträge an den Sende-Thread"""
+        self._ensure_worker()
+        put = self._queue.put_nowait
+        for index, entry in enumerate(entries):
+            try:
+                put(entry)
+            except queue.Full:
+                self.dropped_entries += len(entries) - index
+                break
+    
+    def flush(self, timeout: float = 5.0) -> None:
+        """Sendet alle gepufferten Einträge (wartet max. `timeout` Sekunden)"""
+        worker = self._worker
+        if worker is None:
+            return
+        if not worker.is_alive():
+            self._ensure_worker()
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return
+        done.wait(timeout)
+    
+    def close(self) -> None:
+        """Sendet den Rest, beendet den Sende-Thread und schließt den Socket"""
+        with self._lock:
+            worker = self._worker
+            self._worker = None
+        
+        if worker is not None and worker.is_alive():
+            self._queue.put(self._STOP)
+            worker.join(timeout=10)
+        self._disconnect()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Zustellungs-Statistik"""
+        return {
+            'sent': self.sent_entries,
+            'failed': self.failed_entries,
+            'spooled': self.spooled_entries,
+            'replayed': self.replayed_entries,
+            'dropped': self.dropped_entries,
+            'queued': self._queue.qsize(),
+            'spool_bytes': self._spool_size,
+            'connected': self._socket is not None,
+            'connections': self.connections,
+            'last_error': self.last_error,
+        }
+    
+    def _serialize(self, entry: LogEntry) -> bytes:
+        """Serialisiert einen Eintrag (Standard: JSON)"""
+        formatter = self.formatter or self.default_formatter or get_formatter(LogFormat.JSON)
+        return formatter.render(entry).encode('utf-8')
+    
+    def _before_fork(self):
+        """Vor fork() nicht flushen: bei nicht erreichbarem Endpunkt würde
+        fork() bis zu `timeout` Sekunden blockieren. Das Kind verwirft den
+        geerbten Puffer (siehe `_after_fork`), der Sende-Thread des Parents
+        stellt ihn weiter zu – nichts wird doppelt gesendet."""
+    
+    def _after_fork(self):
+        """Kind-Prozess: eigener Lock, Puffer, Thread, Socket und Spool"""
+        self._lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=self._queue.maxsize)
+        self._worker = None
+        self._socket = None
+        if self.spool_path is not None:
+            # Die Spool-Datei gehört dem Parent
+            self.spool_path = self.spool_path.with_name(f"{self.spool_path.name}.{os.getpid()}")
+            self._spool_size = self._spool_skip = 0
+    
+    def _ensure_worker(self):
+        """Startet den Sende-Thread bei Bedarf (auch neu, falls er beendet wurde)"""
+        worker = self._worker
+        if worker is not None and worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._sender_loop,
+                    name=f"NetworkHandler-{self.host}:{self.port}",
+                    daemon=True
+                )
+                self._worker.start()
+    
+    def _sender_loop(self):
+        """Bündelt Einträge zu Frames und sendet sie
+        
+        Ein unerwarteter Fehler (z.B. Spool-I/O bei vollem Datenträger)
+        verwirft nur den aktuellen Frame und zählt ihn als fehlgeschlagen;
+        der Thread läuft weiter.
+        """
+        frame: List[bytes] = []
+        frame_bytes = 0
+        deadline = None
+        
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None  # Frame-Intervall abgelaufen
             
-            with self._lock:
-                if not self._socket:
-                    self._connect()
+            pending: List[bytes] = []
+            try:
+                if item is self._STOP or isinstance(item, threading.Event):
+                    # Stop bzw. explizites flush(): alles Gepufferte senden
+                    if frame:
+                        pending, frame, frame_bytes, deadline = frame, [], 0, None
+                        self._send_frame(pending)
+                    elif self._spool_size:
+                        self._replay_spool()
+                    if item is self._STOP:
+                        return
+                    item.set()
+                    continue
                 
-                if self.protocol == 'udp':
-                    self._socket.sendto(message, (self.host, self.port))
-                else:
-                    self._socket.send(message + b'\n')
-        except Exception:
-            pass  # Silent fail für Network-Handler
+                if item is not None:
+                    try:
+                        message = self._serialize(item)
+                    except Exception as e:
+                        self.failed_entries += 1
+                        self.last_error = f"{type(e).__name__}: {e}"
+                        continue
+                    
+                    if frame and frame_bytes + len(message) + 1 > self.frame_size:
+                        pending, frame, frame_bytes, deadline = frame, [], 0, None
+                        self._send_frame(pending)
+                    frame.append(message)
+                    frame_bytes += len(message) + 1
+                    if deadline is None:
+                        deadline = time.monotonic() + self.frame_interval
+                
+                if frame and (frame_bytes >= self.frame_size or time.monotonic() >= deadline):
+                    pending, frame, frame_bytes, deadline = frame, [], 0, None
+                    self._send_frame(pending)
+            except Exception as e:
+                # `pending` wurde vor dem Senden aus dem Frame genommen
+                self.failed_entries += len(pending)
+                self.last_error = f"{type(e).__name__}: {e}"
+                if item is self._STOP:
+                    return
+                if isinstance(item, threading.Event):
+                    item.set()
+    
+    def _build_frame(self, messages: List[bytes]) -> bytes:
+        """Setzt einen Frame zusammen (newline-getrennt)"""
+        return b'\n'.join(messages) + b'\n'
+    
+    def _send_frame(self, messages: List[bytes]):
+        """Sendet einen Frame (Datagramm-Transporte: je Eintrag, außer gepackt)"""
+        if self.protocol != 'tcp' and not self.pack_datagrams:
+            for message in messages:
+                self._deliver(message, 1)
+            return
+        self._deliver(self._build_frame(messages), len(messages))
+    
+    def _deliver(self, payload: bytes, count: int):
+        """Sendet ein Payload; bei Fehlern in den Spool (oder als failed zählen)"""
+        # Ältere Frames aus dem Spool zuerst, damit die Reihenfolge erhalten bleibt
+        if (not self._spool_size or self._replay_spool()) and self._send(payload):
+            self.sent_entries += count
+            return
+        self._spool(payload, count)
+    
+    def _send(self, payload: bytes) -> bool:
+        """Sendet einen Frame, baut bei Bedarf die Verbindung (mit Backoff) auf"""
+        if self._socket is not None and self.protocol == 'tcp' and self._peer_closed():
+            # Sonst ginge der erste Frame nach einem Collector-Neustart verloren
+            self._disconnect()
+        if self._socket is None:
+            if time.monotonic() < self._next_connect:
+                return False
+            try:
+                self._connect()
+            except OSError as e:
+                self._connection_failed(e)
+                return False
+        
+        try:
+            self._socket.sendall(payload)
+        except OSError as e:
+            self._connection_failed(e)
+            return False
+        
+        self.bytes_written += len(payload)
+        self._backoff = self.reconnect_min
+        return True
+    
+    def _peer_closed(self) -> bool:
+        """Prüft ohne zu blockieren, ob die Gegenseite die Verbindung beendet hat"""
+        sock = self._socket
+        try:
+            sock.setblocking(False)
+            return sock.recv(1, socket.MSG_PEEK) == b''
+        except BlockingIOError:
+            return False
+        except OSError:
+            return True
+        finally:
+            sock.settimeout(self.connect_timeout)
+    
+    def _connection_failed(self, error: Exception):
+        """Verwirft den Socket und plant den nächsten Verbindungsversuch"""
+        self.last_error = f"{type(error).__name__}: {error}"
+        self._disconnect()
+        self._next_connect = time.monotonic() + self._backoff
+        self._backoff = min(self._backoff * 2, self.reconnect_max)
     
     def _connect(self):
-        """Erstellt Socket-Verbindung"""
+        """Erstellt Socket-Verbindung (UDP verbunden, damit Fehler sichtbar werden)"""
         if self.protocol == 'udp':
-            self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            family, kind, proto, _, address = socket.getaddrinfo(
+                self.host, self.port, 0, socket.SOCK_DGRAM
+            )[0]
+            sock = socket.socket(family, kind, proto)
+            sock.connect(address)
         else:
-            self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self._socket.connect((self.host, self.port))
-        self._socket.settimeout(1)
+            sock = socket.create_connection((self.host, self.port), self.connect_timeout)
+        sock.settimeout(self.connect_timeout)
+        self._socket = sock
+        self.connections += 1
+    
+    def _disconnect(self):
+        """Schließt den Socket (falls offen)"""
+        sock, self._socket = self._socket, None
+        if sock is not None:
+            try:
+                sock.close()
+            except OSError:
+                pass
+    
+    def _spool(self, payload: bytes, count: int):
+        """Hängt einen nicht zustellbaren Frame an den Spool an"""
+        record_size = self._SPOOL_HEADER.size + len(payload)
+        if self.spool_path is None or self._spool_size + record_size > self.spool_max_size:
+            self.failed_entries += count
+            return
+        try:
+            with open(self.spool_path, 'ab') as f:
+                f.write(self._SPOOL_HEADER.pack(len(payload), count) + payload)
+        except OSError as e:
+            self.failed_entries += count
+            self.last_error = f"{type(e).__name__}: {e}"
+            return
+        self._spool_size += record_size
+        self.spooled_entries += count
+    
+    def _replay_spool(self) -> bool:
+        """Sendet gespoolte Frames in Reihenfolge; True, wenn der Spool leer ist
+        
+        Kann die Spool-Datei danach nicht gekürzt bzw. gelöscht werden (z.B.
+        ENOSPC, EACCES), merkt sich `_spool_skip` den bereits gesendeten
+        Anfang, damit nichts doppelt gesendet wird.
+        """
+        try:
+            with open(self.spool_path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            self._spool_size = self._spool_skip = 0
+            return True
+        except OSError as e:
+            self.last_error = f"{type(e).__name__}: {e}"
+            return False
+        
+        if self._spool_skip > len(data):
+            self._spool_skip = 0  # Datei wurde extern ersetzt
+        
+        header = self._SPOOL_HEADER
+        offset = self._spool_skip
+        while offset + header.size <= len(data):
+            length, count = header.unpack_from(data, offset)
+            payload = data[offset + header.size:offset + header.size + length]
+            if len(payload) < length:
+                break  # Abgeschnittener Datensatz (z.B. Absturz beim Schreiben)
+            if not self._send(payload):
+                # Rest für den nächsten Versuch behalten
+                self._rewrite_spool(data, offset)
+                return False
+            self.sent_entries += count
+            self.replayed_entries += count
+            offset += header.size + length
+        
+        try:
+            self.spool_path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.last_error = f"{type(e).__name__}: {e}"
+            self._spool_skip = len(data)
+            self._spool_size = 0
+            return True
+        self._spool_size = self._spool_skip = 0
+        return True
+    
+    def _rewrite_spool(self, data: bytes, offset: int):
+        """Kürzt den Spool auf den ungesendeten Rest (ab `offset`)"""
+        tmp = self.spool_path.with_name(self.spool_path.name + '.tmp')
+        try:
+            tmp.write_bytes(data[offset:])
+            os.replace(tmp, self.spool_path)
+        except OSError as e:
+            self.last_error = f"{type(e).__name__}: {e}"
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            # Datei unverändert: gesendeten Anfang beim nächsten Mal überspringen
+            self._spool_skip = offset
+            self._spool_size = len(data) - offset
+            return
+        self._spool_skip = 0
+        self._spool_size = len(data) - offset
+
+
+class SyslogHandler(NetworkHandler):
+    """Handler für Syslog nach RFC 5424
+    
+    Erbt Puffer, Frames, Reconnect-Backoff und Spool vom NetworkHandler.
+    Transporte:
+        unix: Unix-Domain-Socket (Standard `/dev/log`), ein Datagramm pro Nachricht
+        udp:  ein Datagramm pro Nachricht (RFC 5426)
+        tcp:  Octet-Counting-Framing (RFC 6587), sicher für mehrzeilige Nachrichten
+    
+    Der Header `<PRI>1 ZEIT HOST APP PROCID MSGID -` wird aus vorberechneten
+    Bytes zusammengesetzt: PRI pro Level, `HOST APP PROCID MSGID -` pro
+    Kategorie, die Zeit nur einmal pro Sekunde. Der Nachrichtentext ist die
+    Log-Message bzw. die Ausgabe des Formatters (z.B. LogFormat.JSON).
+    """
+    
+    DEFAULT_FRAME_SIZES: ClassVar[Dict[str, int]] = {
+        'unix': 64 * 1024,
+        'udp': 64 * 1024,
+        'tcp': 64 * 1024,
+    }
+    
+    SEVERITIES: ClassVar[Dict[LogLevel, int]] = {
+        LogLevel.TRACE: 7,       # debug
+        LogLevel.DEBUG: 7,
+        LogLevel.INFO: 6,        # informational
+        LogLevel.SUCCESS: 6,
+        LogLevel.LOADING: 6,
+        LogLevel.PROCESSING: 6,
+        LogLevel.PROGRESS: 6,
+        LogLevel.WAITING: 6,
+        LogLevel.METRIC: 6,
+        LogLevel.NOTICE: 5,      # notice
+        LogLevel.AUDIT: 5,
+        LogLevel.WARN: 4,        # warning
+        LogLevel.SECURITY: 4,
+        LogLevel.ERROR: 3,       # error
+        LogLevel.CRITICAL: 2,    # critical
+        LogLevel.FATAL: 1,       # alert
+    }
+    
+    FACILITIES: ClassVar[Dict[str, int]] = {
+        'kern': 0, 'user': 1, 'mail': 2, 'daemon': 3, 'auth': 4, 'syslog': 5,
+        'lpr': 6, 'news': 7, 'uucp': 8, 'cron': 9, 'authpriv': 10, 'ftp': 11,
+        'local0': 16, 'local1': 17, 'local2': 18, 'local3': 19,
+        'local4': 20, 'local5': 21, 'local6': 22, 'local7': 23,
+    }
+    
+    def __init__(self,
+                 host: str = '/dev/log',
+                 port: int = 514,
+                 protocol: str = 'unix',
+                 facility: str = 'user',
+                 app_name: Optional[str] = None,
+                 hostname: Optional[str] = None,
+                 formatter: Optional[Union[LogFormat, LogFormatter]] = None,
+                 **options):
+        if facility.lower() not in self.FACILITIES:
+            raise ValueError(f"facility muss einer von {sorted(self.FACILITIES)} sein")
+        super().__init__(host, port, protocol, formatter=formatter, **options)
+        self.pack_datagrams = False  # RFC 5426: genau eine Nachricht pro Datagramm
+        self.facility = facility.lower()
+        self.app_name = app_name or os.path.basename(sys.argv[0] or '') or 'python'
+        self.hostname = hostname or socket.gethostname() or '-'
+        
+        code = self.FACILITIES[self.facility] * 8
+        self._priorities: Dict[LogLevel, bytes] = {
+            level: b'<%d>1 ' % (code + severity)
+            for level, severity in self.SEVERITIES.items()
+        }
+        self._build_header_fields()
+        self._seconds: tuple = (None, b'', b'')
+    
+    def _build_header_fields(self):
+        """`HOST APP PROCID` (ändert sich nur nach fork) und leerer MSGID-Cache"""
+        self._fields = b' '.join((
+            self._header_value(self.hostname, 255),
+            self._header_value(self.app_name, 48),
+            self._header_value(str(os.getpid()), 128),
+        ))
+        self._tails: Dict[str, bytes] = {}
+    
+    @staticmethod
+    def _header_value(value: str, max_length: int) -> bytes:
+        """Header-Feld: nur druckbares ASCII ohne Leerzeichen, gekürzt, '-' wenn leer"""
+        data = bytes(c for c in value.encode('ascii', 'replace') if 33 <= c <= 126)
+        return data[:max_length] or b'-'
+    
+    def _tail(self, category: str) -> bytes:
+        """` HOST APP PROCID MSGID - ` für eine Kategorie (gecached, begrenzt)"""
+        tail = self._tails.get(category)
+        if tail is None:
+            if len(self._tails) >= 1024:
+                self._tails = {}
+            tail = b' %s %s - ' % (self._fields, self._header_value(category, 32))
+            self._tails[category] = tail
+        return tail
+    
+    def _timestamp(self, created: float) -> bytes:
+        """RFC-3339-Zeitstempel mit Mikrosekunden und lokalem Offset"""
+        second = int(created)
+        cached = self._seconds
+        if cached[0] != second:
+            local = time.localtime(second)
+            offset = local.tm_gmtoff
+            if offset:
+                sign = '+' if offset > 0 else '-'
+                hours, minutes = divmod(abs(offset) // 60, 60)
+                zone = f"{sign}{hours:02d}:{minutes:02d}".encode('ascii')
+            else:
+                zone = b'Z'
+            cached = self._seconds = (
+                second, time.strftime('%Y-%m-%dT%H:%M:%S', local).encode('ascii'), zone
+            )
+        return b'%s.%06d%s' % (cached[1], int((created - second) * 1000000), cached[2])
+    
+    def _serialize(self, entry: LogEntry) -> bytes:
+        """Baut die Syslog-Nachricht (TCP: mit Längenpräfix)"""
+        formatter = self.formatter or self.default_formatter
+        body = formatter.render(entry) if formatter is not None else entry.message
+        message = b''.join((
+            self._priorities[entry.level],
+            self._timestamp(entry.created),
+            self._tail(entry.category),
+            body.encode('utf-8', 'replace'),
+        ))
+        if self.protocol == 'tcp':
+            return b'%d %s' % (len(message), message)
+        return message
+    
+    def _build_frame(self, messages: List[bytes]) -> bytes:
+        """TCP: Nachrichten sind selbst-begrenzt (Datagramme: eine pro Nachricht)"""
+        return b''.join(messages)
+    
+    def _connect(self):
+        """Unix-Domain-Socket oder UDP/TCP (siehe NetworkHandler)"""
+        if self.protocol != 'unix':
+            super()._connect()
+            return
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            sock.connect(self.host)
+        except OSError:
+            sock.close()
+            raise
+        sock.settimeout(self.connect_timeout)
+        self._socket = sock
+        self.connections += 1
+    
+    def _after_fork(self):
+        """Kind-Prozess: neue PROCID im Header"""
+        super()._after_fork()
+        self._build_header_fields()
 
 
 class LevelFilter:
@@ -557,29 +2339,766 @@ class CategoryFilter:
         self.exclude = set(exclude) if exclude else set()
     
     def filter(self, entry: LogEntry) -> bool:
-        if entry.category in self.exclude:
+        return self.allows_category(entry.category)
+    
+    def allows_category(self, category: str) -> bool:
+        """Prüft eine Kategorie ohne LogEntry (für Pre-Checks)"""
+        if category in self.exclude:
             return False
-        if self.include and entry.category not in self.include:
+        if self.include and category not in self.include:
             return False
         return True
 
 
 class SamplingFilter:
-    """Sample-basiertes Filtering"""
+    """Sample-basiertes Filtering
     
-    def __init__(self, rate: float = 1.0):
-        self.rate = max(0.0, min(1.0, rate))
+    Deterministisch pro Trace: Einträge mit `trace_id` (sonst
+    `correlation_id`) werden über einen prozessübergreifend stabilen Hash
+    gesampelt, d.h. ein Request wird ganz oder gar nicht behalten – auch
+    über mehrere Worker/Services hinweg. Einträge ohne ID werden zufällig
+    gesampelt.
+    
+    Raten gelten pro Kategorie, sonst pro Level, sonst `rate`. Mit
+    `max_per_second` werden sie zusätzlich adaptiv herunterskaliert, bis
+    die in LogMetrics gemessene Rate das Budget einhält. Einträge ab
+    `always_keep` (Standard: ERROR) passieren immer.
+    """
+    
+    def __init__(self,
+                 rate: float = 1.0,
+                 level_rates: Optional[Dict[LogLevel, float]] = None,
+                 category_rates: Optional[Dict[Union[Category, str], float]] = None,
+                 max_per_second: Optional[float] = None,
+                 always_keep: LogLevel = LogLevel.ERROR,
+                 adjust_interval: float = 1.0,
+                 min_scale: float = 0.001):
+        self.rate = self._clamp(rate)
+        self.level_rates = {
+            LogLevel(level): self._clamp(value) for level, value in (level_rates or {}).items()
+        }
+        self.category_rates = {
+            (category.value if isinstance(category, Category) else str(category)): self._clamp(value)
+            for category, value in (category_rates or {}).items()
+        }
+        self.max_per_second = max_per_second
+        self.always_keep = always_keep
+        self.adjust_interval = adjust_interval
+        self.min_scale = min_scale
+        
+        # Adaptiver Faktor (1.0 = keine zusätzliche Drosselung)
+        self.scale = 1.0
+        self._kept = 0
+        self._adjusted_at = time.monotonic()
+    
+    @staticmethod
+    def _clamp(rate: float) -> float:
+        return max(0.0, min(1.0, rate))
     
     def filter(self, entry: LogEntry) -> bool:
-        if self.rate >= 1.0:
+        level = entry.level
+        if level >= self.always_keep:
+            return True
+        
+        rate = self.category_rates.get(entry.category) if self.category_rates else None
+        if rate is None:
+            rate = self.level_rates.get(level, self.rate) if self.level_rates else self.rate
+        
+        if self.max_per_second is not None:
+            now = time.monotonic()
+            if now - self._adjusted_at >= self.adjust_interval:
+                self._adjust(now)
+            rate *= self.scale
+        
+        if rate >= 1.0:
+            keep = True
+        elif rate <= 0.0:
+            return False
+        else:
+            key = entry.trace_id or entry.correlation_id
+            if key is None:
+                keep = random.random() < rate
+            else:
+                # Schwelle statt Zufall: sinkt die Rate, bleibt eine
+                # Teilmenge der bisher behaltenen Traces erhalten
+                keep = zlib.crc32(key.encode('utf-8', 'surrogatepass')) < rate * 4294967296.0
+        
+        if keep:
+            self._kept += 1
+        return keep
+    
+    def _adjust(self, now: float):
+        """Passt den adaptiven Faktor an das Zeilenbudget an
+        
+        Gemessen wird die Ausgabe-Rate (nach dem Sampling), daher
+        multiplikativ: Eingang = Ausgabe / Faktor, neuer Faktor =
+        Budget / Eingang. Ohne Metrik-Erfassung zählt der Filter selbst.
+        """
+        elapsed = now - self._adjusted_at
+        kept, self._kept = self._kept, 0
+        self._adjusted_at = now
+        
+        observed = kept / elapsed if elapsed > 0 else 0.0
+        if EnhancedLogger.collect_metrics:
+            # Fenster von current_logs_per_second, aber bis jetzt gerechnet,
+            # damit eine abgeklungene Last nicht als veraltete Spitze zählt
+            stamps = EnhancedLogger._log_timestamps
+            try:
+                if len(stamps) > 1 and now > stamps[0]:
+                    observed = len(stamps) / (now - stamps[0])
+            except IndexError:
+                pass
+        
+        if observed <= 0.0:
+            self.scale = 1.0
+            return
+        self.scale = max(self.min_scale, min(1.0, self.scale * self.max_per_second / observed))
+
+
+class RateLimitFilter:
+    """Unterdrückt Log-Stürme: Duplikate pro Fenster, danach eine Zusammenfassung
+    
+    Schlüssel ist (Level, Kategorie, Message-Template, Aufrufer-Datei/-Zeile).
+    Pro Schlüssel und `window` Sekunden passieren `burst` Einträge (Token-
+    Bucket, der mit jedem Fenster voll aufgefüllt wird); weitere werden nur
+    gezählt. Schließt das Fenster, folgt ein Eintrag "... (suppressed N
+    duplicates)" mit Text, Level, Kategorie und Aufrufstelle des ersten
+    Eintrags. Pro Fenster wird nur dieser Text gehalten, nicht der ganze
+    Eintrag (kein Traceback, kein `extra`, kein Kontext).
+    
+    Die Tabelle ist nach Fensterbeginn sortiert und auf `max_keys` begrenzt:
+    abgelaufene und verdrängte Schlüssel werden vorne entnommen, sodass jeder
+    Aufruf O(1) kostet. Zusammenfassungen ruhender Schlüssel erscheinen beim
+    nächsten Log-Aufruf oder spätestens bei flush()/shutdown().
+    
+    Mit dem Lazy-API (`logger.error(kat, "Timeout bei {}", host)`) zählen
+    unterschiedliche Argumente als Duplikat; fertig formatierte f-Strings
+    nur bei identischem Text.
+    """
+    
+    MAX_SWEEP = 2  # abgelaufene Schlüssel, die ein Aufruf höchstens abräumt
+    
+    def __init__(self,
+                 window: float = 1.0,
+                 burst: int = 1,
+                 max_keys: int = 4096,
+                 min_level: LogLevel = LogLevel.TRACE):
+        self.window = window
+        self.burst = max(1, burst)
+        self.max_keys = max(1, max_keys)
+        self.min_level = min_level
+        self.suppressed_total = 0
+        # Schlüssel -> [Fensterbeginn, durchgelassen, unterdrückt, Text des ersten Eintrags]
+        self._windows: 'OrderedDict[tuple, list]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def filter(self, entry: LogEntry) -> bool:
+        if entry.level < self.min_level:
+            return True
+        
+        template = entry._message
+        if type(template) is not str:
+            template = getattr(template, '__code__', template)
+        metadata = entry.metadata
+        key = (entry.level, entry.category, template, metadata.get('file'), metadata.get('line'))
+        
+        now = time.monotonic()
+        window = self.window
+        closed = None
+        # Text nur für neue Fenster und außerhalb des Locks einsetzen (ein
+        # Callable als Nachricht könnte selbst loggen); der Blick ohne Lock
+        # ist nur ein Hinweis, im seltenen Rennen wird unter dem Lock gebaut
+        state = self._windows.get(key)
+        text = self._first_text(entry) if state is None or now - state[0] >= window else None
+        with self._lock:
+            windows = self._windows
+            state = windows.get(key)
+            if state is not None and now - state[0] >= window:
+                del windows[key]
+                if state[2]:
+                    closed = [(key, state)]
+                state = None
+            
+            if state is None:
+                if len(windows) >= self.max_keys:
+                    evicted = windows.popitem(last=False)
+                    if evicted[1][2]:
+                        closed = (closed or []) + [evicted]
+                windows[key] = [now, 1, 0, text if text is not None else self._first_text(entry)]
+                keep = True
+            elif state[1] < self.burst:
+                state[1] += 1
+                keep = True
+            else:
+                state[2] += 1
+                self.suppressed_total += 1
+                keep = False
+            
+            # Abgelaufene Fenster vorne abräumen (älteste zuerst)
+            for _ in range(self.MAX_SWEEP):
+                if not windows:
+                    break
+                oldest = next(iter(windows.values()))
+                if now - oldest[0] < window:
+                    break
+                expired = windows.popitem(last=False)
+                if oldest[2]:
+                    closed = (closed or []) + [expired]
+        
+        if closed:
+            self._emit(closed)
+        return keep
+    
+    def flush(self):
+        """Gibt Zusammenfassungen aller offenen Fenster sofort aus"""
+        with self._lock:
+            closed = [(key, state) for key, state in self._windows.items() if state[2]]
+            self._windows.clear()
+        if closed:
+            self._emit(closed)
+    
+    @staticmethod
+    def _first_text(entry: LogEntry) -> str:
+        """Nachrichtentext ohne Traceback (Lazy-Argumente werden jetzt eingesetzt)"""
+        if entry.args is not None:
+            entry._message, entry.args = _render(entry._message, entry.args), None
+        return entry._message
+    
+    def _emit(self, closed: List[tuple]):
+        """Erzeugt die Zusammenfassungen (außerhalb des Locks)"""
+        for (level, category, _, file, line), (started, _, suppressed, text) in closed:
+            EnhancedLogger._process_entry(LogEntry(
+                timestamp=time.time(),
+                level=level,
+                category=category,
+                message=f"{text} (suppressed {suppressed} duplicates)",
+                metadata={'file': file, 'line': line} if file is not None else None,
+                extra={
+                    'suppressed': suppressed,
+                    'window_s': round(time.monotonic() - started, 3),
+                },
+            ))
+    
+    def _after_fork(self):
+        self._lock = threading.Lock()
+        self._windows = OrderedDict()
+
+
+class _LogQueue(queue.Queue):
+    """queue.Queue mit Level-Zählern für Verdrängung bei Überlauf"""
+    
+    def _init(self, maxsize):
+        super()._init(maxsize)
+        self.level_counts: Dict[LogLevel, int] = defaultdict(int)
+    
+    def _put(self, item):
+        self.queue.append(item)
+        self.level_counts[item.level] += 1
+    
+    def _get(self):
+        item = self.queue.popleft()
+        self.level_counts[item.level] -= 1
+        return item
+    
+    def put_evicting(self, item: LogEntry, priority: bool,
+                     on_evict: Optional[Callable[[LogEntry], None]] = None) -> Optional[LogEntry]:
+        """Fügt ein und verdrängt bei voller Queue einen Eintrag
+        
+        Args:
+            priority: True = ältesten Eintrag des niedrigsten Levels unter
+                item.level verdrängen, False = ältesten Eintrag verdrängen
+            on_evict: Wird noch unter dem Queue-Lock mit dem verdrängten
+                Eintrag aufgerufen, damit Worker und flush() Queue-Inhalt
+                und Drop-Zähler nie gegeneinander verschoben sehen
+        
+        Returns:
+            Den verdrängten Eintrag (oder None)
+        
+        Raises:
+            queue.Full: Wenn kein Eintrag verdrängt werden darf
+        """
+        with self.not_full:
+            if self.maxsize <= 0 or self._qsize() < self.maxsize:
+                self._put(item)
+                self.unfinished_tasks += 1
+                self.not_empty.notify()
+                return None
+            
+            if priority:
+                victim_level = min(
+                    (level for level, count in self.level_counts.items() if count > 0),
+                    default=None
+                )
+                if victim_level is None or victim_level >= item.level:
+                    raise queue.Full
+                for index, queued in enumerate(self.queue):
+                    if queued.level == victim_level:
+                        break
+                del self.queue[index]
+                self.level_counts[victim_level] -= 1
+                evicted = queued
+            else:
+                evicted = self._get()
+            
+            if on_evict is not None:
+                on_evict(evicted)
+            
+            # Verdrängter Eintrag wird durch den neuen ersetzt -> unfinished_tasks bleibt
+            self._put(item)
+            self.not_empty.notify()
+            return evicted
+
+
+class _RingBufferTransport:
+    """Ein begrenzter deque-Ring-Buffer pro produzierendem Thread
+    
+    Producer hängen ohne Lock an ihren eigenen Buffer an (deque.append ist
+    unter dem GIL atomar); nur die erstmalige Registrierung eines Threads
+    nimmt einen Lock. Der Worker leert die Buffer reihum und mischt die
+    Teil-Batches nach Zeitstempel, wobei die Reihenfolge pro Thread
+    erhalten bleibt.
+    
+    Unterstützt DROP_OLDEST (Ring-Semantik) und DROP_NEWEST.
+    """
+    
+    def __init__(self, capacity: int, drop_newest: bool = True):
+        self.capacity = max(1, capacity)
+        self.drop_newest = drop_newest
+        self._local = threading.local()
+        self._buffers: List[tuple] = []  # (thread, deque)
+        self._register_lock = threading.Lock()
+        self._start = 0
+        self._busy = False
+    
+    def put(self, entry: LogEntry) -> Optional[LogEntry]:
+        """Hängt einen Eintrag an; gibt einen verworfenen Eintrag zurück"""
+        buf = getattr(self._local, 'buffer', None)
+        if buf is None:
+            buf = self._register()
+        
+        if len(buf) >= self.capacity:
+            if self.drop_newest:
+                return entry
+            try:
+                dropped = buf[0]
+            except IndexError:
+                dropped = None
+            buf.append(entry)  # maxlen verdrängt den ältesten Eintrag
+            return dropped
+        
+        buf.append(entry)
+        return None
+    
+    def _register(self) -> deque:
+        """Legt den Buffer für den aktuellen Thread an"""
+        buf: deque = deque(maxlen=self.capacity)
+        self._local.buffer = buf
+        with self._register_lock:
+            self._buffers = self._buffers + [(threading.current_thread(), buf)]
+        return buf
+    
+    def drain(self, max_entries: int) -> List[LogEntry]:
+        """Holt reihum bis zu max_entries Einträge, nach Zeit gemischt"""
+        self._busy = True
+        buffers = self._buffers
+        if not buffers:
+            return []
+        
+        share = max(1, max_entries // len(buffers))
+        chunks = []
+        taken = 0
+        count = len(buffers)
+        for offset in range(count):
+            if taken >= max_entries:
+                break
+            buf = buffers[(self._start + offset) % count][1]
+            n = min(len(buf), share, max_entries - taken)
+            if n:
+                chunks.append([buf.popleft() for _ in range(n)])
+                taken += n
+        self._start = (self._start + 1) % count
+        
+        if not chunks:
+            self._prune()
+            return []
+        if len(chunks) == 1:
+            return chunks[0]
+        return list(heapq.merge(*chunks, key=lambda e: e.created))
+    
+    def done(self):
+        """Markiert den zuletzt geholten Batch als verarbeitet"""
+        self._busy = False
+    
+    def pending(self) -> bool:
+        """True, solange Einträge gepuffert sind oder verarbeitet werden"""
+        return self._busy or any(buf for _, buf in self._buffers)
+    
+    def join(self, poll: float = 0.001):
+        """Wartet bis alle Buffer geleert und verarbeitet sind"""
+        while self.pending():
+            time.sleep(poll)
+    
+    def _prune(self):
+        """Entfernt leere Buffer beendeter Threads"""
+        if any(not thread.is_alive() and not buf for thread, buf in self._buffers):
+            with self._register_lock:
+                self._buffers = [
+                    (thread, buf) for thread, buf in self._buffers
+                    if thread.is_alive() or buf
+                ]
+
+
+class _AsyncioTransport:
+    """Loop-gebundener Puffer für den asyncio-Modus
+    
+    Koroutinen auf dem Loop hängen ohne Lock, Future oder Thread-Wechsel an
+    einen deque an und wecken die Drain-Task über ein asyncio.Event. Andere
+    Threads reichen Einträge per call_soon_threadsafe nach. Die Drain-Task
+    übergibt Batches an die Handler und wartet dabei auf deren
+    `async_handle_batch` (sofern vorhanden).
+    
+    Ist der Puffer voll, wird der neueste (bzw. bei drop_newest=False der
+    älteste) Eintrag verworfen; blockieren kann ein Loop-Thread nicht.
+    
+    Wird der Loop geschlossen, ohne die Drain-Task zu beenden (z.B.
+    `run_until_complete()` gefolgt von `close()`), schreibt `put` den
+    Pufferinhalt synchron statt eine Exception zu werfen.
+    """
+    
+    def __init__(self,
+                 loop: asyncio.AbstractEventLoop,
+                 capacity: int,
+                 batch_size: int,
+                 drop_newest: bool,
+                 dispatch: Callable,
+                 dispatch_sync: Callable[[List[LogEntry]], None]):
+        self.loop = loop
+        self.capacity = max(1, capacity)
+        self.batch_size = max(1, batch_size)
+        self.drop_newest = drop_newest
+        self.buffer: deque = deque()
+        self._dispatch = dispatch
+        self._dispatch_sync = dispatch_sync
+        self._thread_id = threading.get_ident()
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self.task = loop.create_task(self._drain())
+    
+    @property
+    def closed(self) -> bool:
+        """True, wenn die Drain-Task beendet oder der Loop geschlossen ist"""
+        return self.task.done() or self.loop.is_closed()
+    
+    def put(self, entry: LogEntry) -> Optional[LogEntry]:
+        """Hängt einen Eintrag an; gibt einen verworfenen Eintrag zurück
+        
+        Andere Threads hängen ebenfalls direkt an (deque.append ist unter dem
+        GIL atomar) und wecken die Drain-Task per call_soon_threadsafe. So
+        bleibt der Eintrag im Puffer, auch wenn der Loop vor dem Callback
+        geschlossen wird.
+        """
+        buf = self.buffer
+        dropped = None
+        if len(buf) >= self.capacity:
+            if self.drop_newest:
+                return entry
+            try:
+                dropped = buf.popleft()
+            except IndexError:
+                pass  # Drain-Task hat den Puffer gerade geleert
+        buf.append(entry)
+        
+        try:
+            if threading.get_ident() == self._thread_id:
+                if not self._wakeup.is_set():
+                    self._wakeup.set()
+            else:
+                self.loop.call_soon_threadsafe(self._wake)
+        except RuntimeError:
+            # Loop geschlossen: Gepuffertes (inkl. diesem Eintrag) synchron schreiben
+            rest = self.take_all()
+            if rest:
+                self._dispatch_sync(rest)
+        return dropped
+    
+    def _wake(self):
+        if not self._wakeup.is_set():
+            self._wakeup.set()
+    
+    def take_all(self) -> List[LogEntry]:
+        """Entnimmt alle gepufferten Einträge (für synchrones Leeren)"""
+        entries = []
+        pop = self.buffer.popleft
+        try:
+            while True:
+                entries.append(pop())
+        except IndexError:
+            return entries
+    
+    async def join(self):
+        """Wartet, bis der Puffer geleert und verarbeitet ist"""
+        while self.buffer or not self._idle.is_set():
+            if self.task.done():
+                rest = self.take_all()
+                if rest:
+                    self._dispatch_sync(rest)
+                return
+            self._wake()
+            if self._idle.is_set():
+                # Drain-Task hat die neuen Einträge noch nicht gesehen
+                await asyncio.sleep(0)
+            else:
+                await self._idle.wait()
+    
+    async def _drain(self):
+        """Drain-Task: Batches aus dem Puffer an die Handler übergeben"""
+        buf = self.buffer
+        try:
+            while True:
+                if not buf:
+                    self._idle.set()
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+                self._idle.clear()
+                count = min(len(buf), self.batch_size)
+                batch = [buf.popleft() for _ in range(count)]
+                await self._dispatch(batch)
+        except asyncio.CancelledError:
+            # Loop wird beendet (z.B. Ende von asyncio.run): Rest synchron schreiben
+            rest = self.take_all()
+            if rest:
+                self._dispatch_sync(rest)
+            raise
+        finally:
+            self._idle.set()
+
+
+# Kontext-Stack und Tracing-IDs pro Thread bzw. asyncio-Task. Der Stack ist
+# ein unveränderliches Tupel: Einträge referenzieren es direkt (O(1), keine
+# Kopie), push/pop erzeugen ein neues Tupel für den aktuellen Kontext.
+_CONTEXT_STACK: contextvars.ContextVar = contextvars.ContextVar('logger_context', default=())
+_TRACE_ID: contextvars.ContextVar = contextvars.ContextVar('logger_trace_id', default=None)
+_CORRELATION_ID: contextvars.ContextVar = contextvars.ContextVar('logger_correlation_id', default=None)
+
+
+class _LogContext:
+    """`logger.context(...)` als sync und async Context Manager
+    
+    Setzt Kontext (und optional Trace-/Correlation-ID) beim Betreten und
+    stellt beim Verlassen per Token exakt den vorherigen Zustand wieder her.
+    """
+    
+    __slots__ = ('name', 'trace_id', 'correlation_id', '_tokens')
+    
+    def __init__(self,
+                 name: Optional[str] = None,
+                 trace_id: Optional[str] = None,
+                 correlation_id: Optional[str] = None):
+        self.name = name
+        self.trace_id = trace_id
+        self.correlation_id = correlation_id
+        self._tokens: List[tuple] = []
+    
+    def __enter__(self) -> '_LogContext':
+        tokens = []
+        if self.name is not None:
+            tokens.append((_CONTEXT_STACK, _CONTEXT_STACK.set(_CONTEXT_STACK.get() + (self.name,))))
+        if self.trace_id is not None:
+            tokens.append((_TRACE_ID, _TRACE_ID.set(self.trace_id)))
+        if self.correlation_id is not None:
+            tokens.append((_CORRELATION_ID, _CORRELATION_ID.set(self.correlation_id)))
+        self._tokens.append(tokens)
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        for var, token in reversed(self._tokens.pop()):
+            var.reset(token)
+    
+    async def __aenter__(self) -> '_LogContext':
+        return self.__enter__()
+    
+    async def __aexit__(self, *exc_info) -> None:
+        self.__exit__(*exc_info)
+
+
+class _Redactor:
+    """Ein-Pass-Redaction für Nachrichten und `extra`-Felder
+    
+    - Alle Patterns werden zu einer Alternation kompiliert (ein Scan statt
+      einer re.sub-Runde pro Pattern).
+    - Ein Literal-Vorfilter überspringt den Regex komplett, wenn keines der
+      Stichwörter (bzw. keine Ziffer) in der Nachricht vorkommt.
+    - `extra`-Werte werden anhand des Schlüsselnamens geschwärzt
+      (z.B. `password=`, `api_key=`, `authorization=`), String-Werte
+      zusätzlich mit denselben Patterns wie die Nachricht.
+    - Ergebnisse für wiederholte, identische Nachrichten werden gecached.
+    """
+    
+    REPLACEMENT = '[REDACTED]'
+    
+    DEFAULT_PATTERNS: ClassVar[List[str]] = [
+        r'\b\d{13,19}\b',  # Kreditkarten
+        r'\b\d{3}-\d{2}-\d{4}\b',  # SSN
+        r'password["\s:=]+\S+',
+        r'api[_-]?key["\s:=]+\S+',
+        r'secret["\s:=]+\S+',
+        r'token["\s:=]+\S+',
+        r'Bearer\s+\S+',
+    ]
+    
+    # Mögliche erste Zeichen eines Default-Treffers: der Lookahead lässt den
+    # Regex an allen anderen Positionen sofort weiterspringen
+    DEFAULT_FIRST_CHARS = '0-9pastb'
+    
+    # Stichwörter der Default-Patterns (kleingeschrieben); Ziffern separat
+    DEFAULT_LITERALS: ClassVar[tuple] = (
+        'password', 'api_key', 'api-key', 'apikey', 'secret', 'token', 'bearer',
+    )
+    
+    DEFAULT_KEYS: ClassVar[tuple] = (
+        'password', 'passwd', 'pwd', 'secret', 'token', 'apikey', 'api_key',
+        'authorization', 'auth', 'cookie', 'session', 'credential', 'private_key',
+        'card', 'ssn',
+    )
+    
+    _DIGITS = '0123456789'
+    _DIGIT_RUN = re.compile(r'\d{3}')
+    _KEY_WORDS = re.compile(r'[A-Z]?[a-z0-9]+|[A-Z]+(?![a-z])')
+    _MAX_DEPTH = 8
+    
+    def __init__(self,
+                 patterns: Optional[List[str]] = None,
+                 keys: Optional[List[str]] = None,
+                 literals: Optional[List[str]] = None,
+                 cache_size: int = 1024,
+                 cache_max_length: int = 4096):
+        if not patterns:
+            # Leere Liste wie None: `(?:)` würde überall leer matchen
+            patterns = self.DEFAULT_PATTERNS
+            literals = self.DEFAULT_LITERALS if literals is None else literals
+            check_digits = True
+            guard = f'(?=[{self.DEFAULT_FIRST_CHARS}])'
+        else:
+            # Für eigene Patterns gibt es nur mit expliziten Literalen einen Vorfilter
+            check_digits = False
+            guard = ''
+        
+        self.patterns = [re.compile(p, re.IGNORECASE) for p in patterns]
+        try:
+            self.combined: Optional[re.Pattern] = re.compile(
+                guard + '(?:' + '|'.join(f'(?:{p})' for p in patterns) + ')', re.IGNORECASE
+            )
+        except re.error:
+            # z.B. globale Inline-Flags mitten im Pattern: Patterns einzeln anwenden
+            self.combined = None
+        
+        self.literals = tuple(l.lower() for l in literals) if literals is not None else None
+        self.check_digits = check_digits
+        self.key_fragments = tuple(
+            k.lower().replace('-', '_') for k in (self.DEFAULT_KEYS if keys is None else keys)
+        )
+        self.cache_size = cache_size
+        self.cache_max_length = cache_max_length
+        self._cache: Dict[str, str] = {}
+        self._key_cache: Dict[str, bool] = {}
+    
+    def redact(self, text: str) -> str:
+        """Schwärzt sensible Daten in einem String"""
+        cache = self._cache
+        cached = cache.get(text)
+        if cached is not None:
+            return cached
+        
+        result = text if not self._may_match(text) else self._substitute(text)
+        
+        if self.cache_size and len(text) <= self.cache_max_length:
+            if len(cache) >= self.cache_size:
+                cache.clear()
+            cache[text] = result
+        return result
+    
+    def redact_fields(self, fields: Dict[str, Any], depth: int = 0) -> Dict[str, Any]:
+        """Schwärzt `extra`-Werte nach Schlüsselname (und String-Inhalt)
+        
+        Gibt dasselbe Dict zurück, wenn nichts geschwärzt wurde; geändert
+        wird nur eine Kopie.
+        """
+        result = fields
+        for key, value in fields.items():
+            if self._is_sensitive_key(key):
+                new_value: Any = self.REPLACEMENT
+            elif type(value) is str:
+                new_value = self.redact(value)
+            elif isinstance(value, dict) and depth < self._MAX_DEPTH:
+                new_value = self.redact_fields(value, depth + 1)
+            else:
+                continue
+            if new_value is not value:
+                if result is fields:
+                    result = dict(fields)
+                result[key] = new_value
+        return result
+    
+    def _may_match(self, text: str) -> bool:
+        """Literal-Vorfilter: False, wenn keines der Patterns passen kann"""
+        literals = self.literals
+        if literals is None:
             return True
-        return random.random() < self.rate
+        lowered = text.lower()
+        for literal in literals:
+            if literal in lowered:
+                return True
+        if self.check_digits:
+            for digit in self._DIGITS:
+                if digit in text:
+                    return self._DIGIT_RUN.search(text) is not None
+        return False
+    
+    def _substitute(self, text: str) -> str:
+        if self.combined is not None:
+            return self.combined.sub(self.REPLACEMENT, text)
+        for pattern in self.patterns:
+            text = pattern.sub(self.REPLACEMENT, text)
+        return text
+    
+    def _is_sensitive_key(self, key: Any) -> bool:
+        """Schlüssel enthält ein Stichwort als eigenes Wort (`access_token`,
+        `accessToken`) bzw. ein langes Stichwort irgendwo (`x_api_key`)"""
+        sensitive = self._key_cache.get(key)
+        if sensitive is None:
+            text = str(key)
+            words = {word.lower() for word in self._KEY_WORDS.findall(text)}
+            compact = ''.join(self._KEY_WORDS.findall(text)).lower()
+            sensitive = False
+            for fragment in self.key_fragments:
+                fragment = fragment.replace('_', '')
+                if fragment in words or (len(fragment) >= 6 and fragment in compact):
+                    sensitive = True
+                    break
+            if len(self._key_cache) >= 1024:
+                self._key_cache.clear()
+            self._key_cache[key] = sensitive
+        return sensitive
 
 
 # ==========================================
 # MAIN LOGGER CLASS
 # ==========================================
 
+# Quelldateien, deren Frames bei der Caller-Ermittlung übersprungen werden
+# (dieses Modul inkl. Subklassen-Helfer sowie contextlib für measure())
+_INTERNAL_SOURCE_FILES = frozenset((
+    LevelFilter.filter.__code__.co_filename,
+    contextmanager.__code__.co_filename,
+))
+
+# Code-Objekte der Methoden von Subklassen außerhalb dieses Moduls (z.B. ein
+# überschriebenes info(), das super().info() aufruft) - siehe __init_subclass__
+_INTERNAL_CODE: Set[Any] = set()
+
+
 class EnhancedLogger:
     """
     Erweiterter Professional Logger mit Plugin-System
@@ -594,25 +3113,67 @@ class EnhancedLogger:
     _handlers: List[LogHandler] = []
     _filters: List[LogFilter] = []
     
+    # Level-Gate: vorberechnetes effektives Minimum aus min_level und allen
+    # LevelFiltern, damit deaktivierte Levels vor jeder Allokation abbrechen
+    _level_gate: int = LogLevel.DEBUG
+    _level_filter: Optional[LevelFilter] = None
+    
     # State Management
-    _lock = threading.Lock()
-    _context_stack: List[str] = []
+    _lock = threading.RLock()
     _metrics = LogMetrics()
-    _trace_id: Optional[str] = None
-    _correlation_id: Optional[str] = None
     
     # Async Support
-    _async_queue: Optional[queue.Queue] = None
+    _async_queue: Optional[_LogQueue] = None
+    _overflow_policy: OverflowPolicy = OverflowPolicy.DROP_NEWEST
+    _overflow_timeout: float = 0.1
+    _overflow_protect_level: LogLevel = LogLevel.ERROR
+    _async_ring: Optional[_RingBufferTransport] = None
+    _asyncio_transport: Optional[_AsyncioTransport] = None
     _async_worker: Optional[threading.Thread] = None
+    _async_config: Optional[tuple] = None
     _shutdown_event = threading.Event()
     
+    # Multiprocess Support (Pre-Fork Worker -> ein Writer-Prozess)
+    _mp_queue: Optional[Any] = None
+    _mp_listener: Optional[threading.Thread] = None
+    _mp_child: bool = False
+    
     # Performance Tracking
+    # (Rollierende Fenster mit laufender Summe -> O(1) pro Eintrag)
+    collect_metrics: bool = True
+    _metrics_lock = threading.Lock()
     _process_times: deque = deque(maxlen=1000)
+    _process_time_sum: float = 0.0
     _log_timestamps: deque = deque(maxlen=100)
     
+    # Selbstdiagnose für langsame Handler
+    _slow_handler_threshold: Optional[float] = None
+    _diagnostic_state = threading.local()
+    
     # Sensitive Data Redaction
     _redact_enabled: bool = False
     _redact_patterns: List[re.Pattern] = []
+    _redactor: Optional[_Redactor] = None
+    
+    # Caller-Info (Datei/Zeile/Funktion des Aufrufers)
+    _caller_info_enabled: bool = True
+    _caller_info_min_level: LogLevel = LogLevel.TRACE
+    _caller_stack_offset: int = 0
+    _caller_cache: Dict[Any, tuple] = {}
+    _caller_cache_max_size: int = 4096
+    _no_caller_info: Dict[str, Dict[str, Any]] = {}
+    
+    def __init_subclass__(cls, **kwargs):
+        """Merkt sich die Methoden der Subklasse als Logger-interne Frames"""
+        super().__init_subclass__(**kwargs)
+        for attr in vars(cls).values():
+            if isinstance(attr, (classmethod, staticmethod)):
+                attr = attr.__func__
+            elif isinstance(attr, property):
+                attr = attr.fget
+            code = getattr(attr, '__code__', None)
+            if code is not None:
+                _INTERNAL_CODE.add(code)
     
     @classmethod
     def initialize(cls,
@@ -622,16 +3183,60 @@ class EnhancedLogger:
                    file_path: Optional[Path] = None,
                    file_max_size: int = 10 * 1024 * 1024,
                    async_mode: bool = False,
-                   sampling_rate: float = 1.0):
-        """Initialisiert den Logger mit Basis-Konfiguration"""
+                   sampling_rate: float = 1.0,
+                   async_batch_size: int = 256,
+                   async_batch_wait_ms: float = 0.0,
+                   async_queue_size: int = 10000,
+                   async_overflow: OverflowPolicy = OverflowPolicy.DROP_NEWEST,
+                   async_block_timeout: float = 0.1,
+                   async_protect_level: LogLevel = LogLevel.ERROR,
+                   async_transport: AsyncTransport = AsyncTransport.QUEUE,
+                   collect_metrics: bool = True,
+                   slow_handler_ms: Optional[float] = None,
+                   format_type: LogFormat = LogFormat.STANDARD):
+        """Initialisiert den Logger mit Basis-Konfiguration
+        
+        Im Async-Modus sammelt der Worker bis zu `async_batch_size` Einträge
+        (und wartet dafür höchstens `async_batch_wait_ms`) und übergibt sie
+        gebündelt an Handler mit `handle_batch`.
+        
+        Ist die Queue (`async_queue_size`) voll, entscheidet `async_overflow`:
+        BLOCK wartet bis `async_block_timeout` Sekunden, DROP_NEWEST verwirft
+        den neuen Eintrag, DROP_OLDEST den ältesten und PRIORITY den ältesten
+        Eintrag mit dem niedrigsten Level. Bei PRIORITY werden Einträge ab
+        `async_protect_level` nie verworfen, solange sie verdrängen oder
+        innerhalb des Timeouts nachrücken können.
+        
+        Mit `async_transport=AsyncTransport.RING_BUFFER` schreibt jeder
+        Thread in einen eigenen Ring-Buffer der Größe `async_queue_size`
+        statt in die gemeinsame Queue (nur DROP_NEWEST / DROP_OLDEST).
+        
+        `collect_metrics=False` schaltet die Metrik-Erfassung für maximalen
+        Durchsatz ab (get_metrics() liefert dann nur noch Drop-Zähler).
+        `slow_handler_ms` meldet Handler-Aufrufe ab dieser Dauer als
+        METRIC-Eintrag (siehe set_slow_handler_threshold).
+        
+        `format_type` (bzw. LOG_FORMAT) gilt für alle Handler ohne eigenen
+        Formatter; STANDARD belässt jedem Handler sein natives Layout.
+        """
         
         with cls._lock:
             cls.min_level = min_level
+            cls.collect_metrics = collect_metrics
+            cls.set_slow_handler_threshold(slow_handler_ms)
+            cls.format_type = format_type
+            # Worker zuerst stoppen und Gepuffertes an die alten Handler
+            # schreiben, sonst öffnet ein später handle() den Stream erneut
+            cls._stop_async_mode()
+            cls._close_handlers(cls._handlers)
+            for handler in cls._handlers:
+                cls._metrics.drop_stats(handler)
             cls._handlers = []
             cls._filters = []
             
             # Standard-Filter
-            cls._filters.append(LevelFilter(min_level))
+            cls._level_filter = LevelFilter(min_level)
+            cls._filters.append(cls._level_filter)
             
             if sampling_rate < 1.0:
                 cls._filters.append(SamplingFilter(sampling_rate))
@@ -648,25 +3253,136 @@ class EnhancedLogger:
             
             # Async Mode
             if async_mode:
-                cls._enable_async_mode()
+                cls._overflow_policy = async_overflow
+                cls._overflow_timeout = max(0.0, async_block_timeout)
+                cls._overflow_protect_level = async_protect_level
+                cls._enable_async_mode(async_batch_size, async_batch_wait_ms,
+                                       async_queue_size, async_transport)
             
             # Umgebungsvariablen laden
             cls._load_env_config()
+            
+            cls._update_level_gate()
+            cls._apply_format()
     
     @classmethod
-    def _enable_async_mode(cls):
+    def _enable_async_mode(cls,
+                           batch_size: int = 256,
+                           batch_wait_ms: float = 0.0,
+                           queue_size: int = 10000,
+                           transport: AsyncTransport = AsyncTransport.QUEUE):
         """Aktiviert asynchronen Logging-Modus"""
-        cls._async_queue = queue.Queue(maxsize=10000)
+        cls._async_config = (batch_size, batch_wait_ms, queue_size, transport)
+        batch_size = max(1, batch_size)
+        batch_wait = max(0.0, batch_wait_ms) / 1000
+        
+        if transport is AsyncTransport.RING_BUFFER:
+            cls._enable_ring_transport(batch_size, batch_wait, queue_size)
+            return
+        
+        cls._async_ring = None
+        cls._async_queue = _LogQueue(maxsize=max(1, queue_size))
         cls._shutdown_event.clear()
         
         def worker():
-            while not cls._shutdown_event.is_set():
+            q = cls._async_queue
+            while not cls._shutdown_event.is_set() and cls._async_queue is q:
+                try:
+                    batch = [q.get(timeout=0.1)]
+                except queue.Empty:
+                    continue
+                
+                # Alles Verfügbare abholen, ggf. bis batch_wait auf mehr warten
+                deadline = time.monotonic() + batch_wait if batch_wait else None
+                while len(batch) < batch_size:
+                    try:
+                        batch.append(q.get_nowait())
+                    except queue.Empty:
+                        if deadline is None:
+                            break
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        try:
+                            batch.append(q.get(timeout=remaining))
+                        except queue.Empty:
+                            break
+                
+                cls._process_batch_sync(batch)
+                for _ in batch:
+                    q.task_done()
+        
+        cls._async_worker = threading.Thread(target=worker, daemon=True)
+        cls._async_worker.start()
+    
+    @classmethod
+    def _stop_async_mode(cls, timeout: float = 5.0):
+        """Stoppt den Async-Worker und schreibt noch Gepuffertes synchron
+        
+        Nach dem Join (bzw. Timeout) werden Queue und Ring-Buffer geleert und
+        an die aktuellen Handler übergeben, damit kein Eintrag still verloren
+        geht.
+        """
+        worker = cls._async_worker
+        if worker is not None and worker.is_alive() and worker is not threading.current_thread():
+            cls._shutdown_event.set()
+            worker.join(timeout=timeout)
+        
+        rest: List[LogEntry] = []
+        q = cls._async_queue
+        if q is not None:
+            while True:
                 try:
-                    entry = cls._async_queue.get(timeout=0.1)
-                    cls._process_entry_sync(entry)
-                    cls._async_queue.task_done()
+                    rest.append(q.get_nowait())
                 except queue.Empty:
+                    break
+                q.task_done()
+        ring = cls._async_ring
+        if ring is not None:
+            while True:
+                batch = ring.drain(4096)
+                ring.done()
+                if not batch:
+                    break
+                rest.extend(batch)
+        
+        cls._async_worker = None
+        cls._async_queue = None
+        cls._async_ring = None
+        cls._async_config = None
+        if rest:
+            cls._process_batch_sync(rest)
+    
+    @classmethod
+    def _enable_ring_transport(cls, batch_size: int, batch_wait: float, capacity: int):
+        """Aktiviert den Async-Modus mit Ring-Buffern pro Thread"""
+        if cls._overflow_policy not in (OverflowPolicy.DROP_NEWEST, OverflowPolicy.DROP_OLDEST):
+            raise ValueError(
+                "AsyncTransport.RING_BUFFER unterstützt nur DROP_NEWEST und DROP_OLDEST"
+            )
+        
+        ring = _RingBufferTransport(
+            capacity,
+            drop_newest=cls._overflow_policy is OverflowPolicy.DROP_NEWEST
+        )
+        cls._async_queue = None
+        cls._async_ring = ring
+        cls._shutdown_event.clear()
+        
+        # Producer wecken den Worker nicht (kein Lock) -> Polling im Leerlauf
+        idle_wait = batch_wait or 0.001
+        
+        def worker():
+            while not cls._shutdown_event.is_set() and cls._async_ring is ring:
+                batch = ring.drain(batch_size)
+                if not batch:
+                    ring.done()
+                    cls._shutdown_event.wait(idle_wait)
                     continue
+                try:
+                    cls._process_batch_sync(batch)
+                finally:
+                    ring.done()
         
         cls._async_worker = threading.Thread(target=worker, daemon=True)
         cls._async_worker.start()
@@ -678,7 +3394,7 @@ class EnhancedLogger:
         level_str = os.getenv('LOG_LEVEL', '').upper()
         if level_str:
             try:
-                cls.min_level = LogLevel[level_str]
+                cls.set_level(LogLevel[level_str])
             except KeyError:
                 pass
         
@@ -691,7 +3407,7 @@ class EnhancedLogger:
         format_str = os.getenv('LOG_FORMAT', '').upper()
         if format_str:
             try:
-                cls.format_type = LogFormat[format_str]
+                cls.set_format(LogFormat[format_str])
             except KeyError:
                 pass
         
@@ -709,12 +3425,77 @@ class EnhancedLogger:
         """Fügt einen Handler hinzu"""
         with cls._lock:
             cls._handlers.append(handler)
+            cls._apply_format([handler])
+    
+    @classmethod
+    def set_format(cls, format_type: LogFormat):
+        """Setzt das globale Ausgabe-Format für Handler ohne eigenen Formatter"""
+        with cls._lock:
+            cls.format_type = format_type
+            cls._apply_format()
+    
+    @classmethod
+    def _apply_format(cls, handlers: Optional[List[LogHandler]] = None):
+        """Überträgt den einmalig kompilierten Formatter auf die Handler"""
+        if cls.format_type == LogFormat.STANDARD:
+            formatter = None
+        else:
+            formatter = get_formatter(cls.format_type)
+        
+        for handler in cls._handlers if handlers is None else handlers:
+            if hasattr(handler, 'default_formatter'):
+                handler.default_formatter = formatter
     
     @classmethod
     def add_filter(cls, filter: LogFilter):
         """Fügt einen Filter hinzu"""
         with cls._lock:
             cls._filters.append(filter)
+            cls._update_level_gate()
+    
+    @classmethod
+    def set_level(cls, level: LogLevel):
+        """Setzt das Minimum-Level zur Laufzeit (inkl. Standard-LevelFilter)"""
+        with cls._lock:
+            cls.min_level = level
+            if cls._level_filter is not None:
+                cls._level_filter.min_level = level
+            cls._update_level_gate()
+    
+    @classmethod
+    def _update_level_gate(cls):
+        """Berechnet das effektive Minimum-Level neu
+        
+        Muss nach jeder Änderung an min_level oder den LevelFiltern
+        aufgerufen werden.
+        """
+        gate = int(cls.min_level)
+        for f in cls._filters:
+            if isinstance(f, LevelFilter):
+                gate = max(gate, int(f.min_level))
+        cls._level_gate = gate
+    
+    @classmethod
+    def is_enabled_for(cls,
+                       level: LogLevel,
+                       category: Optional[Union[Category, str]] = None) -> bool:
+        """Prüft ob ein Level (und optional eine Kategorie) geloggt würde
+        
+        Nützlich, um teure Message-Erzeugung zu überspringen:
+        
+            if logger.is_enabled_for(LogLevel.DEBUG, C.CORE.DB):
+                logger.debug(C.CORE.DB, expensive_dump())
+        """
+        if not cls.enabled or level < cls._level_gate:
+            return False
+        
+        if category is not None:
+            category_str = category.value if isinstance(category, Category) else str(category)
+            for f in cls._filters:
+                if isinstance(f, CategoryFilter) and not f.allows_category(category_str):
+                    return False
+        
+        return True
     
     @classmethod
     def remove_handler(cls, handler: LogHandler):
@@ -722,56 +3503,134 @@ class EnhancedLogger:
         with cls._lock:
             if handler in cls._handlers:
                 cls._handlers.remove(handler)
+            cls._metrics.drop_stats(handler)
     
     @classmethod
-    def enable_redaction(cls, patterns: Optional[List[str]] = None):
-        """Aktiviert Sensitive-Data Redaction"""
-        cls._redact_enabled = True
-        
-        default_patterns = [
-            r'\b\d{13,19}\b',  # Kreditkarten
-            r'\b\d{3}-\d{2}-\d{4}\b',  # SSN
-            r'password["\s:=]+\S+',
-            r'api[_-]?key["\s:=]+\S+',
-            r'secret["\s:=]+\S+',
-            r'token["\s:=]+\S+',
-            r'Bearer\s+\S+',
-        ]
+    def enable_redaction(cls,
+                         patterns: Optional[List[str]] = None,
+                         keys: Optional[List[str]] = None,
+                         literals: Optional[List[str]] = None,
+                         cache_size: int = 1024):
+        """Aktiviert Sensitive-Data Redaction
         
-        patterns = patterns or default_patterns
-        cls._redact_patterns = [re.compile(p, re.IGNORECASE) for p in patterns]
+        Args:
+            patterns: Regex-Patterns (Standard: Kreditkarten, SSN, Passwörter,
+                API-Keys, Secrets, Tokens, Bearer)
+            keys: Schlüsselnamen(-teile), deren `extra`-Werte komplett
+                geschwärzt werden (Standard: password, token, api_key, ...)
+            literals: Stichwörter für den Vorfilter bei eigenen Patterns;
+                ohne wird jede Nachricht gescannt
+            cache_size: Anzahl gecachter Ergebnisse für wiederholte Nachrichten
+        """
+        redactor = _Redactor(patterns, keys, literals, cache_size)
+        with cls._lock:
+            cls._redactor = redactor
+            cls._redact_patterns = redactor.patterns
+            cls._redact_enabled = True
+            # Tracebacks werden lazy formatiert und dabei geschwärzt
+            _EXCEPTIONS.redact = redactor.redact
+            _EXCEPTIONS.clear()
+    
+    @classmethod
+    def disable_redaction(cls):
+        """Deaktiviert Sensitive-Data Redaction"""
+        with cls._lock:
+            cls._redact_enabled = False
+            _EXCEPTIONS.redact = None
+            _EXCEPTIONS.clear()
     
     @classmethod
     def _redact_message(cls, message: str) -> str:
         """Entfernt sensible Daten"""
         if not cls._redact_enabled:
             return message
+        return cls._redactor.redact(message)
+    
+    @classmethod
+    def configure_caller_info(cls,
+                              enabled: bool = True,
+                              min_level: LogLevel = LogLevel.TRACE,
+                              stack_offset: int = 0):
+        """Konfiguriert die Ermittlung von Datei/Zeile/Funktion des Aufrufers
         
-        for pattern in cls._redact_patterns:
-            message = pattern.sub('[REDACTED]', message)
-        return message
+        Args:
+            enabled: Caller-Info komplett an/aus
+            min_level: Caller-Info nur ab diesem Level (z.B. LogLevel.WARN)
+            stack_offset: Zusätzlich zu überspringende Frames für eigene
+                Wrapper-Funktionen außerhalb dieses Moduls
+        """
+        with cls._lock:
+            cls._caller_info_enabled = enabled
+            cls._caller_info_min_level = min_level
+            cls._caller_stack_offset = max(0, stack_offset)
     
     @classmethod
-    def _get_caller_info(cls) -> Dict[str, Any]:
-        """Holt Informationen über den Aufrufer"""
+    def _get_caller_info(cls, level: LogLevel = LogLevel.TRACE) -> Dict[str, Any]:
+        """Holt Informationen über den Aufrufer
+        
+        Läuft per sys._getframe die Frames nach außen und überspringt alle
+        Logger-internen Frames (auch von Subklassen wie AuditLogger oder
+        eigenen Subklassen außerhalb dieses Moduls), statt
+        mit inspect.stack() den kompletten Stack samt Quelltext zu laden.
+        """
+        thread = threading.current_thread().name
+        
+        if not cls._caller_info_enabled or level < cls._caller_info_min_level:
+            return cls._empty_caller_info(thread)
+        
         try:
-            frame = inspect.stack()[4]  # 0=stack, 1=_get_caller, 2=_log, 3=public, 4=caller
+            frame = sys._getframe(1)
+            while frame is not None and (frame.f_code.co_filename in _INTERNAL_SOURCE_FILES
+                                         or frame.f_code in _INTERNAL_CODE):
+                frame = frame.f_back
+            for _ in range(cls._caller_stack_offset):
+                if frame is None or frame.f_back is None:
+                    break
+                frame = frame.f_back
+            
+            if frame is None:
+                return cls._empty_caller_info(thread)
+            
+            code = frame.f_code
+            location = cls._caller_cache.get(code)
+            if location is None:
+                if len(cls._caller_cache) >= cls._caller_cache_max_size:
+                    cls._caller_cache.clear()
+                location = (os.path.basename(code.co_filename), code.co_name)
+                cls._caller_cache[code] = location
+            
             return {
-                "file": Path(frame.filename).name,
-                "line": frame.lineno,
-                "function": frame.function,
-                "thread": threading.current_thread().name
+                "file": location[0],
+                "line": frame.f_lineno,
+                "function": location[1],
+                "thread": thread
             }
-        except:
-            return {"file": "", "line": 0, "function": "", "thread": ""}
+        except Exception:
+            return cls._empty_caller_info(thread)
+    
+    @classmethod
+    def _empty_caller_info(cls, thread: str) -> Dict[str, Any]:
+        """Geteilte, unveränderliche Metadaten ohne Aufrufer (pro Thread-Name)"""
+        info = cls._no_caller_info.get(thread)
+        if info is None:
+            if len(cls._no_caller_info) >= cls._caller_cache_max_size:
+                cls._no_caller_info.clear()
+            info = MappingProxyType({"file": "", "line": 0, "function": "", "thread": thread})
+            cls._no_caller_info[thread] = info
+        return info
     
     @classmethod
     def _create_entry(cls,
                       level: LogLevel,
                       category: Union[Category, str],
                       message: str,
-                      extra: Optional[Dict] = None) -> LogEntry:
-        """Erstellt einen Log-Eintrag"""
+                      extra: Optional[Dict] = None,
+                      args: Optional[tuple] = None) -> LogEntry:
+        """Erstellt einen Log-Eintrag
+        
+        Mit `args` bleibt `message` ein Template (oder Callable); es wird erst
+        nach dem Filtern eingesetzt und dann redactiert.
+        """
         
         # Kategorie normalisieren
         if isinstance(category, Category):
@@ -779,23 +3638,28 @@ class EnhancedLogger:
         else:
             category_str = str(category)
         
-        # Message redactieren
-        message = cls._redact_message(message)
+        # Message und extra redactieren
+        if cls._redact_enabled:
+            if args is None:
+                message = cls._redactor.redact(message)
+            if extra:
+                extra = cls._redactor.redact_fields(extra)
         
         # Metadata sammeln
-        metadata = cls._get_caller_info()
+        metadata = cls._get_caller_info(level)
         
         # Entry erstellen
         return LogEntry(
-            timestamp=datetime.now(),
+            timestamp=time.time(),
             level=level,
             category=category_str,
             message=message,
             metadata=metadata,
-            extra=extra or {},
-            context=list(cls._context_stack),
-            trace_id=cls._trace_id,
-            correlation_id=cls._correlation_id
+            extra=extra,
+            context=_CONTEXT_STACK.get(),
+            trace_id=_TRACE_ID.get(),
+            correlation_id=_CORRELATION_ID.get(),
+            args=args
         )
     
     @classmethod
@@ -813,175 +3677,438 @@ class EnhancedLogger:
     @classmethod
     def _process_entry(cls, entry: LogEntry):
         """Verarbeitet einen Log-Eintrag"""
-        start_time = time.perf_counter()
+        collect = cls.collect_metrics
+        aio = cls._asyncio_transport
+        if aio is not None and aio.closed:
+            # Loop beendet/geschlossen: zurück auf den bisherigen Modus
+            cls._detach_asyncio(aio)
+            aio = None
         
-        if cls._async_queue:
+        if collect:
+            start_time = time.perf_counter()
+            if cls._async_queue is not None or cls._async_ring is not None or aio is not None:
+                # Für Queue-Wartezeit und End-to-End-Latenz im Worker
+                entry._queued_at = start_time
+        
+        if cls._mp_child:
+            # Multiprocess Mode: an den Writer-Prozess senden
+            cls._ship_to_writer(entry)
+        elif aio is not None:
+            # asyncio Mode (loop-gebundener Puffer + Drain-Task)
+            dropped = aio.put(entry)
+            if dropped is not None:
+                cls._record_drop(dropped, "drop_newest" if aio.drop_newest else "drop_oldest")
+        elif cls._async_ring is not None:
+            # Async Mode (Ring-Buffer pro Thread)
+            dropped = cls._async_ring.put(entry)
+            if dropped is not None:
+                cls._record_drop(
+                    dropped,
+                    "drop_newest" if cls._async_ring.drop_newest else "drop_oldest"
+                )
+        elif cls._async_queue:
             # Async Mode
-            try:
-                cls._async_queue.put_nowait(entry)
-            except queue.Full:
-                cls._metrics.dropped_logs += 1
+            cls._enqueue_async(entry)
         else:
             # Sync Mode
             cls._process_entry_sync(entry)
-        
-        # Performance Tracking
-        process_time = time.perf_counter() - start_time
-        cls._process_times.append(process_time)
+            if collect:
+                cls._metrics.end_to_end_latency.record(time.perf_counter() - start_time)
         
         # Metriken aktualisieren
-        cls._update_metrics(entry, process_time)
+        if collect:
+            cls._update_metrics(entry, time.perf_counter() - start_time)
+    
+    @classmethod
+    def _enqueue_async(cls, entry: LogEntry):
+        """Reiht einen Eintrag gemäß Overflow-Policy in die Async-Queue ein"""
+        q = cls._async_queue
+        policy = cls._overflow_policy
+        
+        try:
+            q.put_nowait(entry)
+            return
+        except queue.Full:
+            pass
+        
+        if policy is OverflowPolicy.DROP_NEWEST:
+            cls._record_drop(entry, "drop_newest")
+            return
+        
+        if policy is OverflowPolicy.BLOCK:
+            try:
+                q.put(entry, timeout=cls._overflow_timeout)
+            except queue.Full:
+                cls._record_drop(entry, "block_timeout")
+            return
+        
+        priority = policy is OverflowPolicy.PRIORITY
+        reason = "priority_evicted" if priority else "drop_oldest"
+        try:
+            q.put_evicting(entry, priority=priority,
+                           on_evict=lambda evicted: cls._record_drop(evicted, reason))
+        except queue.Full:
+            # Nur PRIORITY: nichts Niedrigeres zum Verdrängen vorhanden
+            if entry.level >= cls._overflow_protect_level:
+                try:
+                    q.put(entry, timeout=cls._overflow_timeout)
+                    return
+                except queue.Full:
+                    pass
+            cls._record_drop(entry, "priority_rejected")
+    
+    @classmethod
+    def _record_drop(cls, entry: LogEntry, reason: str):
+        """Zählt einen verworfenen Eintrag"""
+        with cls._metrics_lock:
+            cls._metrics.dropped_logs += 1
+            cls._metrics.dropped_by_policy[reason] += 1
+            cls._metrics.dropped_by_level[entry.level] += 1
     
     @classmethod
     def _process_entry_sync(cls, entry: LogEntry):
         """Verarbeitet einen Log-Eintrag synchron"""
+        collect = cls.collect_metrics
+        
         for handler in cls._handlers:
+            if collect:
+                start = time.perf_counter()
+            error = None
             try:
                 handler.handle(entry)
             except Exception as e:
                 # Handler-Fehler nicht nach oben propagieren
                 print(f"Handler error: {e}", file=sys.stderr)
+                error = e
+            if collect:
+                cls._record_handler(handler, time.perf_counter() - start, 1, error)
+    
+    @classmethod
+    def _process_batch_sync(cls, entries: List[LogEntry]):
+        """Verarbeitet mehrere Log-Einträge, gebündelt wo der Handler es kann"""
+        collect = cls.collect_metrics
+        metrics = cls._metrics
+        
+        if collect:
+            # Wartezeit in der Async-Queue
+            dequeued = time.perf_counter()
+            for entry in entries:
+                queued_at = getattr(entry, '_queued_at', None)
+                if queued_at is not None:
+                    metrics.queue_wait_latency.record(dequeued - queued_at)
+        
+        for handler in cls._handlers:
+            if collect:
+                start = time.perf_counter()
+            error = None
+            try:
+                handle_batch = getattr(handler, 'handle_batch', None)
+                if handle_batch is not None:
+                    handle_batch(entries)
+                else:
+                    for entry in entries:
+                        handler.handle(entry)
+            except Exception as e:
+                # Handler-Fehler nicht nach oben propagieren
+                print(f"Handler error: {e}", file=sys.stderr)
+                error = e
+            if collect:
+                cls._record_handler(handler, time.perf_counter() - start, len(entries), error)
+        
+        if collect:
+            done = time.perf_counter()
+            for entry in entries:
+                queued_at = getattr(entry, '_queued_at', None)
+                if queued_at is not None:
+                    metrics.end_to_end_latency.record(done - queued_at)
+    
+    @classmethod
+    def _record_handler(cls,
+                        handler: LogHandler,
+                        elapsed: float,
+                        entries: int,
+                        error: Optional[BaseException] = None):
+        """Erfasst Dauer und Fehler eines Handler-Aufrufs"""
+        stats = cls._metrics.stats_for(handler)
+        with cls._metrics_lock:
+            stats.calls += 1
+            stats.entries += entries
+            stats.total_time += elapsed
+            if elapsed > stats.max_time:
+                stats.max_time = elapsed
+            if error is not None:
+                stats.errors += 1
+                stats.last_error = f"{type(error).__name__}: {error}"
+        # Batches anteilig pro Eintrag ins Histogramm
+        stats.latency.record(elapsed / entries, count=entries)
+        
+        threshold = cls._slow_handler_threshold
+        if threshold is not None and elapsed >= threshold:
+            cls._report_slow_handler(handler, elapsed, entries)
+    
+    @classmethod
+    def set_slow_handler_threshold(cls, threshold_ms: Optional[float]):
+        """Meldet Handler-Aufrufe ab dieser Dauer als METRIC-Eintrag (None = aus)"""
+        cls._slow_handler_threshold = threshold_ms / 1000 if threshold_ms else None
+    
+    @classmethod
+    def _report_slow_handler(cls, handler: LogHandler, elapsed: float, entries: int):
+        """Erzeugt einen Selbstdiagnose-Eintrag für einen langsamen Handler
+        
+        Höchstens eine Meldung pro Handler und Sekunde; Meldungen, die
+        selbst wieder langsam sind, lösen keine weitere Meldung aus.
+        """
+        if getattr(cls._diagnostic_state, 'active', False):
+            return
+        
+        now = time.monotonic()
+        stats = cls._metrics.stats_for(handler)
+        if now - stats.slow_reported_at < 1.0:
+            return
+        stats.slow_reported_at = now
+        
+        label = _handler_labels(list(cls._handlers)).get(id(handler), type(handler).__name__)
+        cls._diagnostic_state.active = True
+        try:
+            cls.metric(
+                Category.PERFORMANCE,
+                f"Slow handler {label}: {elapsed * 1000:.2f}ms for {entries} entries",
+                handler=label,
+                duration_ms=round(elapsed * 1000, 3),
+                entries=entries
+            )
+        finally:
+            cls._diagnostic_state.active = False
     
     @classmethod
     def _update_metrics(cls, entry: LogEntry, process_time: float):
-        """Aktualisiert interne Metriken"""
-        cls._metrics.total_logs += 1
-        cls._metrics.logs_by_level[entry.level] += 1
-        cls._metrics.logs_by_category[entry.category] += 1
-        
-        if entry.level >= LogLevel.ERROR:
-            cls._metrics.error_count += 1
-        elif entry.level == LogLevel.WARN:
-            cls._metrics.warning_count += 1
-        
-        # Durchschnittliche Verarbeitungszeit
-        if cls._process_times:
-            cls._metrics.average_process_time = sum(cls._process_times) / len(cls._process_times)
-        
-        # Peak Logs pro Sekunde
-        now = time.time()
-        cls._log_timestamps.append(now)
-        
-        if len(cls._log_timestamps) > 1:
-            time_span = cls._log_timestamps[-1] - cls._log_timestamps[0]
-            if time_span > 0:
-                current_rate = len(cls._log_timestamps) / time_span
-                cls._metrics.peak_logs_per_second = max(
-                    cls._metrics.peak_logs_per_second,
-                    current_rate
-                )
+        """Aktualisiert interne Metriken (O(1), thread-sicher)"""
+        level = entry.level
+        
+        with cls._metrics_lock:
+            metrics = cls._metrics
+            metrics.total_logs += 1
+            metrics.logs_by_level[level] += 1
+            metrics.logs_by_category[entry.category] += 1
+            
+            if level >= _LVL_ERROR:
+                metrics.error_count += 1
+            elif level == _LVL_WARN:
+                metrics.warning_count += 1
+            
+            # Durchschnittliche Verarbeitungszeit (laufende Fenster-Summe)
+            times = cls._process_times
+            if len(times) == times.maxlen:
+                cls._process_time_sum -= times[0]
+            times.append(process_time)
+            cls._process_time_sum += process_time
+            metrics.average_process_time = max(0.0, cls._process_time_sum) / len(times)
+            
+            # Aktuelle & Peak Logs pro Sekunde (über die letzten 100 Einträge)
+            stamps = cls._log_timestamps
+            now = time.monotonic()
+            stamps.append(now)
+            
+            if len(stamps) > 1:
+                time_span = now - stamps[0]
+                if time_span > 0:
+                    current_rate = len(stamps) / time_span
+                    metrics.current_logs_per_second = current_rate
+                    if current_rate > metrics.peak_logs_per_second:
+                        metrics.peak_logs_per_second = current_rate
     
     @classmethod
     def _log(cls,
              level: LogLevel,
              category: Union[Category, str],
-             message: str,
+             message: Union[str, Callable[..., str]],
+             *args,
              exception: Optional[BaseException] = None,
              **kwargs):
-        """Zentrale Log-Methode"""
+        """Zentrale Log-Methode
         
-        # Exception-Handling
-        if exception:
-            trace = ''.join(traceback.format_exception(
-                type(exception), exception, exception.__traceback__
-            ))
-            message = f"{message}\n{trace}"
+        Mit Positionsargumenten oder einem Callable als `message` wird die
+        Nachricht lazy gebaut: erst wenn Level und Filter passiert sind und
+        genau einmal für alle Handler.
+        """
         
-        # Entry erstellen
-        entry = cls._create_entry(level, category, message, extra=kwargs)
+        # Fast Path: deaktivierte Levels vor jeder Allokation verwerfen
+        if level < cls._level_gate or not cls.enabled:
+            return
+        
+        # Entry erstellen (Exception wird erst beim Rendern formatiert)
+        if args or (type(message) is not str and callable(message)):
+            entry = cls._create_entry(level, category, message, extra=kwargs, args=args)
+        else:
+            entry = cls._create_entry(level, category, message, extra=kwargs)
+        if exception is not None:
+            entry.exception = exception
         
         # Filtern und verarbeiten
         if cls._should_log(entry):
+            if entry.args is not None:
+                # Einsetzen im aufrufenden Thread: veränderliche Argumente
+                # werden so mit ihrem Stand zum Log-Zeitpunkt festgehalten
+                entry.message = _render(entry._message, entry.args)
             cls._process_entry(entry)
     
+    @staticmethod
+    def _legacy_positional(message: Any, args: tuple, types: Union[type, tuple]) -> Any:
+        """Erkennt alte Aufrufe wie `error(kat, text, exc)` / `progress(kat, text, 50)`
+        
+        Ein einzelnes Argument des erwarteten Typs ist der frühere dritte
+        Parameter, kein Format-Argument: eine Exception immer (auch bei `%`
+        oder `{}` im Text, z.B. "100% failed"), eine Zahl nur bei einem
+        Template ohne Platzhalter.
+        """
+        if len(args) != 1 or not isinstance(args[0], types):
+            return None
+        if isinstance(args[0], BaseException):
+            return args[0]
+        if type(message) is str and _template_style(message) == _TEMPLATE_PLAIN:
+            return args[0]
+        return None
+    
     # ==========================================
     # PUBLIC LOGGING METHODS
     # ==========================================
     
     @classmethod
-    def trace(cls, category: Union[Category, str], message: str, **kwargs):
+    def trace(cls, category: Union[Category, str], message: str, *args, **kwargs):
         """Trace-Level Log"""
-        cls._log(LogLevel.TRACE, category, message, **kwargs)
+        if _LVL_TRACE < cls._level_gate:
+            return
+        cls._log(_LVL_TRACE, category, message, *args, **kwargs)
     
     @classmethod
-    def debug(cls, category: Union[Category, str], message: str, **kwargs):
+    def debug(cls, category: Union[Category, str], message: str, *args, **kwargs):
         """Debug-Level Log"""
-        cls._log(LogLevel.DEBUG, category, message, **kwargs)
+        if _LVL_DEBUG < cls._level_gate:
+            return
+        cls._log(_LVL_DEBUG, category, message, *args, **kwargs)
     
     @classmethod
-    def info(cls, category: Union[Category, str], message: str, **kwargs):
+    def info(cls, category: Union[Category, str], message: str, *args, **kwargs):
         """Info-Level Log"""
-        cls._log(LogLevel.INFO, category, message, **kwargs)
+        if _LVL_INFO < cls._level_gate:
+            return
+        cls._log(_LVL_INFO, category, message, *args, **kwargs)
     
     @classmethod
-    def success(cls, category: Union[Category, str], message: str, **kwargs):
+    def success(cls, category: Union[Category, str], message: str, *args, **kwargs):
         """Success-Level Log"""
-        cls._log(LogLevel.SUCCESS, category, message, **kwargs)
+        if _LVL_SUCCESS < cls._level_gate:
+            return
+        cls._log(_LVL_SUCCESS, category, message, *args, **kwargs)
     
     @classmethod
-    def loading(cls, category: Union[Category, str], message: str, **kwargs):
+    def loading(cls, category: Union[Category, str], message: str, *args, **kwargs):
         """Loading-Level Log"""
-        cls._log(LogLevel.LOADING, category, message, **kwargs)
+        if _LVL_LOADING < cls._level_gate:
+            return
+        cls._log(_LVL_LOADING, category, message, *args, **kwargs)
     
     @classmethod
-    def processing(cls, category: Union[Category, str], message: str, **kwargs):
+    def processing(cls, category: Union[Category, str], message: str, *args, **kwargs):
         """Processing-Level Log"""
-        cls._log(LogLevel.PROCESSING, category, message, **kwargs)
+        if _LVL_PROCESSING < cls._level_gate:
+            return
+        cls._log(_LVL_PROCESSING, category, message, *args, **kwargs)
     
     @classmethod
-    def progress(cls, category: Union[Category, str], message: str, percent: Optional[float] = None, **kwargs):
+    def progress(cls, category: Union[Category, str], message: str, *args,
+                 percent: Optional[float] = None, **kwargs):
         """Progress-Level Log mit optionalem Prozentsatz"""
+        if _LVL_PROGRESS < cls._level_gate:
+            return
+        if percent is None and args:
+            percent = cls._legacy_positional(message, args, (int, float))
+            if percent is not None:
+                args = ()
         if percent is not None:
+            if args or type(message) is not str:
+                # Suffix nicht ins Template mischen (`%` wäre ein Platzhalter)
+                message, args = _interpolate(message, args), ()
             message = f"{message} ({percent:.1f}%)"
-        cls._log(LogLevel.PROGRESS, category, message, **kwargs)
+        cls._log(_LVL_PROGRESS, category, message, *args, **kwargs)
     
     @classmethod
-    def waiting(cls, category: Union[Category, str], message: str, **kwargs):
+    def waiting(cls, category: Union[Category, str], message: str, *args, **kwargs):
         """Waiting-Level Log"""
-        cls._log(LogLevel.WAITING, category, message, **kwargs)
+        if _LVL_WAITING < cls._level_gate:
+            return
+        cls._log(_LVL_WAITING, category, message, *args, **kwargs)
     
     @classmethod
-    def notice(cls, category: Union[Category, str], message: str, **kwargs):
+    def notice(cls, category: Union[Category, str], message: str, *args, **kwargs):
         """Notice-Level Log"""
-        cls._log(LogLevel.NOTICE, category, message, **kwargs)
+        if _LVL_NOTICE < cls._level_gate:
+            return
+        cls._log(_LVL_NOTICE, category, message, *args, **kwargs)
     
     @classmethod
-    def warn(cls, category: Union[Category, str], message: str, **kwargs):
+    def warn(cls, category: Union[Category, str], message: str, *args, **kwargs):
         """Warning-Level Log"""
-        cls._log(LogLevel.WARN, category, message, **kwargs)
+        if _LVL_WARN < cls._level_gate:
+            return
+        cls._log(_LVL_WARN, category, message, *args, **kwargs)
     
     @classmethod
-    def error(cls, category: Union[Category, str], message: str, 
+    def error(cls, category: Union[Category, str], message: str, *args,
               exception: Optional[BaseException] = None, **kwargs):
         """Error-Level Log"""
-        cls._log(LogLevel.ERROR, category, message, exception=exception, **kwargs)
+        if _LVL_ERROR < cls._level_gate:
+            return
+        if exception is None and args:
+            exception = cls._legacy_positional(message, args, BaseException)
+            if exception is not None:
+                args = ()
+        cls._log(_LVL_ERROR, category, message, *args, exception=exception, **kwargs)
     
     @classmethod
-    def critical(cls, category: Union[Category, str], message: str,
+    def critical(cls, category: Union[Category, str], message: str, *args,
                  exception: Optional[BaseException] = None, **kwargs):
         """Critical-Level Log"""
-        cls._log(LogLevel.CRITICAL, category, message, exception=exception, **kwargs)
+        if _LVL_CRITICAL < cls._level_gate:
+            return
+        if exception is None and args:
+            exception = cls._legacy_positional(message, args, BaseException)
+            if exception is not None:
+                args = ()
+        cls._log(_LVL_CRITICAL, category, message, *args, exception=exception, **kwargs)
     
     @classmethod
-    def fatal(cls, category: Union[Category, str], message: str,
+    def fatal(cls, category: Union[Category, str], message: str, *args,
               exception: Optional[BaseException] = None, **kwargs):
         """Fatal-Level Log"""
-        cls._log(LogLevel.FATAL, category, message, exception=exception, **kwargs)
+        if _LVL_FATAL < cls._level_gate:
+            return
+        if exception is None and args:
+            exception = cls._legacy_positional(message, args, BaseException)
+            if exception is not None:
+                args = ()
+        cls._log(_LVL_FATAL, category, message, *args, exception=exception, **kwargs)
     
     @classmethod
-    def security(cls, category: Union[Category, str], message: str, **kwargs):
+    def security(cls, category: Union[Category, str], message: str, *args, **kwargs):
         """Security-Level Log"""
-        cls._log(LogLevel.SECURITY, category, message, **kwargs)
+        if _LVL_SECURITY < cls._level_gate:
+            return
+        cls._log(_LVL_SECURITY, category, message, *args, **kwargs)
     
     @classmethod
-    def audit(cls, category: Union[Category, str], message: str, **kwargs):
+    def audit(cls, category: Union[Category, str], message: str, *args, **kwargs):
         """Audit-Level Log"""
-        cls._log(LogLevel.AUDIT, category, message, **kwargs)
+        if _LVL_AUDIT < cls._level_gate:
+            return
+        cls._log(_LVL_AUDIT, category, message, *args, **kwargs)
     
     @classmethod
-    def metric(cls, category: Union[Category, str], message: str, **kwargs):
+    def metric(cls, category: Union[Category, str], message: str, *args, **kwargs):
         """Metric-Level Log"""
-        cls._log(LogLevel.METRIC, category, message, **kwargs)
+        if _LVL_METRIC < cls._level_gate:
+            return
+        cls._log(_LVL_METRIC, category, message, *args, **kwargs)
     
     # ==========================================
     # CONTEXT MANAGEMENT
@@ -989,43 +4116,46 @@ class EnhancedLogger:
     
     @classmethod
     def push_context(cls, context: str):
-        """Fügt einen Kontext zum Stack hinzu"""
-        with cls._lock:
-            cls._context_stack.append(context)
+        """Fügt einen Kontext zum Stack hinzu (nur für aktuellen Thread/Task)"""
+        _CONTEXT_STACK.set(_CONTEXT_STACK.get() + (context,))
     
     @classmethod
     def pop_context(cls) -> Optional[str]:
         """Entfernt den obersten Kontext vom Stack"""
-        with cls._lock:
-            if cls._context_stack:
-                return cls._context_stack.pop()
+        stack = _CONTEXT_STACK.get()
+        if not stack:
             return None
+        _CONTEXT_STACK.set(stack[:-1])
+        return stack[-1]
     
     @classmethod
-    @contextmanager
-    def context(cls, context: str):
-        """Context Manager für temporären Kontext"""
-        cls.push_context(context)
-        try:
-            yield
-        finally:
-            cls.pop_context()
+    def context(cls,
+                context: Optional[str] = None,
+                trace_id: Optional[str] = None,
+                correlation_id: Optional[str] = None) -> _LogContext:
+        """Context Manager für temporären Kontext (`with` und `async with`)"""
+        return _LogContext(context, trace_id, correlation_id)
+    
+    @classmethod
+    def get_context(cls) -> tuple:
+        """Aktueller Kontext-Stack (äußerster zuerst)"""
+        return _CONTEXT_STACK.get()
     
     @classmethod
     def set_trace_id(cls, trace_id: str):
         """Setzt eine Trace-ID für Distributed Tracing"""
-        cls._trace_id = trace_id
+        _TRACE_ID.set(trace_id)
     
     @classmethod
     def set_correlation_id(cls, correlation_id: str):
         """Setzt eine Correlation-ID für Request-Tracking"""
-        cls._correlation_id = correlation_id
+        _CORRELATION_ID.set(correlation_id)
     
     @classmethod
     def clear_tracing(cls):
         """Löscht alle Tracing-IDs"""
-        cls._trace_id = None
-        cls._correlation_id = None
+        _TRACE_ID.set(None)
+        _CORRELATION_ID.set(None)
     
     # ==========================================
     # PERFORMANCE & METRICS
@@ -1034,14 +4164,16 @@ class EnhancedLogger:
     @classmethod
     def get_metrics(cls) -> Dict[str, Any]:
         """Gibt aktuelle Metriken zurück"""
-        return cls._metrics.to_dict()
+        with cls._metrics_lock:
+            return cls._metrics.to_dict()
     
     @classmethod
     def reset_metrics(cls):
         """Setzt Metriken zurück"""
-        with cls._lock:
+        with cls._metrics_lock:
             cls._metrics = LogMetrics()
             cls._process_times.clear()
+            cls._process_time_sum = 0.0
             cls._log_timestamps.clear()
     
     @classmethod
@@ -1070,32 +4202,423 @@ class EnhancedLogger:
     # ASYNC SUPPORT
     # ==========================================
     
+    @classmethod
+    def enable_asyncio(cls, batch_size: int = 256, queue_size: int = 10000):
+        """Aktiviert den asyncio-Modus für den laufenden Event-Loop
+        
+        Muss innerhalb des Loops aufgerufen werden (z.B. am Anfang von main()).
+        Log-Aufrufe legen Einträge dann nur in einen loop-gebundenen Puffer;
+        eine Drain-Task schreibt sie gebündelt, Handler mit
+        `async_handle_batch` (z.B. FileHandler) ohne den Loop zu blockieren.
+        Die `async_*` Methoden verzichten in diesem Modus auf den Executor.
+        
+        Overflow: DROP_OLDEST verwirft den ältesten Eintrag, alle anderen
+        Policies den neuesten.
+        """
+        loop = asyncio.get_running_loop()
+        with cls._lock:
+            cls._disable_asyncio()
+            cls._asyncio_transport = _AsyncioTransport(
+                loop,
+                queue_size,
+                batch_size,
+                drop_newest=cls._overflow_policy is not OverflowPolicy.DROP_OLDEST,
+                dispatch=cls._process_batch_async,
+                dispatch_sync=cls._process_batch_sync,
+            )
+    
+    @classmethod
+    def disable_asyncio(cls):
+        """Beendet den asyncio-Modus (Gepuffertes wird vorher geschrieben)"""
+        with cls._lock:
+            cls._drain_asyncio()
+            cls._disable_asyncio()
+    
+    @classmethod
+    def _disable_asyncio(cls):
+        """Stoppt die Drain-Task des asyncio-Modus"""
+        transport, cls._asyncio_transport = cls._asyncio_transport, None
+        if transport is None or transport.task.done():
+            return
+        if transport.loop.is_closed():
+            # Drain-Task kann nicht mehr laufen: Rest synchron schreiben
+            rest = transport.take_all()
+            if rest:
+                cls._process_batch_sync(rest)
+            return
+        if threading.get_ident() == transport._thread_id:
+            transport.task.cancel()
+        else:
+            try:
+                transport.loop.call_soon_threadsafe(transport.task.cancel)
+            except RuntimeError:
+                pass  # Loop bereits geschlossen
+    
+    @classmethod
+    def _detach_asyncio(cls, transport: _AsyncioTransport):
+        """Löst einen Transport, dessen Loop nicht mehr läuft, und schreibt den Rest"""
+        with cls._lock:
+            if cls._asyncio_transport is transport:
+                cls._asyncio_transport = None
+        rest = transport.take_all()
+        if rest:
+            cls._process_batch_sync(rest)
+    
+    @classmethod
+    def _drain_asyncio(cls, timeout: float = 5.0):
+        """Leert den asyncio-Puffer aus synchronem Code"""
+        transport = cls._asyncio_transport
+        if transport is None:
+            return
+        if transport.closed or threading.get_ident() == transport._thread_id:
+            # Auf dem Loop-Thread kann nicht auf die Drain-Task gewartet werden
+            rest = transport.take_all()
+            if rest:
+                cls._process_batch_sync(rest)
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(transport.join(), transport.loop).result(timeout)
+        except Exception:
+            pass  # Loop gestoppt oder Timeout
+    
+    @classmethod
+    async def _process_batch_async(cls, entries: List[LogEntry]):
+        """Wie _process_batch_sync, wartet aber auf `async_handle_batch`"""
+        collect = cls.collect_metrics
+        metrics = cls._metrics
+        
+        if collect:
+            dequeued = time.perf_counter()
+            for entry in entries:
+                queued_at = getattr(entry, '_queued_at', None)
+                if queued_at is not None:
+                    metrics.queue_wait_latency.record(dequeued - queued_at)
+        
+        for handler in list(cls._handlers):
+            if collect:
+                start = time.perf_counter()
+            error = None
+            try:
+                async_handle_batch = getattr(handler, 'async_handle_batch', None)
+                handle_batch = getattr(handler, 'handle_batch', None)
+                if async_handle_batch is not None:
+                    await async_handle_batch(entries)
+                elif handle_batch is not None:
+                    handle_batch(entries)
+                else:
+                    for entry in entries:
+                        handler.handle(entry)
+            except Exception as e:
+                # Handler-Fehler nicht nach oben propagieren
+                print(f"Handler error: {e}", file=sys.stderr)
+                error = e
+            if collect:
+                cls._record_handler(handler, time.perf_counter() - start, len(entries), error)
+        
+        if collect:
+            done = time.perf_counter()
+            for entry in entries:
+                queued_at = getattr(entry, '_queued_at', None)
+                if queued_at is not None:
+                    metrics.end_to_end_latency.record(done - queued_at)
+    
+    @classmethod
+    async def async_flush(cls):
+        """Awaitable flush(): wartet auf die Drain-Task und flushed die Handler"""
+        cls._flush_filters()
+        transport = cls._asyncio_transport
+        if transport is not None and not transport.task.done():
+            await transport.join()
+        
+        loop = asyncio.get_running_loop()
+        if cls._async_queue or cls._async_ring is not None:
+            await loop.run_in_executor(None, cls.flush)
+            return
+        
+        for handler in list(cls._handlers):
+            flush = getattr(handler, 'flush', None)
+            if flush is None:
+                continue
+            try:
+                # Handler-Flush kann blockieren (Datei, Netzwerk-Thread)
+                await loop.run_in_executor(None, flush)
+            except Exception as e:
+                print(f"Handler error: {e}", file=sys.stderr)
+    
+    @classmethod
+    async def _async_dispatch(cls, log_method: Callable, *args, **kwargs):
+        """Im asyncio-Modus direkt (nur Enqueue), sonst über den Executor"""
+        if cls._asyncio_transport is not None:
+            log_method(*args, **kwargs)
+        else:
+            # Kontext/Tracing-IDs des Tasks in den Executor-Thread mitnehmen
+            await asyncio.get_running_loop().run_in_executor(
+                None, partial(contextvars.copy_context().run, log_method, *args, **kwargs)
+            )
+    
     @classmethod
     async def async_log(cls, 
                        level: LogLevel,
                        category: Union[Category, str],
                        message: str,
+                       *args,
                        **kwargs):
         """Asynchrone Log-Methode"""
-        await asyncio.get_event_loop().run_in_executor(
-            None, cls._log, level, category, message, None, **kwargs
-        )
+        if level < cls._level_gate or not cls.enabled:
+            return
+        await cls._async_dispatch(cls._log, level, category, message, *args, **kwargs)
     
     @classmethod
-    async def async_info(cls, category: Union[Category, str], message: str, **kwargs):
+    async def async_trace(cls, category: Union[Category, str], message: str, *args, **kwargs):
+        """Async Trace Log"""
+        if _LVL_TRACE < cls._level_gate:
+            return
+        await cls._async_dispatch(cls.trace, category, message, *args, **kwargs)
+    
+    @classmethod
+    async def async_debug(cls, category: Union[Category, str], message: str, *args, **kwargs):
+        """Async Debug Log"""
+        if _LVL_DEBUG < cls._level_gate:
+            return
+        await cls._async_dispatch(cls.debug, category, message, *args, **kwargs)
+    
+    @classmethod
+    async def async_info(cls, category: Union[Category, str], message: str, *args, **kwargs):
         """Async Info Log"""
-        await cls.async_log(LogLevel.INFO, category, message, **kwargs)
+        if _LVL_INFO < cls._level_gate:
+            return
+        await cls._async_dispatch(cls.info, category, message, *args, **kwargs)
+    
+    @classmethod
+    async def async_success(cls, category: Union[Category, str], message: str, *args, **kwargs):
+        """Async Success Log"""
+        if _LVL_SUCCESS < cls._level_gate:
+            return
+        await cls._async_dispatch(cls.success, category, message, *args, **kwargs)
+    
+    @classmethod
+    async def async_loading(cls, category: Union[Category, str], message: str, *args, **kwargs):
+        """Async Loading Log"""
+        if _LVL_LOADING < cls._level_gate:
+            return
+        await cls._async_dispatch(cls.loading, category, message, *args, **kwargs)
+    
+    @classmethod
+    async def async_processing(cls, category: Union[Category, str], message: str, *args, **kwargs):
+        """Async Processing Log"""
+        if _LVL_PROCESSING < cls._level_gate:
+            return
+        await cls._async_dispatch(cls.processing, category, message, *args, **kwargs)
+    
+    @classmethod
+    async def async_progress(cls, category: Union[Category, str], message: str, *args,
+                             percent: Optional[float] = None, **kwargs):
+        """Async Progress Log"""
+        if _LVL_PROGRESS < cls._level_gate:
+            return
+        await cls._async_dispatch(cls.progress, category, message, *args, percent=percent, **kwargs)
+    
+    @classmethod
+    async def async_waiting(cls, category: Union[Category, str], message: str, *args, **kwargs):
+        """Async Waiting Log"""
+        if _LVL_WAITING < cls._level_gate:
+            return
+        await cls._async_dispatch(cls.waiting, category, message, *args, **kwargs)
+    
+    @classmethod
+    async def async_notice(cls, category: Union[Category, str], message: str, *args, **kwargs):
+        """Async Notice Log"""
+        if _LVL_NOTICE < cls._level_gate:
+            return
+        await cls._async_dispatch(cls.notice, category, message, *args, **kwargs)
     
     @classmethod
-    async def async_error(cls, category: Union[Category, str], message: str, 
+    async def async_warn(cls, category: Union[Category, str], message: str, *args, **kwargs):
+        """Async Warn Log"""
+        if _LVL_WARN < cls._level_gate:
+            return
+        await cls._async_dispatch(cls.warn, category, message, *args, **kwargs)
+    
+    @classmethod
+    async def async_error(cls, category: Union[Category, str], message: str, *args,
                          exception: Optional[BaseException] = None, **kwargs):
         """Async Error Log"""
-        if exception:
-            trace = ''.join(traceback.format_exception(
-                type(exception), exception, exception.__traceback__
-            ))
-            message = f"{message}\n{trace}"
-        await cls.async_log(LogLevel.ERROR, category, message, **kwargs)
+        if _LVL_ERROR < cls._level_gate:
+            return
+        await cls._async_dispatch(cls.error, category, message, *args, exception=exception, **kwargs)
+    
+    @classmethod
+    async def async_critical(cls, category: Union[Category, str], message: str, *args,
+                             exception: Optional[BaseException] = None, **kwargs):
+        """Async Critical Log"""
+        if _LVL_CRITICAL < cls._level_gate:
+            return
+        await cls._async_dispatch(cls.critical, category, message, *args, exception=exception, **kwargs)
+    
+    @classmethod
+    async def async_fatal(cls, category: Union[Category, str], message: str, *args,
+                          exception: Optional[BaseException] = None, **kwargs):
+        """Async Fatal Log"""
+        if _LVL_FATAL < cls._level_gate:
+            return
+        await cls._async_dispatch(cls.fatal, category, message, *args, exception=exception, **kwargs)
+    
+    @classmethod
+    async def async_security(cls, category: Union[Category, str], message: str, *args, **kwargs):
+        """Async Security Log"""
+        if _LVL_SECURITY < cls._level_gate:
+            return
+        await cls._async_dispatch(cls.security, category, message, *args, **kwargs)
+    
+    @classmethod
+    async def async_audit(cls, category: Union[Category, str], message: str, *args, **kwargs):
+        """Async Audit Log"""
+        if _LVL_AUDIT < cls._level_gate:
+            return
+        await cls._async_dispatch(cls.audit, category, message, *args, **kwargs)
+    
+    @classmethod
+    async def async_metric(cls, category: Union[Category, str], message: str, *args, **kwargs):
+        """Async Metric Log"""
+        if _LVL_METRIC < cls._level_gate:
+            return
+        await cls._async_dispatch(cls.metric, category, message, *args, **kwargs)
+    
+    # ==========================================
+    # MULTIPROCESS SUPPORT
+    # ==========================================
+    
+    @classmethod
+    def enable_multiprocess(cls, queue_size: int = 10000, batch_size: int = 256):
+        """Aktiviert den Multiprocess-Modus für Pre-Fork Server
+        
+        Muss im Master-Prozess vor dem fork aufgerufen werden. Der Master
+        wird zum einzigen Writer: ein Listener-Thread empfängt die Einträge
+        aller geforkten Kind-Prozesse über eine multiprocessing.Queue und
+        reicht sie an die Handler des Masters (FileHandler, NetworkHandler,
+        ...) weiter. Kind-Prozesse filtern lokal und benutzen ihre eigenen
+        Handler nicht mehr, wodurch Rotation und Zeilen nicht mehr kollidieren.
+        """
+        with cls._lock:
+            if cls._mp_queue is not None:
+                return
+            
+            mp_queue = multiprocessing.Queue(maxsize=max(1, queue_size))
+            batch_size = max(1, batch_size)
+            
+            def listener():
+                while True:
+                    payload = mp_queue.get()
+                    if payload is None:
+                        return
+                    
+                    batch = [payload]
+                    while len(batch) < batch_size:
+                        try:
+                            payload = mp_queue.get_nowait()
+                        except queue.Empty:
+                            break
+                        if payload is None:
+                            cls._dispatch_shipped(batch)
+                            return
+                        batch.append(payload)
+                    
+                    cls._dispatch_shipped(batch)
+            
+            cls._mp_queue = mp_queue
+            cls._mp_child = False
+            cls._mp_listener = threading.Thread(
+                target=listener, name="EnhancedLogger-mp-listener", daemon=True
+            )
+            cls._mp_listener.start()
+    
+    @classmethod
+    def _ship_to_writer(cls, entry: LogEntry):
+        """Serialisiert einen Eintrag und sendet ihn an den Writer-Prozess"""
+        try:
+            payload = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            # Nicht picklebare Extras als repr() übertragen
+            entry.extra = {k: repr(v) for k, v in entry.extra.items()}
+            payload = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        
+        try:
+            cls._mp_queue.put_nowait(payload)
+        except queue.Full:
+            cls._record_drop(entry, "multiprocess_full")
+    
+    @classmethod
+    def _dispatch_shipped(cls, payloads: List[bytes]):
+        """Writer-Prozess: empfangene Einträge an die Handler übergeben"""
+        entries = []
+        for payload in payloads:
+            try:
+                entries.append(pickle.loads(payload))
+            except Exception as e:
+                print(f"Multiprocess decode error: {e}", file=sys.stderr)
+        if entries:
+            cls._process_batch_sync(entries)
+    
+    @classmethod
+    def _stop_multiprocess(cls):
+        """Beendet Listener (Master) bzw. leert die Sende-Queue (Kind)"""
+        mp_queue = cls._mp_queue
+        if mp_queue is None:
+            return
+        
+        if cls._mp_child:
+            mp_queue.close()
+            mp_queue.join_thread()
+        elif cls._mp_listener is not None:
+            mp_queue.put(None)
+            cls._mp_listener.join(timeout=5)
+        
+        cls._mp_queue = None
+        cls._mp_listener = None
+        cls._mp_child = False
+    
+    @classmethod
+    def _before_fork(cls):
+        """Flushed lokale Handler-Puffer, damit das Kind keine Daten doppelt schreibt
+        
+        Handler mit `_before_fork()` entscheiden selbst (NetworkHandler wartet
+        z.B. nicht auf einen evtl. nicht erreichbaren Endpunkt), alle anderen
+        werden per `flush()` geleert.
+        """
+        for handler in list(cls._handlers):
+            flush = getattr(handler, '_before_fork', None) or getattr(handler, 'flush', None)
+            if flush is None:
+                continue
+            try:
+                flush()
+            except Exception:
+                pass
+    
+    @classmethod
+    def _after_fork_in_child(cls):
+        """Setzt Locks, Worker-Threads und Sockets im Kind-Prozess neu auf"""
+        cls._lock = threading.RLock()
+        cls._metrics_lock = threading.Lock()
+        cls._diagnostic_state = threading.local()
+        cls._shutdown_event = threading.Event()
+        cls._async_worker = None
+        cls._asyncio_transport = None  # gehört zum Loop des Parents
+        cls.reset_metrics()  # Metriken (inkl. Histogramm-Locks) pro Prozess
+        
+        for component in [*cls._handlers, *cls._filters]:
+            reset = getattr(component, '_after_fork', None)
+            if reset is not None:
+                reset()
+        
+        if cls._mp_queue is not None:
+            cls._mp_child = True
+            cls._mp_listener = None
+            cls._async_queue = None
+            cls._async_ring = None
+        elif cls._async_config is not None and (
+            cls._async_queue is not None or cls._async_ring is not None
+        ):
+            cls._enable_async_mode(*cls._async_config)
     
     # ==========================================
     # UTILITY METHODS
@@ -1103,21 +4626,59 @@ class EnhancedLogger:
     
     @classmethod
     def flush(cls):
-        """Flushed alle gepufferten Logs"""
+        """Flushed alle gepufferten Logs (im asyncio-Modus: `await async_flush()`)"""
+        cls._flush_filters()
+        cls._drain_asyncio()
         if cls._async_queue:
             cls._async_queue.join()
+        if cls._async_ring is not None and cls._async_worker and cls._async_worker.is_alive():
+            cls._async_ring.join()
+        
+        for handler in list(cls._handlers):
+            flush = getattr(handler, 'flush', None)
+            if flush is None:
+                continue
+            try:
+                flush()
+            except Exception as e:
+                print(f"Handler error: {e}", file=sys.stderr)
+    
+    @classmethod
+    def _flush_filters(cls):
+        """Lässt Filter mit flush() offene Einträge ausgeben (z.B. RateLimitFilter)"""
+        for filter in list(cls._filters):
+            flush = getattr(filter, 'flush', None)
+            if flush is None:
+                continue
+            try:
+                flush()
+            except Exception as e:
+                print(f"Filter error: {e}", file=sys.stderr)
+    
+    @classmethod
+    def _close_handlers(cls, handlers: List[LogHandler]):
+        """Schließt Handler, die eine close()-Methode anbieten"""
+        for handler in handlers:
+            close = getattr(handler, 'close', None)
+            if close is None:
+                continue
+            try:
+                close()
+            except Exception as e:
+                print(f"Handler error: {e}", file=sys.stderr)
     
     @classmethod
     def shutdown(cls):
         """Fährt den Logger sauber herunter"""
         cls.flush()
-        
-        if cls._async_worker:
-            cls._shutdown_event.set()
-            cls._async_worker.join(timeout=5)
-        
+        cls._disable_asyncio()
+        cls._stop_async_mode()
+        cls._stop_multiprocess()
+        cls._close_handlers(cls._handlers)
         cls._handlers.clear()
         cls._filters.clear()
+        cls._level_filter = None
+        cls._update_level_gate()
     
     @classmethod
     def get_log_levels(cls) -> List[str]:
@@ -1323,6 +4884,13 @@ auto_init()
 # Cleanup bei Programmende
 atexit.register(EnhancedLogger.shutdown)
 
+# Fork-Sicherheit: Locks, Worker-Threads und Sockets im Kind neu aufsetzen
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(
+        before=EnhancedLogger._before_fork,
+        after_in_child=EnhancedLogger._after_fork_in_child
+    )
+
 
 # ==========================================
 # EXAMPLE USAGE
@@ -0,0 +1,33 @@
+import pytest
+
+from logger.logger import EnhancedLogger, LogLevel
+
+
+class CaptureHandler:
+    """Sammelt Einträge (und die gerenderten Nachrichten) für Assertions"""
+    
+    def __init__(self):
+        self.entries = []
+    
+    def handle(self, entry):
+        self.entries.append(entry)
+    
+    @property
+    def messages(self):
+        return [entry.message for entry in self.entries]
+
+
+@pytest.fixture
+def capture(monkeypatch):
+    """Logger ohne Konsole, alles ab TRACE, ein CaptureHandler"""
+    for name in ('LOG_LEVEL', 'LOG_FILE', 'LOG_FORMAT', 'LOG_SAMPLING_RATE'):
+        monkeypatch.delenv(name, raising=False)
+    
+    EnhancedLogger.initialize(min_level=LogLevel.TRACE, console=False)
+    EnhancedLogger.disable_redaction()
+    EnhancedLogger.clear_tracing()
+    handler = CaptureHandler()
+    EnhancedLogger.add_handler(handler)
+    yield handler
+    EnhancedLogger.shutdown()
+    EnhancedLogger.disable_redaction()
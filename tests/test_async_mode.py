@@ -0,0 +1,129 @@
+import threading
+import time
+
+import pytest
+
+from logger.logger import (
+    EnhancedLogger, Category, LogLevel, OverflowPolicy, AsyncTransport,
+    LogEntry, _LogQueue,
+)
+
+
+class SlowHandler:
+    """Langsamer Handler, der Aufrufe nach close() festhält"""
+    
+    def __init__(self, delay=0.0, gate=None):
+        self.delay = delay
+        self.gate = gate
+        self.messages = []
+        self.closed = False
+        self.after_close = 0
+    
+    def handle(self, entry):
+        if self.gate is not None:
+            self.gate.wait()
+        if self.delay:
+            time.sleep(self.delay)
+        if self.closed:
+            self.after_close += 1
+        self.messages.append(entry.message)
+    
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def async_logger(monkeypatch):
+    for name in ('LOG_LEVEL', 'LOG_FILE', 'LOG_FORMAT', 'LOG_SAMPLING_RATE'):
+        monkeypatch.delenv(name, raising=False)
+    
+    def start(**options):
+        options.setdefault('min_level', LogLevel.TRACE)
+        EnhancedLogger.initialize(console=False, async_mode=True, **options)
+    
+    yield start
+    EnhancedLogger.shutdown()
+
+
+@pytest.mark.parametrize('transport', [AsyncTransport.QUEUE, AsyncTransport.RING_BUFFER])
+def test_reinitialize_drains_old_queue_before_closing(async_logger, transport):
+    async_logger(async_transport=transport)
+    handler = SlowHandler(delay=0.001)
+    EnhancedLogger.add_handler(handler)
+    for i in range(50):
+        EnhancedLogger.info(Category.SYSTEM, "entry {}", i)
+    
+    EnhancedLogger.initialize(console=False, min_level=LogLevel.TRACE)
+    
+    assert handler.messages == [f"entry {i}" for i in range(50)]
+    assert handler.closed and handler.after_close == 0
+    assert EnhancedLogger._async_worker is None
+    assert EnhancedLogger._async_queue is None and EnhancedLogger._async_ring is None
+
+def test_drop_newest_counts_drops(async_logger):
+    gate = threading.Event()
+    async_logger(async_queue_size=2, async_overflow=OverflowPolicy.DROP_NEWEST)
+    handler = SlowHandler(gate=gate)
+    EnhancedLogger.add_handler(handler)
+    
+    for i in range(10):
+        EnhancedLogger.info(Category.SYSTEM, "m{}", i)
+    gate.set()
+    EnhancedLogger.flush()
+    
+    metrics = EnhancedLogger._metrics
+    assert len(handler.messages) + metrics.dropped_logs == 10
+    assert metrics.dropped_by_policy['drop_newest'] == metrics.dropped_logs > 0
+
+
+def test_drop_oldest_keeps_newest(async_logger):
+    gate = threading.Event()
+    async_logger(async_queue_size=3, async_overflow=OverflowPolicy.DROP_OLDEST)
+    handler = SlowHandler(gate=gate)
+    EnhancedLogger.add_handler(handler)
+    
+    EnhancedLogger.info(Category.SYSTEM, "first")
+    time.sleep(0.05)  # Worker hängt jetzt im Handler fest
+    for i in range(10):
+        EnhancedLogger.info(Category.SYSTEM, "m{}", i)
+    gate.set()
+    EnhancedLogger.flush()
+    
+    assert handler.messages == ["first", "m7", "m8", "m9"]
+    assert EnhancedLogger._metrics.dropped_by_policy['drop_oldest'] == 7
+
+
+def test_priority_evicts_lower_levels_first(async_logger):
+    gate = threading.Event()
+    async_logger(async_queue_size=3, async_overflow=OverflowPolicy.PRIORITY,
+                 async_block_timeout=0.0)
+    handler = SlowHandler(gate=gate)
+    EnhancedLogger.add_handler(handler)
+    
+    EnhancedLogger.info(Category.SYSTEM, "first")
+    time.sleep(0.05)
+    EnhancedLogger.debug(Category.SYSTEM, "debug")
+    EnhancedLogger.info(Category.SYSTEM, "info")
+    EnhancedLogger.warn(Category.SYSTEM, "warn")
+    EnhancedLogger.error(Category.SYSTEM, "error")
+    gate.set()
+    EnhancedLogger.flush()
+    
+    assert handler.messages == ["first", "info", "warn", "error"]
+    assert EnhancedLogger._metrics.dropped_by_level[LogLevel.DEBUG] == 1
+
+
+def test_eviction_is_counted_under_queue_lock():
+    q = _LogQueue(maxsize=1)
+    q.put_nowait(LogEntry(time.time(), LogLevel.DEBUG, Category.SYSTEM, "old"))
+    seen = []
+    
+    def on_evict(evicted):
+        seen.append((evicted.message, q.mutex.locked(), len(q.queue)))
+    
+    q.put_evicting(LogEntry(time.time(), LogLevel.INFO, Category.SYSTEM, "new"),
+                   priority=False, on_evict=on_evict)
+    
+    # Zum Zeitpunkt der Zählung ist der alte Eintrag raus, der neue noch nicht drin
+    assert seen == [("old", True, 0)]
+    assert q.get_nowait().message == "new"
@@ -0,0 +1,102 @@
+import asyncio
+import threading
+
+import pytest
+
+from logger.logger import EnhancedLogger, Category
+
+
+def test_entries_are_written_by_drain_task(capture):
+    async def main():
+        EnhancedLogger.enable_asyncio()
+        await EnhancedLogger.async_info(Category.SYSTEM, "async {}", 1)
+        EnhancedLogger.info(Category.SYSTEM, "sync")
+        await EnhancedLogger.async_flush()
+        return list(capture.messages)
+    
+    assert asyncio.run(main()) == ["async 1", "sync"]
+
+
+def test_asyncio_run_writes_pending_entries_on_cancel(capture):
+    async def main():
+        EnhancedLogger.enable_asyncio()
+        EnhancedLogger.info(Category.SYSTEM, "pending")
+    
+    asyncio.run(main())
+    assert capture.messages == ["pending"]
+
+
+@pytest.fixture
+def closed_loop():
+    """Loop, dessen Schließen ohne Abbruch der Drain-Task simuliert wird
+    
+    Danach wird die Drain-Task regulär abgebrochen und abgewartet, damit
+    keine verwaiste Task zurückbleibt.
+    """
+    loop = asyncio.new_event_loop()
+    
+    def raise_closed(*args, **kwargs):
+        raise RuntimeError("Event loop is closed")
+    
+    with pytest.MonkeyPatch.context() as patch:
+        def close():
+            patch.setattr(loop, 'is_closed', lambda: True)
+            patch.setattr(loop, 'call_soon_threadsafe', raise_closed)
+            patch.setattr(loop, 'call_soon', raise_closed)
+        
+        yield loop, close
+    
+    async def stop(tasks):
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    loop.run_until_complete(stop([t for t in asyncio.all_tasks(loop) if not t.done()]))
+    loop.close()
+
+
+def test_logging_after_loop_closed_falls_back_to_sync(capture, closed_loop):
+    loop, close = closed_loop
+    
+    async def main():
+        EnhancedLogger.enable_asyncio()
+        await asyncio.sleep(0)  # Drain-Task wartet jetzt auf dem Event
+        EnhancedLogger.info(Category.SYSTEM, "buffered")
+    
+    loop.run_until_complete(main())
+    close()  # Drain-Task wird nicht abgebrochen
+    
+    EnhancedLogger.info(Category.SYSTEM, "after close")
+    assert EnhancedLogger._asyncio_transport is None
+    assert capture.messages == ["buffered", "after close"]
+
+
+def test_put_on_closed_loop_from_other_thread(capture, closed_loop):
+    loop, close = closed_loop
+    
+    async def main():
+        EnhancedLogger.enable_asyncio()
+        await asyncio.sleep(0)
+    
+    loop.run_until_complete(main())
+    transport = EnhancedLogger._asyncio_transport
+    close()
+    
+    errors = []
+    
+    def log_from_thread():
+        try:
+            # Direkt über den Transport, wie ein Aufruf zwischen Prüfung und Schließen
+            entry = EnhancedLogger._create_entry(
+                EnhancedLogger.min_level, Category.SYSTEM, "from thread"
+            )
+            transport.put(entry)
+        except Exception as e:  # pragma: no cover - Fehlerfall
+            errors.append(e)
+    
+    thread = threading.Thread(target=log_from_thread)
+    thread.start()
+    thread.join()
+    
+    assert errors == []
+    assert capture.messages == ["from thread"]
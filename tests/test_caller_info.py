@@ -0,0 +1,63 @@
+import inspect
+import os
+
+import pytest
+
+from logger.logger import EnhancedLogger, Category
+
+
+THIS_FILE = os.path.basename(__file__)
+
+
+def here():
+    """Zeilennummer des Aufrufers"""
+    return inspect.currentframe().f_back.f_lineno
+
+
+class AppLogger(EnhancedLogger):
+    """Subklasse mit überschriebener Methode, die an die Basis delegiert"""
+    
+    @classmethod
+    def info(cls, category, message, *args, **kwargs):
+        kwargs.setdefault('app', 'demo')
+        super().info(category, message, *args, **kwargs)
+
+
+def log_event(message):
+    """Eigene Wrapper-Funktion um den Logger"""
+    EnhancedLogger.warn(Category.SYSTEM, message)
+
+
+@pytest.fixture
+def stack_offset():
+    yield EnhancedLogger.configure_caller_info
+    EnhancedLogger.configure_caller_info()
+
+
+def assert_caller(entry, line, function):
+    assert entry.metadata['file'] == THIS_FILE
+    assert entry.metadata['line'] == line
+    assert entry.metadata['function'] == function
+
+
+def test_direct_call(capture):
+    EnhancedLogger.info(Category.SYSTEM, "direct"); line = here()
+    
+    assert_caller(capture.entries[0], line, 'test_direct_call')
+
+
+def test_subclass_override_points_at_caller(capture):
+    AppLogger.info(Category.SYSTEM, "override"); line = here()
+    AppLogger.debug(Category.SYSTEM, "inherited"); line2 = here()
+    
+    assert capture.entries[0].extra == {'app': 'demo'}
+    assert_caller(capture.entries[0], line, 'test_subclass_override_points_at_caller')
+    assert_caller(capture.entries[1], line2, 'test_subclass_override_points_at_caller')
+
+
+def test_wrapper_with_stack_offset(capture, stack_offset):
+    stack_offset(stack_offset=1)
+    
+    log_event("wrapped"); line = here()
+    
+    assert_caller(capture.entries[0], line, 'test_wrapper_with_stack_offset')
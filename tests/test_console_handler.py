@@ -0,0 +1,30 @@
+import io
+
+from logger.logger import EnhancedLogger, Category, ConsoleHandler
+
+
+def make_stream():
+    raw = io.BytesIO()
+    return raw, io.TextIOWrapper(raw, encoding='utf-8', write_through=True)
+
+
+def test_bytes_written_counts_encoded_bytes(capture):
+    raw, stream = make_stream()
+    handler = ConsoleHandler(colorize=False, stream=stream)
+    EnhancedLogger.add_handler(handler)
+    
+    EnhancedLogger.info(Category.SYSTEM, "Grüße ✓")
+    EnhancedLogger.info(Category.SYSTEM, "ascii")
+    
+    assert handler.bytes_written == len(raw.getvalue())
+
+
+def test_batch_bytes_written_counts_encoded_bytes(capture):
+    raw, stream = make_stream()
+    handler = ConsoleHandler(colorize=False, stream=stream)
+    
+    for message in ("äöü", "日本語", "plain"):
+        EnhancedLogger.info(Category.SYSTEM, message)
+    handler.handle_batch(capture.entries)
+    
+    assert handler.bytes_written == len(raw.getvalue())
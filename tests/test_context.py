@@ -0,0 +1,81 @@
+import asyncio
+import threading
+
+from logger.logger import EnhancedLogger, Category
+
+
+def contexts_by_message(capture):
+    return {entry.message: entry.context for entry in capture.entries}
+
+
+def test_context_manager_restores_previous_stack(capture):
+    EnhancedLogger.push_context("outer")
+    with EnhancedLogger.context("inner"):
+        EnhancedLogger.info(Category.API, "nested")
+    EnhancedLogger.info(Category.API, "after")
+    
+    assert EnhancedLogger.pop_context() == "outer"
+    assert EnhancedLogger.pop_context() is None
+    assert contexts_by_message(capture) == {
+        "nested": ("outer", "inner"),
+        "after": ("outer",),
+    }
+
+
+def test_context_is_isolated_between_threads(capture):
+    barrier = threading.Barrier(4)
+    
+    def worker(name):
+        with EnhancedLogger.context(name):
+            barrier.wait()  # alle Threads haben ihren Kontext gesetzt
+            EnhancedLogger.push_context("step")
+            barrier.wait()
+            EnhancedLogger.info(Category.API, name)
+            EnhancedLogger.pop_context()
+        EnhancedLogger.info(Category.API, name + " done")
+    
+    threads = [threading.Thread(target=worker, args=(f"t{i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    contexts = contexts_by_message(capture)
+    for i in range(4):
+        assert contexts[f"t{i}"] == (f"t{i}", "step")
+        assert contexts[f"t{i} done"] == ()
+    assert EnhancedLogger.get_context() == ()
+
+
+def test_context_is_isolated_between_asyncio_tasks(capture):
+    async def handler(name, started, proceed):
+        async with EnhancedLogger.context(name, trace_id=f"trace-{name}"):
+            started.set()
+            await proceed.wait()  # die andere Task läuft dazwischen
+            EnhancedLogger.info(Category.API, name)
+    
+    async def main():
+        EnhancedLogger.push_context("request")
+        events = [(asyncio.Event(), asyncio.Event()) for _ in range(2)]
+        tasks = [
+            asyncio.create_task(handler(f"task{i}", *pair))
+            for i, pair in enumerate(events)
+        ]
+        for started, _ in events:
+            await started.wait()
+        # Die Tasks haben ihren Kontext gesetzt, der Aufrufer sieht nichts davon
+        assert EnhancedLogger.get_context() == ("request",)
+        for _, proceed in reversed(events):
+            proceed.set()
+        await asyncio.gather(*tasks)
+        EnhancedLogger.info(Category.API, "parent")
+    
+    asyncio.run(main())
+    
+    entries = {entry.message: entry for entry in capture.entries}
+    assert entries["task0"].context == ("request", "task0")
+    assert entries["task1"].context == ("request", "task1")
+    assert entries["task0"].trace_id == "trace-task0"
+    assert entries["task1"].trace_id == "trace-task1"
+    assert entries["parent"].context == ("request",)
+    assert entries["parent"].trace_id is None
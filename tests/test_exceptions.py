@@ -0,0 +1,83 @@
+import pytest
+
+from logger.logger import EnhancedLogger, Category, _ExceptionFormatter
+
+
+def fail(message):
+    raise ValueError(message)
+
+
+def caught(function, *args):
+    try:
+        function(*args)
+    except Exception as exc:
+        return exc
+
+
+def chained(cause_message):
+    try:
+        fail(cause_message)
+    except ValueError as exc:
+        raise RuntimeError("wrapped") from exc
+
+
+@pytest.fixture
+def formatter():
+    return _ExceptionFormatter()
+
+
+def test_same_location_is_formatted_once(formatter):
+    texts = [formatter.format(caught(fail, "boom")) for _ in range(5)]
+    
+    assert formatter.misses == 1
+    assert formatter.hits == 4
+    assert len(set(texts)) == 1
+    assert texts[0].startswith("Traceback")
+    assert texts[0].endswith("ValueError: boom")
+
+
+def test_different_message_or_location_is_not_deduplicated(formatter):
+    formatter.format(caught(fail, "boom"))
+    formatter.format(caught(fail, "other"))
+    formatter.format(caught(lambda: fail("boom")))  # zusätzlicher Frame
+    
+    assert formatter.misses == 3
+    assert formatter.hits == 0
+
+
+def test_cause_chain_is_part_of_the_key(formatter):
+    first = formatter.format(caught(chained, "disk full"))
+    second = formatter.format(caught(chained, "timeout"))
+    
+    assert formatter.misses == 2
+    assert "disk full" in first and "timeout" in second
+
+
+def test_unkeyable_exception_is_formatted_uncached(formatter):
+    class Broken(Exception):
+        def __str__(self):
+            raise RuntimeError("no str")
+    
+    text = formatter.format(caught(lambda: (_ for _ in ()).throw(Broken())))
+    
+    assert "Broken" in text
+    assert formatter.misses == 1
+    assert formatter._cache == {}
+
+
+def test_cache_is_bounded(formatter):
+    formatter.cache_size = 2
+    for message in ("a", "b", "c"):
+        formatter.format(caught(fail, message))
+    
+    assert len(formatter._cache) <= 2
+
+
+def test_logged_exceptions_share_the_cached_traceback(capture):
+    for _ in range(3):
+        EnhancedLogger.error(Category.SYSTEM, "failed", exception=caught(fail, "boom"))
+    
+    messages = capture.messages
+    assert len(set(messages)) == 1
+    assert messages[0].startswith("failed\nTraceback")
+    assert messages[0].endswith("ValueError: boom")
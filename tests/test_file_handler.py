@@ -0,0 +1,51 @@
+import time
+
+from logger.logger import EnhancedLogger, Category, FileHandler, LogLevel
+
+
+def read_lines(path):
+    return path.read_bytes().decode('utf-8').splitlines()
+
+
+def test_flush_interval_is_enforced_without_further_writes(capture, tmp_path):
+    path = tmp_path / 'app.log'
+    handler = FileHandler(path, flush_lines=100, flush_interval_ms=50, flush_level=None)
+    EnhancedLogger.add_handler(handler)
+    
+    EnhancedLogger.info(Category.SYSTEM, "buffered")
+    assert read_lines(path) == []  # noch im Puffer
+    
+    deadline = time.monotonic() + 2.0
+    while not read_lines(path) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(read_lines(path)) == 1
+    assert read_lines(path)[0].endswith("buffered")
+    
+    handler.close()
+    assert handler._flusher is None
+
+
+def test_flush_level_flushes_immediately(capture, tmp_path):
+    path = tmp_path / 'app.log'
+    handler = FileHandler(path, flush_lines=100, flush_level=LogLevel.ERROR)
+    EnhancedLogger.add_handler(handler)
+    
+    EnhancedLogger.info(Category.SYSTEM, "info")
+    EnhancedLogger.error(Category.SYSTEM, "error")
+    assert len(read_lines(path)) == 2
+    handler.close()
+
+
+def test_prune_counts_legacy_numbered_backups(tmp_path):
+    path = tmp_path / 'app.log'
+    for name in ('app.log.1', 'app.log.2.gz', 'app.log.3', 'app.log.20240101-000000',
+                 'app.log.20240102-000000.gz', 'app.log.backup'):
+        (tmp_path / name).write_text('x')
+    handler = FileHandler(path, backup_count=3, compress=False)
+    
+    handler._prune_backups()
+    
+    remaining = sorted(p.name for p in tmp_path.iterdir() if p.name != 'app.log')
+    assert remaining == ['app.log.1', 'app.log.20240101-000000',
+                         'app.log.20240102-000000.gz', 'app.log.backup']
+    handler.close()
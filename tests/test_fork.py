@@ -0,0 +1,50 @@
+import os
+import socket
+import time
+
+import pytest
+
+from logger.logger import EnhancedLogger, Category, FileHandler, LogFormat, NetworkHandler
+
+
+def unused_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def unreachable_handler():
+    """NetworkHandler, dessen Endpunkt nicht erreichbar ist (lange Backoffs)"""
+    return NetworkHandler('127.0.0.1', unused_port(), 'tcp', formatter=LogFormat.JSON,
+                          reconnect_min_ms=3000, reconnect_max_ms=3000)
+
+
+def test_before_fork_flushes_files_but_not_network(capture, tmp_path, monkeypatch):
+    path = tmp_path / 'app.log'
+    EnhancedLogger.add_handler(FileHandler(path, flush_lines=100, flush_level=None))
+    network = unreachable_handler()
+    EnhancedLogger.add_handler(network)
+    network_flushes = []
+    monkeypatch.setattr(network, 'flush', lambda *a, **k: network_flushes.append(a))
+    
+    EnhancedLogger.info(Category.SYSTEM, "buffered")
+    EnhancedLogger._before_fork()
+    
+    assert path.read_text(encoding='utf-8').rstrip().endswith("buffered")
+    assert network_flushes == []
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason="os.fork() nicht verfügbar")
+def test_fork_does_not_block_on_unreachable_endpoint(capture):
+    EnhancedLogger.add_handler(unreachable_handler())
+    EnhancedLogger.info(Category.SYSTEM, "pending")
+    time.sleep(0.05)  # Sende-Thread hängt jetzt im Reconnect-Backoff
+    
+    start = time.monotonic()
+    pid = os.fork()
+    if pid == 0:
+        os._exit(0)
+    elapsed = time.monotonic() - start
+    os.waitpid(pid, 0)
+    
+    assert elapsed < 1.0
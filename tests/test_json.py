@@ -0,0 +1,85 @@
+import datetime
+import json
+import sys
+from types import MappingProxyType
+
+import pytest
+
+from logger.logger import LogEntry, LogLevel
+
+logger_module = sys.modules['logger.logger']
+
+
+@pytest.fixture
+def stdlib_json(monkeypatch):
+    """Erzwingt den Stdlib-Encoder (auch wenn orjson installiert ist)"""
+    monkeypatch.setattr(logger_module, 'orjson', None)
+
+
+def make_entry(**fields):
+    return LogEntry(0.0, LogLevel.INFO, 'API', "msg", **fields)
+
+
+def test_empty_metadata_round_trips_as_object(stdlib_json):
+    data = json.loads(make_entry().to_json())
+    assert data['metadata'] == {} and data['extra'] == {} and data['context'] == []
+
+
+def test_mapping_proxy_values_are_objects(stdlib_json):
+    entry = make_entry(metadata=MappingProxyType({'file': 'app.py'}),
+                       extra={'nested': MappingProxyType({'a': 1})})
+    data = json.loads(entry.to_json())
+    assert data['metadata'] == {'file': 'app.py'}
+    assert data['extra'] == {'nested': {'a': 1}}
+
+
+def test_fallback_keeps_mappings_as_objects(stdlib_json):
+    circular = {}
+    circular['self'] = circular
+    data = json.loads(make_entry(extra={'loop': circular}).to_json())
+    assert data['metadata'] == {}
+    assert isinstance(data['extra'], dict) and data['extra']['loop'].startswith("{'self'")
+
+
+PARITY_EXTRAS = [
+    {},
+    {'user': 'ü日本', 'ids': [1, 2.5, None, True], 'nested': {1: 'int key', None: 'x'}},
+    {'ratio': 0.1, 'large': 1e15, 'negative_zero': -0.0},
+    {'nan': float('nan'), 'inf': float('-inf')},
+    {'when': datetime.datetime(2024, 1, 2, 3, 4, 5, 6, tzinfo=datetime.timezone.utc),
+     'tags': {'a'}, 'raw': b'bytes', 'level': LogLevel.WARN},
+    {'big': 2 ** 70},
+    {'control': 'tab\t nul\x00 quote" backslash\\'},
+]
+
+
+def make_parity_entry(extra):
+    return LogEntry(
+        datetime.datetime(2024, 5, 6, 7, 8, 9, 123), LogLevel.ERROR, 'API', 'say "hi"',
+        metadata={'file': 'app.py', 'line': 3}, extra=extra,
+        context=('outer', 'inner'), trace_id='trace-1',
+    )
+
+
+@pytest.mark.parametrize('extra', PARITY_EXTRAS)
+def test_orjson_and_stdlib_produce_identical_bytes(extra, monkeypatch):
+    orjson = pytest.importorskip('orjson')
+    monkeypatch.setattr(logger_module, 'orjson', orjson)
+    entry = make_parity_entry(extra)
+    fast = entry.to_json()
+    
+    monkeypatch.setattr(logger_module, 'orjson', None)
+    assert entry.to_json() == fast
+
+
+def test_stdlib_layout_is_compact(stdlib_json):
+    text = make_parity_entry({'ids': [1, 2]}).to_json()
+    assert text.startswith('{"timestamp":"2024-05-06T07:08:09.000123","level":"ERROR",')
+    assert '"extra":{"ids":[1,2]},"context":["outer","inner"],"trace_id":"trace-1"' in text
+
+
+def test_non_finite_floats_become_null(stdlib_json):
+    extra = {'nan': float('nan'), 'nested': [float('inf')], 'ok': 1.5}
+    data = json.loads(make_parity_entry(extra).to_json())
+    assert data['extra'] == {'nan': None, 'nested': [None], 'ok': 1.5}
+    assert data['metadata'] == {'file': 'app.py', 'line': 3}
@@ -0,0 +1,92 @@
+import pytest
+
+from logger.logger import EnhancedLogger, Category, CategoryFilter, LogLevel, _interpolate
+
+
+class Counter:
+    """Callable-Nachricht, die ihre Aufrufe zählt"""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    def __call__(self, *args):
+        self.calls += 1
+        return f"built {args}"
+
+
+@pytest.mark.parametrize('template, args, expected', [
+    ("query {} took {:.2f}ms", ("SELECT 1", 1.5), "query SELECT 1 took 1.50ms"),
+    ("user %s has %d items", ("bob", 3), "user bob has 3 items"),
+    ("user %(name)s", ({'name': 'bob'},), "user bob"),
+    ("plain", (1, "two"), "plain 1 two"),
+])
+def test_interpolate_styles(template, args, expected):
+    assert _interpolate(template, args) == expected
+
+
+def test_interpolate_never_raises():
+    result = _interpolate("{} and {}", (1,))
+    assert result.startswith("{} and {} (1,) <format error: IndexError")
+
+
+def test_message_without_args_is_not_a_template(capture):
+    EnhancedLogger.info(Category.SYSTEM, "100% done {}")
+    assert capture.messages == ["100% done {}"]
+
+
+def test_args_interpolated_after_level_gate(capture):
+    EnhancedLogger.set_level(LogLevel.INFO)
+    message = Counter()
+    
+    EnhancedLogger.debug(Category.SYSTEM, message, 1)
+    EnhancedLogger.info(Category.SYSTEM, message, 2)
+    
+    assert message.calls == 1
+    assert capture.messages == ["built (2,)"]
+
+
+def test_args_not_interpolated_for_filtered_entries(capture):
+    EnhancedLogger.add_filter(CategoryFilter(exclude=[Category.DATABASE.value]))
+    message = Counter()
+    
+    EnhancedLogger.info(Category.DATABASE, message, "dropped")
+    
+    assert message.calls == 0
+    assert capture.entries == []
+
+
+def test_interpolated_once_across_handlers(capture):
+    second = []
+    EnhancedLogger.add_handler(type('H', (), {'handle': lambda self, e: second.append(e.message)})())
+    message = Counter()
+    
+    EnhancedLogger.info(Category.SYSTEM, message, "x")
+    
+    assert capture.messages == second == ["built ('x',)"]
+    assert message.calls == 1
+
+
+def test_legacy_positional_exception_and_percent(capture):
+    exc = ValueError("boom")
+    EnhancedLogger.error(Category.SYSTEM, "failed", exc)
+    EnhancedLogger.progress(Category.SYSTEM, "upload", 50)
+    EnhancedLogger.progress(Category.SYSTEM, "upload {}", "a.txt", percent=25)
+    
+    failed, upload, named = capture.entries
+    assert failed.exception is exc
+    assert failed.message.startswith("failed\n")
+    assert upload.message == "upload (50.0%)"
+    assert named.message == "upload a.txt (25.0%)"
+
+
+@pytest.mark.parametrize('message', ["100% failed", "state {'a': 1} failed", "user {} failed"])
+def test_legacy_exception_with_placeholder_characters(capture, message):
+    exc = ValueError("boom")
+    EnhancedLogger.error(Category.SYSTEM, message, exc)
+    EnhancedLogger.critical(Category.SYSTEM, message, exc)
+    
+    for entry in capture.entries:
+        assert entry.exception is exc
+        assert entry.message.startswith(message + "\n")
+        assert "format error" not in entry.message
+        assert "ValueError: boom" in entry.message
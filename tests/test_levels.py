@@ -0,0 +1,71 @@
+from logger.logger import EnhancedLogger, Category, CategoryFilter, LevelFilter, LogLevel
+
+
+def test_set_level_gates_calls(capture):
+    EnhancedLogger.set_level(LogLevel.WARN)
+    
+    EnhancedLogger.debug(Category.API, "debug")
+    EnhancedLogger.info(Category.API, "info")
+    EnhancedLogger.warn(Category.API, "warn")
+    EnhancedLogger.error(Category.API, "error")
+    
+    assert capture.messages == ["warn", "error"]
+    assert not EnhancedLogger.is_enabled_for(LogLevel.INFO)
+    assert EnhancedLogger.is_enabled_for(LogLevel.WARN)
+    
+    EnhancedLogger.set_level(LogLevel.DEBUG)
+    EnhancedLogger.debug(Category.API, "debug again")
+    assert capture.messages[-1] == "debug again"
+    assert EnhancedLogger.is_enabled_for(LogLevel.DEBUG)
+
+
+def test_level_filter_raises_the_gate(capture):
+    EnhancedLogger.add_filter(LevelFilter(LogLevel.ERROR))
+    
+    EnhancedLogger.warn(Category.API, "warn")
+    EnhancedLogger.error(Category.API, "error")
+    
+    assert capture.messages == ["error"]
+    assert not EnhancedLogger.is_enabled_for(LogLevel.WARN)
+    assert EnhancedLogger.is_enabled_for(LogLevel.ERROR)
+    
+    # set_level darf das Gate nicht unter einen zusätzlichen LevelFilter senken
+    EnhancedLogger.set_level(LogLevel.TRACE)
+    assert not EnhancedLogger.is_enabled_for(LogLevel.WARN)
+
+
+def test_lazy_args_are_not_rendered_below_the_gate(capture):
+    class Expensive:
+        rendered = 0
+        
+        def __str__(self):
+            Expensive.rendered += 1
+            return "expensive"
+    
+    EnhancedLogger.set_level(LogLevel.INFO)
+    EnhancedLogger.debug(Category.API, "value {}", Expensive())
+    EnhancedLogger.info(Category.API, "value {}", Expensive())
+    
+    assert capture.messages == ["value expensive"]
+    assert Expensive.rendered == 1
+
+
+def test_is_enabled_for_respects_category_filters(capture):
+    EnhancedLogger.add_filter(CategoryFilter(exclude=["DATABASE"]))
+    
+    assert EnhancedLogger.is_enabled_for(LogLevel.INFO, Category.API)
+    assert not EnhancedLogger.is_enabled_for(LogLevel.INFO, Category.DATABASE)
+    assert not EnhancedLogger.is_enabled_for(LogLevel.INFO, "DATABASE")
+    
+    EnhancedLogger.info(Category.DATABASE, "hidden")
+    EnhancedLogger.info(Category.API, "shown")
+    assert capture.messages == ["shown"]
+
+
+def test_disabled_logger_is_not_enabled_for_anything(capture, monkeypatch):
+    monkeypatch.setattr(EnhancedLogger, 'enabled', False)
+    
+    EnhancedLogger.error(Category.API, "dropped")
+    
+    assert capture.entries == []
+    assert not EnhancedLogger.is_enabled_for(LogLevel.FATAL)
@@ -0,0 +1,29 @@
+from logger.logger import LogEntry, LogLevel
+
+
+def make_entry(message, **fields):
+    return LogEntry(0.0, LogLevel.INFO, 'API', message, **fields)
+
+
+def test_plain_values_are_not_quoted():
+    line = make_entry("ok", metadata={'file': 'app.py', 'line': 42}).to_logfmt()
+    assert ' level=INFO category=API msg=ok file=app.py line=42' in line
+
+
+def test_values_are_quoted_and_escaped_when_needed():
+    line = make_entry('say "hi"\nnow', extra={'path': 'C:\\tmp', 'empty': ''}).to_logfmt()
+    assert 'msg="say \\"hi\\"\\nnow"' in line
+    assert 'path="C:\\\\tmp"' in line
+    assert 'empty=""' in line
+
+
+def test_nested_extra_is_flattened():
+    line = make_entry("x", extra={'http': {'method': 'POST', 'status': 201}}).to_logfmt()
+    assert line.endswith('http.method=POST http.status=201')
+
+
+def test_metadata_cache_keeps_values_apart():
+    first = make_entry("x", metadata={'file': 'a.py', 'line': 1}).to_logfmt()
+    second = make_entry("x", metadata={'file': 'a.py', 'line': 2}).to_logfmt()
+    assert first.endswith('file=a.py line=1')
+    assert second.endswith('file=a.py line=2')
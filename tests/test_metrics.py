@@ -0,0 +1,53 @@
+import time
+from dataclasses import dataclass, field
+
+from logger.logger import EnhancedLogger, Category
+
+
+@dataclass
+class RecordingHandler:
+    """Dataclass mit eq=True -> __hash__ ist None (nicht hashbar)"""
+    name: str = "recording"
+    messages: list = field(default_factory=list)
+    delay: float = 0.0
+    
+    def handle(self, entry):
+        if self.delay:
+            time.sleep(self.delay)
+        self.messages.append(entry.message)
+
+
+def test_unhashable_handler_is_supported(capture):
+    handler = RecordingHandler()
+    EnhancedLogger.add_handler(handler)
+    
+    EnhancedLogger.info(Category.SYSTEM, "one")
+    EnhancedLogger.info(Category.SYSTEM, "two")
+    
+    assert handler.messages == ["one", "two"]
+    stats = EnhancedLogger.get_metrics()['handlers']['recording']
+    assert stats['calls'] == 2 and stats['errors'] == 0
+    
+    EnhancedLogger.remove_handler(handler)
+    assert 'recording' not in EnhancedLogger.get_metrics()['handlers']
+
+
+def test_equal_handlers_get_separate_stats(capture):
+    first, second = RecordingHandler(), RecordingHandler()
+    assert first == second
+    EnhancedLogger.add_handler(first)
+    EnhancedLogger.add_handler(second)
+    
+    EnhancedLogger.info(Category.SYSTEM, "x")
+    
+    handlers = EnhancedLogger.get_metrics()['handlers']
+    assert handlers['recording']['calls'] == handlers['recording#2']['calls'] == 1
+
+
+def test_slow_unhashable_handler_is_reported(capture):
+    EnhancedLogger.set_slow_handler_threshold(1)
+    EnhancedLogger.add_handler(RecordingHandler(delay=0.005))
+    
+    EnhancedLogger.info(Category.SYSTEM, "slow")
+    
+    assert any("recording" in message for message in capture.messages[1:])
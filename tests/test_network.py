@@ -0,0 +1,207 @@
+import json
+import os
+import socket
+import threading
+import time
+
+import pytest
+
+from logger.logger import EnhancedLogger, Category, LogFormat, NetworkHandler
+
+
+class TcpSink:
+    """Minimaler TCP-Collector: sammelt alle empfangenen Bytes"""
+    
+    def __init__(self, port=0):
+        self.server = socket.socket()
+        self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server.bind(('127.0.0.1', port))
+        self.server.listen()
+        self.server.settimeout(0.1)
+        self.port = self.server.getsockname()[1]
+        self.data = b''
+        self.running = True
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+    
+    def _run(self):
+        while self.running:
+            try:
+                conn, _ = self.server.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            conn.settimeout(0.1)
+            while self.running:
+                try:
+                    chunk = conn.recv(65536)
+                except socket.timeout:
+                    continue
+                if not chunk:
+                    break
+                self.data += chunk
+            conn.close()
+    
+    def messages(self):
+        return [json.loads(line)['message'] for line in self.data.splitlines()]
+    
+    def stop(self):
+        self.running = False
+        self.server.close()
+        self.thread.join()
+
+
+def wait_for(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def sink():
+    sink = TcpSink()
+    yield sink
+    sink.stop()
+
+
+def make_handler(port, **options):
+    options.setdefault('reconnect_min_ms', 10)
+    options.setdefault('reconnect_max_ms', 50)
+    return NetworkHandler('127.0.0.1', port, 'tcp', formatter=LogFormat.JSON, **options)
+
+
+def test_sender_thread_survives_unexpected_error(capture, sink, monkeypatch):
+    handler = make_handler(sink.port)
+    EnhancedLogger.add_handler(handler)
+    
+    original = handler._send_frame
+    calls = []
+    
+    def failing_once(messages):
+        calls.append(len(messages))
+        if len(calls) == 1:
+            raise OSError(28, "No space left on device")
+        original(messages)
+    
+    monkeypatch.setattr(handler, '_send_frame', failing_once)
+    EnhancedLogger.info(Category.API, "lost")
+    EnhancedLogger.flush()
+    assert handler._worker.is_alive()
+    assert handler.failed_entries == 1
+    assert "No space left" in handler.last_error
+    
+    EnhancedLogger.info(Category.API, "delivered")
+    EnhancedLogger.flush()
+    assert wait_for(lambda: sink.messages() == ["delivered"])
+    handler.close()
+
+
+def test_dead_worker_is_restarted(capture, sink):
+    handler = make_handler(sink.port)
+    EnhancedLogger.add_handler(handler)
+    EnhancedLogger.info(Category.API, "first")
+    EnhancedLogger.flush()
+    
+    # Thread von außen beenden (wie nach einem Absturz)
+    handler._queue.put(handler._STOP)
+    handler._worker.join(timeout=2)
+    assert not handler._worker.is_alive()
+    
+    EnhancedLogger.info(Category.API, "second")
+    EnhancedLogger.flush()
+    assert wait_for(lambda: sink.messages() == ["first", "second"])
+    handler.close()
+
+
+def test_spool_replays_in_order_after_reconnect(capture, tmp_path):
+    sink = TcpSink()
+    port = sink.port
+    sink.stop()
+    
+    handler = make_handler(port, spool_path=tmp_path / 'spool.bin')
+    EnhancedLogger.add_handler(handler)
+    for i in range(5):
+        EnhancedLogger.info(Category.API, "down {}", i)
+        EnhancedLogger.flush()
+    assert handler.spooled_entries == 5
+    assert handler.failed_entries == 0
+    
+    sink = TcpSink(port)
+    try:
+        time.sleep(0.06)  # Backoff abwarten
+        EnhancedLogger.info(Category.API, "up")
+        EnhancedLogger.flush()
+        expected = [f"down {i}" for i in range(5)] + ["up"]
+        assert wait_for(lambda: sink.messages() == expected)
+        assert handler.replayed_entries == 5
+        assert not (tmp_path / 'spool.bin').exists()
+    finally:
+        handler.close()
+        sink.stop()
+
+
+def test_spool_rewrite_failure_does_not_duplicate(tmp_path, monkeypatch):
+    handler = make_handler(1, spool_path=tmp_path / 'spool.bin')
+    for i in range(3):
+        handler._spool(b'{"message": "m%d"}\n' % i, 1)
+    
+    sent = []
+    
+    def send_two(payload):
+        if len(sent) == 2:
+            return False
+        sent.append(payload)
+        return True
+    
+    monkeypatch.setattr(handler, '_send', send_two)
+    monkeypatch.setattr(os, 'replace', lambda *args: (_ for _ in ()).throw(OSError(13, "denied")))
+    assert handler._replay_spool() is False
+    assert "denied" in handler.last_error
+    
+    # Nächster Versuch: nur der ungesendete Rest
+    monkeypatch.setattr(handler, '_send', lambda payload: sent.append(payload) or True)
+    assert handler._replay_spool() is True
+    assert sent == [b'{"message": "m%d"}\n' % i for i in range(3)]
+    assert handler.replayed_entries == 3
+
+
+def receive_datagrams(sock, count, timeout=2.0):
+    sock.settimeout(timeout)
+    datagrams = []
+    try:
+        while len(datagrams) < count:
+            datagrams.append(sock.recv(65536))
+    except socket.timeout:
+        pass
+    return datagrams
+
+
+@pytest.mark.parametrize('pack, expected', [(False, 3), (True, 1)])
+def test_udp_sends_one_document_per_datagram_unless_packed(capture, pack, expected):
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(('127.0.0.1', 0))
+    handler = NetworkHandler(
+        '127.0.0.1', receiver.getsockname()[1], 'udp',
+        formatter=LogFormat.JSON, pack_datagrams=pack
+    )
+    EnhancedLogger.add_handler(handler)
+    for i in range(3):
+        EnhancedLogger.info(Category.API, "udp {}", i)
+    EnhancedLogger.flush()
+    
+    datagrams = receive_datagrams(receiver, 3, timeout=0.5)
+    handler.close()
+    receiver.close()
+    
+    assert len(datagrams) == expected
+    if not pack:
+        # Jedes Datagramm ist genau ein JSON-Dokument
+        assert [json.loads(d)['message'] for d in datagrams] == ["udp 0", "udp 1", "udp 2"]
+    else:
+        assert [json.loads(line)['message'] for line in datagrams[0].splitlines()] == [
+            "udp 0", "udp 1", "udp 2"
+        ]
@@ -0,0 +1,106 @@
+import time
+
+from logger.logger import EnhancedLogger, Category, LogEntry, LogLevel, RateLimitFilter
+
+
+def storm(count, message="Timeout bei {}", level=LogLevel.ERROR):
+    log = getattr(EnhancedLogger, level.name.lower())
+    for i in range(count):
+        log(Category.SYSTEM, message, f"host{i}")
+
+
+def test_duplicates_are_suppressed_and_summarized(capture):
+    EnhancedLogger.add_filter(RateLimitFilter(window=60))
+    
+    storm(100)
+    assert capture.messages == ["Timeout bei host0"]
+    
+    EnhancedLogger.flush()
+    first, summary = capture.entries
+    assert summary.message == "Timeout bei host0 (suppressed 99 duplicates)"
+    assert summary.level == first.level
+    assert summary.extra['suppressed'] == 99
+
+
+def test_burst_allows_several_entries_per_window(capture):
+    limiter = RateLimitFilter(window=60, burst=3)
+    EnhancedLogger.add_filter(limiter)
+    
+    storm(10)
+    
+    assert capture.messages == ["Timeout bei host0", "Timeout bei host1", "Timeout bei host2"]
+    assert limiter.suppressed_total == 7
+
+
+def test_different_call_sites_are_separate_keys(capture):
+    EnhancedLogger.add_filter(RateLimitFilter(window=60))
+    
+    for _ in range(3):
+        EnhancedLogger.error(Category.SYSTEM, "a")
+        EnhancedLogger.error(Category.SYSTEM, "a")
+    
+    assert capture.messages == ["a", "a"]
+
+
+def test_summary_emitted_when_window_closes(capture):
+    EnhancedLogger.add_filter(RateLimitFilter(window=0.05))
+    
+    storm(5)
+    time.sleep(0.06)
+    storm(1, message="Timeout bei {}!")  # anderer Schlüssel räumt das Fenster ab
+    
+    assert capture.messages == [
+        "Timeout bei host0",
+        "Timeout bei host0 (suppressed 4 duplicates)",
+        "Timeout bei host0!",
+    ]
+
+
+def test_table_is_bounded_and_evicted_keys_are_summarized(capture):
+    limiter = RateLimitFilter(window=60, max_keys=2)
+    EnhancedLogger.add_filter(limiter)
+    
+    storm(3, message="first {}")
+    storm(1, message="second {}")
+    storm(1, message="third {}")
+    
+    assert len(limiter._windows) == 2
+    assert "first host0 (suppressed 2 duplicates)" in capture.messages
+
+
+def test_levels_below_min_level_are_not_limited(capture):
+    EnhancedLogger.add_filter(RateLimitFilter(window=60, min_level=LogLevel.WARN))
+    
+    storm(3, level=LogLevel.INFO)
+    
+    assert len(capture.messages) == 3
+
+
+def test_shutdown_flushes_open_summaries(capture):
+    EnhancedLogger.add_filter(RateLimitFilter(window=60))
+    
+    storm(4)
+    EnhancedLogger.shutdown()
+    
+    assert capture.messages[-1] == "Timeout bei host0 (suppressed 3 duplicates)"
+
+
+def test_window_keeps_only_the_summary_text(capture):
+    limiter = RateLimitFilter(window=60)
+    EnhancedLogger.add_filter(limiter)
+    
+    for _ in range(3):
+        try:
+            raise ValueError("boom")
+        except ValueError as exc:
+            EnhancedLogger.error(Category.SYSTEM, "failed {}", "db", exception=exc,
+                                 payload=list(range(1000)))
+    
+    (state,) = limiter._windows.values()
+    assert state[3] == "failed db"
+    assert not any(isinstance(value, (LogEntry, BaseException, dict)) for value in state)
+    
+    EnhancedLogger.flush()
+    summary = capture.entries[-1]
+    assert summary.message == "failed db (suppressed 2 duplicates)"
+    assert summary.metadata['file'].endswith('test_rate_limit.py')
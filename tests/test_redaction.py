@@ -0,0 +1,101 @@
+import pytest
+
+from logger.logger import EnhancedLogger, Category, _Redactor
+
+
+@pytest.mark.parametrize('text, expected', [
+    ("login password=hunter2 ok", "login [REDACTED] ok"),
+    ("auth Bearer abc.def", "auth [REDACTED]"),
+    ("card 4111111111111111 used", "card [REDACTED] used"),
+    ("ssn 123-45-6789", "ssn [REDACTED]"),
+    ("API_KEY: xyz and token=t1", "[REDACTED] and [REDACTED]"),
+])
+def test_default_patterns(text, expected):
+    assert _Redactor().redact(text) == expected
+
+
+def test_prefilter_returns_clean_text_unchanged():
+    redactor = _Redactor()
+    text = "user 42 opened the dashboard"
+    assert redactor.redact(text) is text
+
+
+def test_custom_patterns_without_literals_always_scan():
+    redactor = _Redactor(patterns=[r'ID-\d+'])
+    assert redactor.redact("order ID-1234 shipped") == "order [REDACTED] shipped"
+
+
+def test_fields_redacted_by_key_name():
+    redactor = _Redactor()
+    fields = {
+        'user': 'alice',
+        'password': 'hunter2',
+        'accessToken': 'abc',
+        'x_api_key': 'k',
+        'http': {'authorization': 'Basic xyz', 'path': '/login'},
+        'note': 'sent Bearer abc',
+    }
+    
+    result = redactor.redact_fields(fields)
+    
+    assert result == {
+        'user': 'alice',
+        'password': '[REDACTED]',
+        'accessToken': '[REDACTED]',
+        'x_api_key': '[REDACTED]',
+        'http': {'authorization': '[REDACTED]', 'path': '/login'},
+        'note': 'sent [REDACTED]',
+    }
+    assert fields['password'] == 'hunter2'  # Original bleibt unverändert
+
+
+def test_clean_fields_are_not_copied():
+    fields = {'user': 'alice', 'status': 200, 'tokens_used': 3}
+    assert _Redactor().redact_fields(fields) is fields
+
+
+def test_logger_redacts_message_and_extra(capture):
+    EnhancedLogger.enable_redaction()
+    
+    EnhancedLogger.info(Category.SYSTEM, "login password=hunter2", api_key="k1", user="bob")
+    EnhancedLogger.info(Category.SYSTEM, "user {} password={}", "bob", "hunter2")
+    
+    first, second = capture.entries
+    assert first.message == "login [REDACTED]"
+    assert first.extra == {'api_key': '[REDACTED]', 'user': 'bob'}
+    assert second.message == "user bob [REDACTED]"
+
+
+def test_logger_redacts_exception_traceback(capture):
+    EnhancedLogger.enable_redaction()
+    try:
+        raise ValueError("token=abc123")
+    except ValueError as exc:
+        EnhancedLogger.error(Category.SYSTEM, "failed", exception=exc)
+    
+    message = capture.messages[0]
+    assert "abc123" not in message
+    assert message.startswith("failed\n")
+    assert message.count("Traceback") == 1
+
+
+def test_lazy_args_redacted_when_filter_reads_message_first(capture):
+    class Peek:
+        def filter(self, entry):
+            self.seen = entry.message
+            return True
+    
+    peek = Peek()
+    EnhancedLogger.enable_redaction()
+    EnhancedLogger.add_filter(peek)
+    
+    EnhancedLogger.info(Category.SYSTEM, "login password={}", "hunter2")
+    
+    assert peek.seen == "login [REDACTED]"
+    assert capture.messages == ["login [REDACTED]"]
+
+
+def test_empty_pattern_list_uses_defaults():
+    redactor = _Redactor(patterns=[])
+    assert redactor.redact("hello") == "hello"
+    assert redactor.redact("password=x") == "[REDACTED]"
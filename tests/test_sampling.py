@@ -0,0 +1,90 @@
+import time
+
+import pytest
+
+from logger.logger import EnhancedLogger, Category, LogEntry, LogLevel, SamplingFilter
+
+
+def entry(level=LogLevel.INFO, category='API', trace_id=None, correlation_id=None):
+    return LogEntry(time.time(), level, category, "msg",
+                    trace_id=trace_id, correlation_id=correlation_id)
+
+
+def kept_traces(sampler, count=2000):
+    return {i for i in range(count) if sampler.filter(entry(trace_id=f"trace-{i}"))}
+
+
+def test_trace_is_kept_or_dropped_as_a_whole():
+    sampler = SamplingFilter(rate=0.5)
+    for i in range(200):
+        decisions = {sampler.filter(entry(level=level, trace_id=f"t{i}"))
+                     for level in (LogLevel.DEBUG, LogLevel.INFO, LogLevel.WARN)}
+        assert len(decisions) == 1
+
+
+def test_correlation_id_is_used_without_trace_id():
+    sampler = SamplingFilter(rate=0.5)
+    for i in range(200):
+        by_trace = sampler.filter(entry(trace_id=f"id{i}"))
+        assert sampler.filter(entry(correlation_id=f"id{i}")) is by_trace
+
+
+def test_hash_sampling_is_stable_and_close_to_rate():
+    first = kept_traces(SamplingFilter(rate=0.25))
+    assert first == kept_traces(SamplingFilter(rate=0.25))
+    assert 400 <= len(first) <= 600
+
+
+def test_lower_rate_keeps_subset_of_traces():
+    assert kept_traces(SamplingFilter(rate=0.1)) <= kept_traces(SamplingFilter(rate=0.3))
+
+
+def test_errors_always_pass():
+    sampler = SamplingFilter(rate=0.0)
+    assert not sampler.filter(entry(LogLevel.WARN))
+    assert sampler.filter(entry(LogLevel.ERROR))
+    assert sampler.filter(entry(LogLevel.CRITICAL))
+
+
+def test_category_rate_overrides_level_rate():
+    sampler = SamplingFilter(
+        rate=0.0,
+        level_rates={LogLevel.DEBUG: 1.0},
+        category_rates={Category.DATABASE: 0.0, 'AUDIT_TRAIL': 1.0},
+    )
+    assert sampler.filter(entry(LogLevel.DEBUG, 'API'))
+    assert not sampler.filter(entry(LogLevel.DEBUG, Category.DATABASE.value))
+    assert sampler.filter(entry(LogLevel.INFO, 'AUDIT_TRAIL'))
+    assert not sampler.filter(entry(LogLevel.INFO, 'API'))
+
+
+def test_adaptive_scale_follows_budget(monkeypatch):
+    monkeypatch.setattr(EnhancedLogger, 'collect_metrics', False)
+    sampler = SamplingFilter(max_per_second=100)
+    
+    def window(kept):
+        sampler._kept = kept
+        sampler._adjust(sampler._adjusted_at + 1.0)
+        return sampler.scale
+    
+    assert window(1000) == pytest.approx(0.1)  # Last 10x über Budget
+    assert window(100) == pytest.approx(0.1)   # Budget eingehalten -> stabil
+    assert window(10) == pytest.approx(1.0)    # Last abgeklungen
+    assert window(0) == 1.0
+
+
+def test_adaptive_scale_has_lower_bound(monkeypatch):
+    monkeypatch.setattr(EnhancedLogger, 'collect_metrics', False)
+    sampler = SamplingFilter(max_per_second=1, min_scale=0.01)
+    sampler._kept = 1_000_000
+    sampler._adjust(sampler._adjusted_at + 1.0)
+    assert sampler.scale == 0.01
+
+
+def test_logger_applies_sampling(capture):
+    EnhancedLogger.add_filter(SamplingFilter(rate=0.0))
+    
+    EnhancedLogger.info(Category.SYSTEM, "dropped")
+    EnhancedLogger.error(Category.SYSTEM, "kept")
+    
+    assert capture.messages == ["kept"]
@@ -0,0 +1,105 @@
+import os
+import re
+import socket
+
+import pytest
+
+from logger.logger import EnhancedLogger, Category, SyslogHandler
+
+from test_network import TcpSink, receive_datagrams, wait_for
+
+
+HEADER = re.compile(
+    rb'<(?P<pri>\d+)>1 '
+    rb'\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\.\d{6}(?:Z|[+-]\d\d:\d\d) '
+    rb'(?P<host>\S+) (?P<app>\S+) (?P<procid>\S+) (?P<msgid>\S+) - '
+    rb'(?P<msg>.*)\Z',
+    re.DOTALL
+)
+
+
+@pytest.fixture
+def receiver():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(('127.0.0.1', 0))
+    yield sock
+    sock.close()
+
+
+@pytest.fixture
+def sink():
+    sink = TcpSink()
+    yield sink
+    sink.stop()
+
+
+def make_handler(port, protocol, **options):
+    options.setdefault('facility', 'local0')
+    options.setdefault('hostname', 'web-1')
+    options.setdefault('app_name', 'my app')
+    return SyslogHandler('127.0.0.1', port, protocol, **options)
+
+
+def parse_octet_counted(data):
+    """Zerlegt einen RFC-6587-Stream (`LEN SP MSG`) in Nachrichten"""
+    messages = []
+    while data:
+        length, _, rest = data.partition(b' ')
+        size = int(length)
+        messages.append(rest[:size])
+        data = rest[size:]
+    return messages
+
+
+def test_rfc5424_header(capture, receiver):
+    handler = make_handler(receiver.getsockname()[1], 'udp')
+    EnhancedLogger.add_handler(handler)
+    EnhancedLogger.info(Category.API, "hello")
+    EnhancedLogger.error(Category.DATABASE, "broken")
+    EnhancedLogger.flush()
+    
+    datagrams = receive_datagrams(receiver, 2)
+    handler.close()
+    
+    info, error = (HEADER.match(datagram) for datagram in datagrams)
+    assert info.group('pri') == b'134'    # local0 (16) * 8 + informational (6)
+    assert error.group('pri') == b'131'   # local0 (16) * 8 + error (3)
+    assert info.group('host') == b'web-1'
+    assert info.group('app') == b'myapp'  # Leerzeichen sind im Header nicht erlaubt
+    assert info.group('procid') == str(os.getpid()).encode()
+    assert info.group('msgid') == b'API'
+    assert error.group('msgid') == b'DATABASE'
+    assert info.group('msg') == b'hello'
+    assert error.group('msg') == b'broken'
+
+
+def test_udp_sends_one_message_per_datagram(capture, receiver):
+    handler = make_handler(receiver.getsockname()[1], 'udp', pack_datagrams=True)
+    EnhancedLogger.add_handler(handler)
+    for i in range(3):
+        EnhancedLogger.info(Category.API, "udp {}", i)
+    EnhancedLogger.flush()
+    
+    datagrams = receive_datagrams(receiver, 4, timeout=0.5)
+    handler.close()
+    
+    assert [HEADER.match(d).group('msg') for d in datagrams] == [b'udp 0', b'udp 1', b'udp 2']
+
+
+def test_tcp_uses_octet_counting(capture, sink):
+    handler = make_handler(sink.port, 'tcp')
+    EnhancedLogger.add_handler(handler)
+    EnhancedLogger.info(Category.API, "first")
+    EnhancedLogger.warn(Category.API, "multi\nline ünicode")
+    EnhancedLogger.info(Category.API, "last")
+    EnhancedLogger.flush()
+    
+    assert wait_for(lambda: len(parse_octet_counted(sink.data)) == 3)
+    handler.close()
+    
+    # Längenpräfix zählt Bytes (UTF-8), nicht Zeichen; kein Trennzeichen dazwischen
+    messages = [HEADER.match(m) for m in parse_octet_counted(sink.data)]
+    assert [m.group('msg') for m in messages] == [
+        b'first', 'multi\nline ünicode'.encode('utf-8'), b'last'
+    ]
+    assert messages[1].group('pri') == b'132'  # local0 (16) * 8 + warning (4)